@@ -1,4 +1,12 @@
-from .vector import Vector2, Vector3, look_towards, rotate, degrees_to_radians, radians_to_degrees
+from .vector import Vector2, Vector3, VectorPool, look_towards, look_towards_many, rotate, rotate_many, TrigTable, \
+    degrees_to_radians, radians_to_degrees
+from .vector_array import Vector2Array, Vector3Array
+from .spatial import HashGrid, KDTree
 from .matrix import Matrix
+from .fixed_matrix import Matrix3, Matrix4
+from .linalg import LUFactorization, IncrementalInverse
+from .sparse import COOMatrix, CSRMatrix
+from .lazy import LazyMatrix, lazy
+from .transform import Transform
 from .color import *
 from . import queue
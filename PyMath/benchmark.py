@@ -0,0 +1,379 @@
+"""Micro-benchmark suite for PyMath
+
+Times every public hot path (Vector construction and arithmetic,
+Matrix products and inverse, Queue push/pull and Color construction)
+at several sizes using only the standard library.
+
+Usage:
+    python -m PyMath.benchmark                          # quick profile, table output
+    python -m PyMath.benchmark --profile full -o run.json
+    python -m PyMath.benchmark --baseline base.json --threshold 0.1
+    python -m PyMath.benchmark --baseline base.json --case-threshold matrix.matmul=0.25
+
+With --baseline, every case slower than baseline * (1 + threshold) is
+reported as a regression and the exit status is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from random import Random
+from timeit import Timer
+from typing import Callable, Dict, List, Optional
+
+PROFILES = ("quick", "full")
+
+_BENCHMARKS: Dict[str, tuple] = {}  # name -> (factory, {profile: sizes})
+
+
+def benchmark(name: str, quick: List[int], full: List[int]) -> Callable:
+    """Register a benchmark case
+
+    The decorated factory receives a size and returns the zero argument
+    callable to time. Setup work belongs in the factory so it is not
+    part of the measurement.
+
+    Args:
+        name (str): Dotted case name i.e. 'matrix.matmul'
+        quick (list): Sizes used by the quick profile
+        full (list): Sizes used by the full profile
+    """
+
+    def register(factory: Callable[[int], Callable[[], None]]) -> Callable:
+        _BENCHMARKS[name] = (factory, {"quick": quick, "full": full})
+        return factory
+    return register
+
+
+def _random_values(count: int, seed: int = 0) -> List[float]:
+    rng = Random(seed)
+    return [rng.uniform(-5, 5) for _ in range(count)]
+
+
+def _vector(size: int, values: List[float]):
+    from PyMath.vector import Vector, Vector2, Vector3
+
+    if size == 2:
+        return Vector2(*values[:2])
+    if size == 3:
+        return Vector3(*values[:3])
+    return Vector(*values[:size])
+
+
+def _matrix(size: int, seed: int = 0):
+    from PyMath.matrix import Matrix
+
+    values = _random_values(size * size, seed)
+    rows = [values[i * size:(i + 1) * size] for i in range(size)]
+    for i in range(size):
+        rows[i][i] += 10 * size  # Diagonally dominant so inverse is well defined
+    return Matrix.matrix_from_list(rows)
+
+
+@benchmark("vector.construct", quick=[2, 3, 16], full=[2, 3, 16, 128])
+def _vector_construct(size):
+    values = _random_values(size)
+    return lambda: _vector(size, values)
+
+
+@benchmark("vector.add", quick=[2, 3, 16], full=[2, 3, 16, 128])
+def _vector_add(size):
+    a, b = _vector(size, _random_values(size, 1)), _vector(size, _random_values(size, 2))
+    return lambda: a + b
+
+
+@benchmark("vector.mul_scalar", quick=[2, 3, 16], full=[2, 3, 16, 128])
+def _vector_mul(size):
+    a = _vector(size, _random_values(size))
+    return lambda: a * 1.5
+
+
+@benchmark("vector.dot", quick=[2, 3, 16], full=[2, 3, 16, 128])
+def _vector_dot(size):
+    a, b = _vector(size, _random_values(size, 1)), _vector(size, _random_values(size, 2))
+    return lambda: a.dot(b)
+
+
+@benchmark("vector.mag", quick=[2, 3, 16], full=[2, 3, 16, 128])
+def _vector_mag(size):
+    a = _vector(size, _random_values(size))
+    return a.mag
+
+
+@benchmark("vector.normalized", quick=[2, 3, 16], full=[2, 3, 16, 128])
+def _vector_normalized(size):
+    a = _vector(size, _random_values(size))
+    return a.normalized
+
+
+@benchmark("matrix.construct", quick=[4, 16, 64], full=[4, 16, 64, 128, 256, 512])
+def _matrix_construct(size):
+    from PyMath.matrix import Matrix
+
+    return lambda: Matrix((size, size))
+
+
+@benchmark("matrix.add", quick=[4, 16, 64], full=[4, 16, 64, 128, 256, 512])
+def _matrix_add(size):
+    a, b = _matrix(size, 1), _matrix(size, 2)
+    return lambda: a + b
+
+
+@benchmark("matrix.matmul", quick=[4, 16, 64], full=[4, 16, 64, 128, 256, 512])
+def _matrix_matmul(size):
+    a, b = _matrix(size, 1), _matrix(size, 2)
+    return lambda: a @ b
+
+
+@benchmark("matrix.inverse", quick=[4, 16, 64], full=[4, 16, 64, 128, 256, 512])
+def _matrix_inverse(size):
+    a = _matrix(size)
+    return a.inverse
+
+
+@benchmark("matrix4.matmul", quick=[1], full=[1])
+def _matrix4_matmul(size):
+    from PyMath.fixed_matrix import Matrix4
+    from PyMath.vector import Vector3
+
+    a = Matrix4.trs(Vector3(1, 2, 3), Vector3(0.1, 0.2, 0.3), Vector3(2, 2, 2))
+    b = Matrix4.perspective(1.2, 1.5, 0.1, 100)
+    return lambda: a @ b
+
+
+@benchmark("matrix4.inverse", quick=[1], full=[1])
+def _matrix4_inverse(size):
+    from PyMath.fixed_matrix import Matrix4
+
+    return Matrix4(_random_values(16)).inverse
+
+
+@benchmark("sparse.matvec", quick=[1000, 100000], full=[1000, 100000, 1000000])
+def _sparse_matvec(size):
+    from PyMath.sparse import COOMatrix
+
+    coo = COOMatrix((size, size))
+    for i in range(size):
+        coo.append(i, i, 4.0)
+        coo.append(i, (i + 1) % size, -1.0)
+        coo.append(i, (i - 1) % size, -1.0)
+    a, x = coo.tocsr(), _random_values(size)
+    return lambda: a @ x
+
+
+@benchmark("queue.push_pull", quick=[1000, 10000], full=[1000, 10000, 100000, 1000000])
+def _queue_push_pull(size):
+    from PyMath.queue import Queue
+
+    items = list(range(size))
+
+    def run():
+        queue = Queue()
+        for item in items:
+            queue.push(item)
+        for _ in items:
+            queue.pull()
+    return run
+
+
+@benchmark("queue.batch_push_pull", quick=[1000, 10000], full=[1000, 10000, 100000, 1000000])
+def _queue_batch_push_pull(size):
+    from PyMath.queue import Queue
+
+    items = list(range(size))
+
+    def run():
+        queue = Queue()
+        queue.push_many(items)
+        while queue.pull_many(256, timeout=0):
+            pass
+    return run
+
+
+@benchmark("queue.priority_push_pull", quick=[1000, 10000], full=[1000, 10000, 100000])
+def _priority_queue_push_pull(size):
+    from PyMath.queue import PriorityQueue
+
+    items = _random_values(size)
+
+    def run():
+        queue = PriorityQueue()
+        for item in items:
+            queue.push(item)
+        for _ in items:
+            queue.pull()
+    return run
+
+
+@benchmark("color.construct", quick=[1], full=[1])
+def _color_construct(size):
+    from PyMath.color import Color
+
+    return lambda: Color(12, 34, 56, 78)
+
+
+def measure(func: Callable[[], None], repeat: int = 5, min_time: float = 0.2) -> dict:
+    """Time func and return its timing statistics
+
+    The number of calls per run is picked so one run takes at least
+    min_time seconds. The best run is the headline number because it
+    is the least disturbed by the rest of the system.
+
+    Returns:
+        dict: best, mean and worst seconds per call plus number and repeat
+    """
+
+    timer = Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1 << 30:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    runs = [elapsed] + timer.repeat(repeat=max(repeat - 1, 0), number=number)
+    per_call = [run / number for run in runs]
+    return {"best": min(per_call), "mean": sum(per_call) / len(per_call), "worst": max(per_call),
+            "number": number, "repeat": len(runs)}
+
+
+def run(profile: str = "quick", name_filter: Optional[str] = None, repeat: int = 5,
+        min_time: float = 0.2, progress: Optional[Callable[[str], None]] = None) -> dict:
+    """Run every registered case for profile
+
+    Args:
+        profile (str): 'quick' or 'full'
+        name_filter (str): Only run cases whose id contains this text
+        repeat (int): Timed runs per case
+        min_time (float): Shortest duration of one run in seconds
+        progress (callable): Called with each case id before it runs
+
+    Returns:
+        dict: JSON serializable report with machine info and results
+    """
+
+    if profile not in PROFILES:
+        raise ValueError(f"profile should be one of {PROFILES}. Found '{profile}' instead.")
+
+    results = {}
+    for name, (factory, sizes) in _BENCHMARKS.items():
+        for size in sizes[profile]:
+            case = f"{name}[{size}]"
+            if name_filter and name_filter not in case:
+                continue
+            if progress:
+                progress(case)
+            try:
+                results[case] = measure(factory(size), repeat, min_time)
+            except Exception as e:
+                results[case] = {"error": f"{type(e).__name__}: {e}"}
+
+    return {"profile": profile, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "results": results}
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.1,
+            case_thresholds: Optional[Dict[str, float]] = None) -> List[dict]:
+    """Compare report against baseline
+
+    A case regresses when its best time exceeds the baseline best time
+    by more than its threshold (0.1 is 10% slower). case_thresholds
+    maps a case id or a case name prefix to its own threshold; the
+    longest matching key wins.
+
+    Returns:
+        list: One entry per case found in both reports
+    """
+
+    case_thresholds = case_thresholds or {}
+    rows = []
+    for case, result in report["results"].items():
+        base = baseline.get("results", {}).get(case)
+        if base is None or "best" not in base or "best" not in result:
+            continue
+
+        matches = [key for key in case_thresholds if case.startswith(key)]
+        limit = case_thresholds[max(matches, key=len)] if matches else threshold
+        ratio = result["best"] / base["best"] if base["best"] else float("inf")
+        rows.append({"case": case, "baseline": base["best"], "current": result["best"],
+                     "ratio": ratio, "threshold": limit, "regressed": ratio > 1 + limit})
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def _print_table(report: dict, comparison: List[dict], out=sys.stdout) -> None:
+    compared = {row["case"]: row for row in comparison}
+    for case, result in report["results"].items():
+        if "error" in result:
+            print(f"{case:<32} ERROR {result['error']}", file=out)
+            continue
+
+        line = f"{case:<32} {_format_seconds(result['best']):>12}"
+        row = compared.get(case)
+        if row:
+            flag = "REGRESSED" if row["regressed"] else ""
+            line += f"   x{row['ratio']:.2f} vs baseline {flag}"
+        print(line, file=out)
+
+
+def _parse_case_thresholds(values: List[str]) -> Dict[str, float]:
+    thresholds = {}
+    for value in values:
+        case, _, limit = value.partition("=")
+        if not limit:
+            raise argparse.ArgumentTypeError(f"Expected CASE=THRESHOLD. Found '{value}' instead.")
+        thresholds[case] = float(limit)
+    return thresholds
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m PyMath.benchmark", description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=PROFILES, default="quick", help="Size profile to run")
+    parser.add_argument("--filter", dest="name_filter", help="Only run cases whose id contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Shortest duration of one run in seconds")
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of a table")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Allowed slowdown before a case counts as regressed, 0.1 is 10%%")
+    parser.add_argument("--case-threshold", action="append", default=[], metavar="CASE=THRESHOLD",
+                        help="Per case (or case name prefix) threshold, may be repeated")
+    args = parser.parse_args(argv)
+
+    report = run(args.profile, args.name_filter, args.repeat, args.min_time,
+                 progress=None if args.json else lambda case: print(f"running {case}", file=sys.stderr))
+
+    comparison = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        comparison = compare(report, baseline, args.threshold, _parse_case_thresholds(args.case_threshold))
+        report["comparison"] = comparison
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        _print_table(report, comparison)
+
+    return 1 if any(row["regressed"] for row in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
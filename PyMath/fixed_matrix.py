@@ -0,0 +1,399 @@
+"""Fixed size 'Matrix3' and 'Matrix4' transform matrices
+
+Both are regular 'Matrix' subclasses (so every generic operation still
+works) with the hot transform paths unrolled: products, transpose,
+determinant, inverse and point transformation never loop.
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import sin, cos, tan
+from typing import Iterable, List, Union
+
+from PyMath.matrix import Matrix
+from PyMath.vector import Vector2, Vector3
+from PyMath.vector_array import Vector3Array
+
+_IDENTITY3 = array("d", (1, 0, 0, 0, 1, 0, 0, 0, 1))
+_IDENTITY4 = array("d", (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1))
+
+
+class Matrix3(Matrix):
+    """'Matrix3', subclass of 'Type[Matrix]':
+
+    3x3 Matrix for 2D affine transforms and 3D linear transforms.
+    Matrix3() is the identity, Matrix3(*9 values) or Matrix3(iterable of 9)
+    fills it row-major.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values: Union[float, Iterable[float]]):
+        if len(values) == 1:
+            values = tuple(values[0])
+        if not values:
+            storage = array("d", _IDENTITY3)
+        elif len(values) == 9:
+            storage = array("d", values)
+        else:
+            raise Matrix.Exceptions.MatrixSizeError(Matrix((3, 3)), Matrix((1, len(values))))
+        self._Matrix__size = self._Matrix__rows, self._Matrix__columns = (3, 3)
+        self._components = storage
+
+    @classmethod
+    def _from_values(cls, *values: float) -> Matrix3:
+        return cls._from_buffer((3, 3), array("d", values))
+
+    @classmethod
+    def translation(cls, x: Union[float, Vector2], y: float = None) -> Matrix3:
+        """Return a 2D translation by (x, y) or by a Vector2"""
+
+        if y is None:
+            x, y = x[0], x[1]
+        return cls._from_values(1, 0, x, 0, 1, y, 0, 0, 1)
+
+    @classmethod
+    def rotation(cls, angle: float) -> Matrix3:
+        """Return a 2D rotation by angle radians around the zed component"""
+
+        c, s = cos(angle), sin(angle)
+        return cls._from_values(c, -s, 0, s, c, 0, 0, 0, 1)
+
+    @classmethod
+    def scale(cls, x: Union[float, Vector2], y: float = None) -> Matrix3:
+        """Return a 2D scale by (x, y) or by a Vector2"""
+
+        if y is None:
+            x, y = x[0], x[1]
+        return cls._from_values(x, 0, 0, 0, y, 0, 0, 0, 1)
+
+    @classmethod
+    def trs(cls, position: Vector2, angle: float, scale: Vector2) -> Matrix3:
+        """Return translation @ rotation @ scale built directly"""
+
+        c, s = cos(angle), sin(angle)
+        sx, sy = scale[0], scale[1]
+        return cls._from_values(c * sx, -s * sy, position[0], s * sx, c * sy, position[1], 0, 0, 1)
+
+    def transposed(self) -> Matrix3:
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._components
+        return self._from_values(a00, a10, a20, a01, a11, a21, a02, a12, a22)
+
+    def determinant(self) -> float:
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._components
+        return a00 * (a11 * a22 - a12 * a21) - a01 * (a10 * a22 - a12 * a20) + a02 * (a10 * a21 - a11 * a20)
+
+    def inverse(self) -> Matrix3:
+        """Return the inverse through the unrolled adjugate
+
+        Raises:
+            MatrixSingularError: If the determinant is 0
+        """
+
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._components
+        c00, c01, c02 = a11 * a22 - a12 * a21, a12 * a20 - a10 * a22, a10 * a21 - a11 * a20
+        det = a00 * c00 + a01 * c01 + a02 * c02
+        if not det:
+            raise Matrix.Exceptions.MatrixSingularError()
+
+        inv = 1.0 / det
+        return self._from_values(c00 * inv, (a02 * a21 - a01 * a22) * inv, (a01 * a12 - a02 * a11) * inv,
+                                 c01 * inv, (a00 * a22 - a02 * a20) * inv, (a02 * a10 - a00 * a12) * inv,
+                                 c02 * inv, (a01 * a20 - a00 * a21) * inv, (a00 * a11 - a01 * a10) * inv)
+
+    def affine_inverse(self) -> Matrix3:
+        """Return the inverse of a 2D affine transform (last row 0, 0, 1)
+
+        Only the 2x2 linear part is inverted; the translation is rotated
+        back through it.
+
+        Raises:
+            MatrixSingularError: If the linear part is singular
+        """
+
+        a00, a01, tx, a10, a11, ty = self._components[:6]
+        det = a00 * a11 - a01 * a10
+        if not det:
+            raise Matrix.Exceptions.MatrixSingularError()
+
+        inv = 1.0 / det
+        b00, b01, b10, b11 = a11 * inv, -a01 * inv, -a10 * inv, a00 * inv
+        return self._from_values(b00, b01, -(b00 * tx + b01 * ty),
+                                 b10, b11, -(b10 * tx + b11 * ty),
+                                 0, 0, 1)
+
+    def transform_point(self, point: Vector2) -> Vector2:
+        """Return point transformed as (x, y, 1), divided by the resulting w"""
+
+        a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._components
+        x, y = point.x, point.y
+        w = a20 * x + a21 * y + a22
+        if w == 1.0:
+            return Vector2._new(a00 * x + a01 * y + a02, a10 * x + a11 * y + a12)
+        return Vector2._new((a00 * x + a01 * y + a02) / w, (a10 * x + a11 * y + a12) / w)
+
+    def __matmul__(self, other: Union[Matrix, Vector2, Vector3]) -> Union[Matrix, Vector2, Vector3]:
+        """Unrolled Matrix3 @ Matrix3, Matrix3 @ Vector2 (point) and Matrix3 @ Vector3"""
+
+        if isinstance(other, Matrix3):
+            a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._components
+            b00, b01, b02, b10, b11, b12, b20, b21, b22 = other._components
+            return self._from_values(
+                a00 * b00 + a01 * b10 + a02 * b20, a00 * b01 + a01 * b11 + a02 * b21, a00 * b02 + a01 * b12 + a02 * b22,
+                a10 * b00 + a11 * b10 + a12 * b20, a10 * b01 + a11 * b11 + a12 * b21, a10 * b02 + a11 * b12 + a12 * b22,
+                a20 * b00 + a21 * b10 + a22 * b20, a20 * b01 + a21 * b11 + a22 * b21, a20 * b02 + a21 * b12 + a22 * b22)
+        elif isinstance(other, Vector2):
+            return self.transform_point(other)
+        elif isinstance(other, Vector3):
+            a00, a01, a02, a10, a11, a12, a20, a21, a22 = self._components
+            x, y, z = other.x, other.y, other.z
+            return Vector3._new(a00 * x + a01 * y + a02 * z, a10 * x + a11 * y + a12 * z, a20 * x + a21 * y + a22 * z)
+        return super(Matrix3, self).__matmul__(other)
+
+
+class Matrix4(Matrix):
+    """'Matrix4', subclass of 'Type[Matrix]':
+
+    4x4 Matrix for 3D affine and projective transforms.
+    Matrix4() is the identity, Matrix4(*16 values) or Matrix4(iterable of 16)
+    fills it row-major.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values: Union[float, Iterable[float]]):
+        if len(values) == 1:
+            values = tuple(values[0])
+        if not values:
+            storage = array("d", _IDENTITY4)
+        elif len(values) == 16:
+            storage = array("d", values)
+        else:
+            raise Matrix.Exceptions.MatrixSizeError(Matrix((4, 4)), Matrix((1, len(values))))
+        self._Matrix__size = self._Matrix__rows, self._Matrix__columns = (4, 4)
+        self._components = storage
+
+    @classmethod
+    def _from_values(cls, *values: float) -> Matrix4:
+        return cls._from_buffer((4, 4), array("d", values))
+
+    @classmethod
+    def translation(cls, x: Union[float, Vector3], y: float = None, z: float = None) -> Matrix4:
+        """Return a translation by (x, y, z) or by a Vector3"""
+
+        if y is None:
+            x, y, z = x[0], x[1], x[2]
+        return cls._from_values(1, 0, 0, x, 0, 1, 0, y, 0, 0, 1, z, 0, 0, 0, 1)
+
+    @classmethod
+    def rotation_x(cls, angle: float) -> Matrix4:
+        c, s = cos(angle), sin(angle)
+        return cls._from_values(1, 0, 0, 0, 0, c, -s, 0, 0, s, c, 0, 0, 0, 0, 1)
+
+    @classmethod
+    def rotation_y(cls, angle: float) -> Matrix4:
+        c, s = cos(angle), sin(angle)
+        return cls._from_values(c, 0, s, 0, 0, 1, 0, 0, -s, 0, c, 0, 0, 0, 0, 1)
+
+    @classmethod
+    def rotation_z(cls, angle: float) -> Matrix4:
+        c, s = cos(angle), sin(angle)
+        return cls._from_values(c, -s, 0, 0, s, c, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+
+    @classmethod
+    def rotation(cls, euler: Vector3) -> Matrix4:
+        """Return rotation_z @ rotation_y @ rotation_x for euler angles in radians"""
+
+        return cls.trs(Vector3.ZERO, euler, Vector3.ONE)
+
+    @classmethod
+    def scale(cls, x: Union[float, Vector3], y: float = None, z: float = None) -> Matrix4:
+        """Return a scale by (x, y, z) or by a Vector3"""
+
+        if y is None:
+            x, y, z = x[0], x[1], x[2]
+        return cls._from_values(x, 0, 0, 0, 0, y, 0, 0, 0, 0, z, 0, 0, 0, 0, 1)
+
+    @classmethod
+    def trs(cls, position: Vector3, rotation: Vector3, scale: Vector3) -> Matrix4:
+        """Return translation @ rotation(z @ y @ x) @ scale built directly, without any products"""
+
+        sx, sy, sz = scale
+        rx, ry, rz = rotation
+        cx, snx = cos(rx), sin(rx)
+        cy, sny = cos(ry), sin(ry)
+        cz, snz = cos(rz), sin(rz)
+
+        r00, r01, r02 = cz * cy, cz * sny * snx - snz * cx, cz * sny * cx + snz * snx
+        r10, r11, r12 = snz * cy, snz * sny * snx + cz * cx, snz * sny * cx - cz * snx
+        r20, r21, r22 = -sny, cy * snx, cy * cx
+
+        px, py, pz = position
+        return cls._from_values(r00 * sx, r01 * sy, r02 * sz, px,
+                                r10 * sx, r11 * sy, r12 * sz, py,
+                                r20 * sx, r21 * sy, r22 * sz, pz,
+                                0, 0, 0, 1)
+
+    @classmethod
+    def perspective(cls, fov_y: float, aspect: float, near: float, far: float) -> Matrix4:
+        """Return a right handed perspective projection looking down -z
+
+        Args:
+            fov_y (float): Vertical field of view in radians
+            aspect (float): Viewport width / height
+            near (float): Distance to the near clipping plane
+            far (float): Distance to the far clipping plane
+        """
+
+        f = 1.0 / tan(fov_y / 2)
+        depth = 1.0 / (near - far)
+        return cls._from_values(f / aspect, 0, 0, 0,
+                                0, f, 0, 0,
+                                0, 0, (far + near) * depth, 2 * far * near * depth,
+                                0, 0, -1, 0)
+
+    @classmethod
+    def orthographic(cls, left: float, right: float, bottom: float, top: float,
+                     near: float, far: float) -> Matrix4:
+        """Return an orthographic projection of the given view box to clip space"""
+
+        w, h, d = 1.0 / (right - left), 1.0 / (top - bottom), 1.0 / (far - near)
+        return cls._from_values(2 * w, 0, 0, -(right + left) * w,
+                                0, 2 * h, 0, -(top + bottom) * h,
+                                0, 0, -2 * d, -(far + near) * d,
+                                0, 0, 0, 1)
+
+    def transposed(self) -> Matrix4:
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = self._components
+        return self._from_values(a00, a10, a20, a30, a01, a11, a21, a31,
+                                 a02, a12, a22, a32, a03, a13, a23, a33)
+
+    def determinant(self) -> float:
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = self._components
+        s0, s1, s2 = a00 * a11 - a10 * a01, a00 * a12 - a10 * a02, a00 * a13 - a10 * a03
+        s3, s4, s5 = a01 * a12 - a11 * a02, a01 * a13 - a11 * a03, a02 * a13 - a12 * a03
+        c5, c4, c3 = a22 * a33 - a32 * a23, a21 * a33 - a31 * a23, a21 * a32 - a31 * a22
+        c2, c1, c0 = a20 * a33 - a30 * a23, a20 * a32 - a30 * a22, a20 * a31 - a30 * a21
+        return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+    def inverse(self) -> Matrix4:
+        """Return the inverse through unrolled 2x2 sub-determinants
+
+        Raises:
+            MatrixSingularError: If the determinant is 0
+        """
+
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = self._components
+        s0, s1, s2 = a00 * a11 - a10 * a01, a00 * a12 - a10 * a02, a00 * a13 - a10 * a03
+        s3, s4, s5 = a01 * a12 - a11 * a02, a01 * a13 - a11 * a03, a02 * a13 - a12 * a03
+        c5, c4, c3 = a22 * a33 - a32 * a23, a21 * a33 - a31 * a23, a21 * a32 - a31 * a22
+        c2, c1, c0 = a20 * a33 - a30 * a23, a20 * a32 - a30 * a22, a20 * a31 - a30 * a21
+
+        det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+        if not det:
+            raise Matrix.Exceptions.MatrixSingularError()
+
+        inv = 1.0 / det
+        return self._from_values(
+            (a11 * c5 - a12 * c4 + a13 * c3) * inv, (-a01 * c5 + a02 * c4 - a03 * c3) * inv,
+            (a31 * s5 - a32 * s4 + a33 * s3) * inv, (-a21 * s5 + a22 * s4 - a23 * s3) * inv,
+            (-a10 * c5 + a12 * c2 - a13 * c1) * inv, (a00 * c5 - a02 * c2 + a03 * c1) * inv,
+            (-a30 * s5 + a32 * s2 - a33 * s1) * inv, (a20 * s5 - a22 * s2 + a23 * s1) * inv,
+            (a10 * c4 - a11 * c2 + a13 * c0) * inv, (-a00 * c4 + a01 * c2 - a03 * c0) * inv,
+            (a30 * s4 - a31 * s2 + a33 * s0) * inv, (-a20 * s4 + a21 * s2 - a23 * s0) * inv,
+            (-a10 * c3 + a11 * c1 - a12 * c0) * inv, (a00 * c3 - a01 * c1 + a02 * c0) * inv,
+            (-a30 * s3 + a31 * s1 - a32 * s0) * inv, (a20 * s3 - a21 * s1 + a22 * s0) * inv)
+
+    def affine_inverse(self) -> Matrix4:
+        """Return the inverse of an affine transform (last row 0, 0, 0, 1)
+
+        Only the 3x3 linear part is inverted; the translation is moved
+        back through it. About half the work of inverse().
+
+        Raises:
+            MatrixSingularError: If the linear part is singular
+        """
+
+        a00, a01, a02, tx, a10, a11, a12, ty, a20, a21, a22, tz = self._components[:12]
+        c00, c01, c02 = a11 * a22 - a12 * a21, a12 * a20 - a10 * a22, a10 * a21 - a11 * a20
+        det = a00 * c00 + a01 * c01 + a02 * c02
+        if not det:
+            raise Matrix.Exceptions.MatrixSingularError()
+
+        inv = 1.0 / det
+        b00, b01, b02 = c00 * inv, (a02 * a21 - a01 * a22) * inv, (a01 * a12 - a02 * a11) * inv
+        b10, b11, b12 = c01 * inv, (a00 * a22 - a02 * a20) * inv, (a02 * a10 - a00 * a12) * inv
+        b20, b21, b22 = c02 * inv, (a01 * a20 - a00 * a21) * inv, (a00 * a11 - a01 * a10) * inv
+        return self._from_values(b00, b01, b02, -(b00 * tx + b01 * ty + b02 * tz),
+                                 b10, b11, b12, -(b10 * tx + b11 * ty + b12 * tz),
+                                 b20, b21, b22, -(b20 * tx + b21 * ty + b22 * tz),
+                                 0, 0, 0, 1)
+
+    def transform_point(self, point: Vector3) -> Vector3:
+        """Return point transformed as (x, y, z, 1), divided by the resulting w"""
+
+        (a00, a01, a02, a03, a10, a11, a12, a13,
+         a20, a21, a22, a23, a30, a31, a32, a33) = self._components
+        x, y, z = point.x, point.y, point.z
+        w = a30 * x + a31 * y + a32 * z + a33
+        px = a00 * x + a01 * y + a02 * z + a03
+        py = a10 * x + a11 * y + a12 * z + a13
+        pz = a20 * x + a21 * y + a22 * z + a23
+        if w == 1.0:
+            return Vector3._new(px, py, pz)
+        return Vector3._new(px / w, py / w, pz / w)
+
+    def transform_direction(self, direction: Vector3) -> Vector3:
+        """Return direction transformed as (x, y, z, 0), ignoring translation"""
+
+        a00, a01, a02, _, a10, a11, a12, _, a20, a21, a22, _ = self._components[:12]
+        x, y, z = direction.x, direction.y, direction.z
+        return Vector3._new(a00 * x + a01 * y + a02 * z, a10 * x + a11 * y + a12 * z, a20 * x + a21 * y + a22 * z)
+
+    def transform_points(self, points: Union[Iterable[Vector3], Vector3Array]) -> Union[List[Vector3], Vector3Array]:
+        """Return every point transformed as an affine point
+
+        The last row is assumed to be (0, 0, 0, 1), use transform_point for
+        projective matrices. A Vector3Array is transformed plane by plane
+        and returned as a new Vector3Array, any other iterable of Vector3's
+        is returned as a list.
+        """
+
+        m00, m01, m02, m03, m10, m11, m12, m13, m20, m21, m22, m23 = self._components[:12]
+
+        if isinstance(points, Vector3Array):
+            xs, ys, zs = points.planes
+            return Vector3Array.from_components(
+                [m00 * x + m01 * y + m02 * z + m03 for x, y, z in zip(xs, ys, zs)],
+                [m10 * x + m11 * y + m12 * z + m13 for x, y, z in zip(xs, ys, zs)],
+                [m20 * x + m21 * y + m22 * z + m23 for x, y, z in zip(xs, ys, zs)])
+
+        new = Vector3._new
+        return [new(m00 * p.x + m01 * p.y + m02 * p.z + m03,
+                    m10 * p.x + m11 * p.y + m12 * p.z + m13,
+                    m20 * p.x + m21 * p.y + m22 * p.z + m23) for p in points]
+
+    def __matmul__(self, other: Union[Matrix, Vector3]) -> Union[Matrix, Vector3]:
+        """Unrolled Matrix4 @ Matrix4 and Matrix4 @ Vector3 (point)"""
+
+        if isinstance(other, Matrix4):
+            (a00, a01, a02, a03, a10, a11, a12, a13,
+             a20, a21, a22, a23, a30, a31, a32, a33) = self._components
+            (b00, b01, b02, b03, b10, b11, b12, b13,
+             b20, b21, b22, b23, b30, b31, b32, b33) = other._components
+            return self._from_values(
+                a00 * b00 + a01 * b10 + a02 * b20 + a03 * b30, a00 * b01 + a01 * b11 + a02 * b21 + a03 * b31,
+                a00 * b02 + a01 * b12 + a02 * b22 + a03 * b32, a00 * b03 + a01 * b13 + a02 * b23 + a03 * b33,
+                a10 * b00 + a11 * b10 + a12 * b20 + a13 * b30, a10 * b01 + a11 * b11 + a12 * b21 + a13 * b31,
+                a10 * b02 + a11 * b12 + a12 * b22 + a13 * b32, a10 * b03 + a11 * b13 + a12 * b23 + a13 * b33,
+                a20 * b00 + a21 * b10 + a22 * b20 + a23 * b30, a20 * b01 + a21 * b11 + a22 * b21 + a23 * b31,
+                a20 * b02 + a21 * b12 + a22 * b22 + a23 * b32, a20 * b03 + a21 * b13 + a22 * b23 + a23 * b33,
+                a30 * b00 + a31 * b10 + a32 * b20 + a33 * b30, a30 * b01 + a31 * b11 + a32 * b21 + a33 * b31,
+                a30 * b02 + a31 * b12 + a32 * b22 + a33 * b32, a30 * b03 + a31 * b13 + a32 * b23 + a33 * b33)
+        elif isinstance(other, Vector3):
+            return self.transform_point(other)
+        return super(Matrix4, self).__matmul__(other)
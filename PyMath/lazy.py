@@ -0,0 +1,263 @@
+"""Deferred 'Matrix' expressions
+
+m.lazy() wraps a 'Matrix' in a LazyMatrix leaf. Operators on a
+LazyMatrix record an expression tree instead of computing anything,
+and evaluate() runs the whole tree at once:
+
+    Products    Consecutive @ operands are flattened into one chain and
+                multiplied in the order the matrix-chain dynamic program
+                finds cheapest, instead of left to right.
+    Elementwise Every connected run of + - * / and negation is compiled
+                into one lambda and applied in a single pass over the
+                input buffers, so no intermediate 'Matrix' is allocated.
+
+    result = (a.lazy() @ b @ c + d.lazy() * 2).evaluate()
+
+Only operators with a LazyMatrix operand are deferred, so d * 2 on a
+plain 'Matrix' is still computed eagerly before it joins the tree.
+"""
+
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+from PyMath.matrix import Matrix
+
+Operand = Union["LazyMatrix", Matrix, int, float]
+
+_SYMBOLS = {"add": "+", "sub": "-", "mul": "*", "truediv": "/"}
+
+_CHUNK = 4096  # Elements per fused pass, bounds the temporary memory next to the output
+
+
+class LazyMatrix(object):
+    """Node of a deferred 'Matrix' expression
+
+    Build nodes with Matrix.lazy() / LazyMatrix.leaf() and the operators,
+    never directly. Shapes are checked while the tree is built, so a size
+    mismatch raises MatrixSizeError at the operator that caused it.
+    """
+
+    __slots__ = ("_shape", "_kind", "_operands")
+
+    def __init__(self, shape: Tuple[int, int], kind: str, operands: tuple):
+        self._shape = shape
+        self._kind = kind  # 'leaf', 'chain', 'neg' or an elementwise op name
+        self._operands = operands
+
+    @classmethod
+    def leaf(cls, matrix: Matrix) -> LazyMatrix:
+        return cls(matrix.size(), "leaf", (matrix,))
+
+    def rows(self) -> int:
+        """Getter for rows"""
+        return self._shape[0]
+
+    def cols(self) -> int:
+        """Getter for cols"""
+        return self._shape[1]
+
+    def size(self) -> Tuple[int, int]:
+        """Getter for size"""
+        return self._shape
+
+    def evaluate(self, engine: Optional[str] = None) -> Matrix:
+        """Compute the expression and return a new 'Matrix'
+
+        Args:
+            engine (str): Multiplication engine for every product, see 'PyMath.matmul'
+
+        Returns:
+            Matrix: The result; a leaf returns the wrapped 'Matrix' itself
+        """
+
+        return _evaluate(self, {}, engine)
+
+    def chain_cost(self) -> int:
+        """Scalar multiplications evaluate() spends on products, using the optimal chain orders"""
+
+        cost = 0
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._kind == "chain":
+                cost += _chain_order([operand._shape for operand in node._operands])[0]
+            if node._kind != "leaf":
+                stack.extend(operand for operand in node._operands if isinstance(operand, LazyMatrix))
+        return cost
+
+    def __repr__(self):
+        if self._kind == "leaf":
+            return f"Matrix{self._shape}"
+        elif self._kind == "chain":
+            return "(" + " @ ".join(map(repr, self._operands)) + ")"
+        elif self._kind == "neg":
+            return f"-{self._operands[0]!r}"
+        return f"({self._operands[0]!r} {_SYMBOLS[self._kind]} {self._operands[1]!r})"
+
+    def __elementwise(self, kind: str, left: Operand, right: Operand) -> LazyMatrix:
+        for operand in (left, right):
+            if _wrap(operand) is None:
+                raise Matrix.Exceptions.MatrixMathError(operand)
+        left, right = _wrap(left), _wrap(right)
+
+        shapes = [operand._shape for operand in (left, right) if isinstance(operand, LazyMatrix)]
+        if shapes[0] != shapes[-1]:
+            raise Matrix.Exceptions.MatrixSizeError(left, right)
+        return LazyMatrix(shapes[0], kind, (left, right))
+
+    def __add__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("add", self, other)
+
+    def __sub__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("sub", self, other)
+
+    def __mul__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("mul", self, other)
+
+    def __truediv__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("truediv", self, other)
+
+    def __radd__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("add", other, self)
+
+    def __rsub__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("sub", other, self)
+
+    def __rmul__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("mul", other, self)
+
+    def __rtruediv__(self, other: Operand) -> LazyMatrix:
+        return self.__elementwise("truediv", other, self)
+
+    def __neg__(self) -> LazyMatrix:
+        return LazyMatrix(self._shape, "neg", (self,))
+
+    def __matmul__(self, other: Union[LazyMatrix, Matrix]) -> LazyMatrix:
+        return _chain(self, other)
+
+    def __rmatmul__(self, other: Matrix) -> LazyMatrix:
+        return _chain(other, self)
+
+
+def lazy(matrix: Matrix) -> LazyMatrix:
+    """Return a 'LazyMatrix' leaf wrapping matrix, same as matrix.lazy()"""
+
+    return LazyMatrix.leaf(matrix)
+
+
+def _wrap(operand: Operand) -> Union[LazyMatrix, float, None]:
+    if isinstance(operand, LazyMatrix):
+        return operand
+    elif isinstance(operand, Matrix):
+        return LazyMatrix.leaf(operand)
+    elif isinstance(operand, (int, float)):
+        return operand
+    return None
+
+
+def _chain(left: Union[LazyMatrix, Matrix], right: Union[LazyMatrix, Matrix]) -> LazyMatrix:
+    """Record left @ right, flattening nested chains into one operand list"""
+
+    operands = []
+    for operand in (left, right):
+        operand = _wrap(operand)
+        if not isinstance(operand, LazyMatrix):
+            raise Matrix.Exceptions.MatrixMultiplicationError(operand)
+        operands.extend(operand._operands if operand._kind == "chain" else (operand,))
+
+    if left.cols() != right.rows():
+        raise Matrix.Exceptions.MatrixSizeError(left, right)
+    return LazyMatrix((operands[0]._shape[0], operands[-1]._shape[1]), "chain", tuple(operands))
+
+
+def _chain_order(shapes: List[Tuple[int, int]]) -> Tuple[int, List[List[int]]]:
+    """Matrix-chain dynamic program
+
+    Returns:
+        tuple: (minimum scalar multiplications, split table) where
+            split[i][j] is the k such that (i..k) @ (k+1..j) is optimal
+    """
+
+    n = len(shapes)
+    dims = [shapes[0][0]] + [shape[1] for shape in shapes]
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j], split[i][j] = min((cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k)
+                                          for k in range(i, j))
+    return cost[0][n - 1], split
+
+
+def _evaluate(node: LazyMatrix, memo: Dict[int, Matrix], engine: Optional[str]) -> Matrix:
+    """Evaluate node, computing every shared subtree only once"""
+
+    result = memo.get(id(node))
+    if result is not None:
+        return result
+
+    if node._kind == "leaf":
+        result = node._operands[0]
+    elif node._kind == "chain":
+        matrices = [_evaluate(operand, memo, engine) for operand in node._operands]
+        _, split = _chain_order([matrix.size() for matrix in matrices])
+        result = _multiply(matrices, split, 0, len(matrices) - 1, engine)
+    else:
+        inputs, scalars = [], []
+        source = _fused_source(node, inputs, scalars)
+        kernel = _compile(source, len(inputs), len(scalars))(*scalars)
+        buffers = [_evaluate(operand, memo, engine)._components for operand in inputs]
+        output = array("d", [0.0]) * (node._shape[0] * node._shape[1])
+        for start in range(0, len(output), _CHUNK):
+            end = start + _CHUNK
+            output[start:end] = array("d", map(kernel, *(buffer[start:end] for buffer in buffers)))
+        result = Matrix._from_buffer(node._shape, output)
+
+    memo[id(node)] = result
+    return result
+
+
+def _multiply(matrices: List[Matrix], split: List[List[int]], i: int, j: int, engine: Optional[str]) -> Matrix:
+    if i == j:
+        return matrices[i]
+    k = split[i][j]
+    return Matrix.matrix_multiply(_multiply(matrices, split, i, k, engine),
+                                  _multiply(matrices, split, k + 1, j, engine), engine)
+
+
+def _fused_source(node: Union[LazyMatrix, float], inputs: List[LazyMatrix], scalars: List[float]) -> str:
+    """Python expression for the elementwise run rooted at node
+
+    Leaves and products become per-element arguments x0, x1, ... and
+    scalars become constants c0, c1, ... bound once per evaluation.
+    """
+
+    if not isinstance(node, LazyMatrix):
+        scalars.append(node)
+        return f"c{len(scalars) - 1}"
+    elif node._kind == "neg":
+        return f"(-{_fused_source(node._operands[0], inputs, scalars)})"
+    elif node._kind in _SYMBOLS:
+        left = _fused_source(node._operands[0], inputs, scalars)
+        right = _fused_source(node._operands[1], inputs, scalars)
+        return f"({left} {_SYMBOLS[node._kind]} {right})"
+
+    for index, operand in enumerate(inputs):
+        if operand is node:
+            return f"x{index}"
+    inputs.append(node)
+    return f"x{len(inputs) - 1}"
+
+
+@lru_cache(maxsize=256)
+def _compile(source: str, n_inputs: int, n_scalars: int):
+    """Return a factory taking the scalars and returning the per-element lambda"""
+
+    arguments = ", ".join(f"x{i}" for i in range(n_inputs))
+    constants = ", ".join(f"c{i}" for i in range(n_scalars))
+    return eval(f"lambda {constants}: lambda {arguments}: {source}", {"__builtins__": {}})
@@ -0,0 +1,288 @@
+"""Linear algebra on top of 'Matrix'
+
+LUFactorization factors a square 'Matrix' once so solving against many
+right hand sides, inverting and taking the determinant all reuse the
+same O(n^3) work.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from operator import mul, sub
+from typing import List, Sequence, Union
+
+from PyMath.matrix import Matrix
+from PyMath.vector import Vector, _float_copy
+
+
+class LUFactorization(object):
+    """LU decomposition with partial pivoting: P @ A = L @ U
+
+    L (unit lower triangular) and U are stored together in one list of
+    row arrays, and the row permutation as a list of original row
+    indices. A singular matrix still factors, so determinant() can
+    return 0; solve() and inverse() raise MatrixSingularError for it.
+    """
+
+    def __init__(self, matrix: Matrix, tolerance: float = 1e-12):
+        if matrix.rows() != matrix.cols():
+            raise Matrix.Exceptions.MatrixSquareError(matrix)
+
+        n = self._n = matrix.rows()
+        storage = matrix._components
+        lu = self._lu = [_float_copy(storage[i * n:(i + 1) * n]) for i in range(n)]
+        self._permutation = list(range(n))
+        self._sign = 1
+        self._singular = False
+
+        limit = tolerance * max(map(abs, storage), default=0.0)
+        for k in range(n):
+            pivot_row = max(range(k, n), key=lambda i: abs(lu[i][k]))
+            if pivot_row != k:
+                lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+                self._permutation[k], self._permutation[pivot_row] = self._permutation[pivot_row], self._permutation[k]
+                self._sign = -self._sign
+
+            pivot = lu[k][k]
+            if abs(pivot) <= limit:
+                self._singular = True
+                continue
+
+            tail = lu[k][k + 1:]
+            for i in range(k + 1, n):
+                row = lu[i]
+                factor = row[k] / pivot
+                if factor:
+                    row[k + 1:] = array("d", map(sub, row[k + 1:], map(mul, tail, repeat(factor))))
+                row[k] = factor
+
+    @property
+    def singular(self) -> bool:
+        return self._singular
+
+    @property
+    def permutation(self) -> List[int]:
+        """Original row index of every row of L @ U"""
+        return list(self._permutation)
+
+    def lower(self) -> Matrix:
+        """Return L as a new 'Matrix'"""
+
+        n = self._n
+        return Matrix.matrix_from_list([list(row[:i]) + [1.0] + [0.0] * (n - i - 1)
+                                        for i, row in enumerate(self._lu)])
+
+    def upper(self) -> Matrix:
+        """Return U as a new 'Matrix'"""
+
+        return Matrix.matrix_from_list([[0.0] * i + list(row[i:]) for i, row in enumerate(self._lu)])
+
+    def determinant(self) -> float:
+        """Return the determinant of the factored 'Matrix'"""
+
+        if self._singular:
+            return 0.0
+        result = float(self._sign)
+        for i, row in enumerate(self._lu):
+            result *= row[i]
+        return result
+
+    def solve(self, b: Union[Matrix, Vector, Sequence[float]]) -> Union[Matrix, Vector]:
+        """Solve A @ x = b
+
+        Args:
+            b (Matrix, Vector, list): One right hand side of length n, or a
+                'Matrix' with n rows holding one right hand side per column
+
+        Raises:
+            MatrixSingularError: If the factored 'Matrix' is singular
+            MatrixSizeError: If b is a 'Matrix' with a row count other than n
+
+        Returns:
+            Vector or Matrix: x, shaped like b
+        """
+
+        self.__check_solvable()
+        if isinstance(b, Matrix):
+            if b.rows() != self._n:
+                raise Matrix.Exceptions.MatrixSizeError(Matrix((self._n, b.cols())), b)
+            return self.__solve_rows(b)
+        return Vector(*self.__solve_vector(list(b)))
+
+    def inverse(self) -> Matrix:
+        """Return the inverse of the factored 'Matrix'
+
+        Raises:
+            MatrixSingularError: If the factored 'Matrix' is singular
+        """
+
+        self.__check_solvable()
+        return self.__solve_rows(Matrix.identity(self._n))
+
+    def __check_solvable(self) -> None:
+        if self._singular:
+            raise Matrix.Exceptions.MatrixSingularError()
+
+    def __solve_vector(self, b: List[float]) -> List[float]:
+        n, lu = self._n, self._lu
+        if len(b) != n:
+            raise ValueError(f"Right hand side should have {n} elements. Found {len(b)} instead.")
+
+        y = [float(b[p]) for p in self._permutation]
+        for i in range(n):
+            row = lu[i]
+            y[i] -= sum(map(mul, row[:i], y[:i]))
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            y[i] = (y[i] - sum(map(mul, row[i + 1:], y[i + 1:]))) / row[i]
+        return y
+
+    def __solve_rows(self, b: Matrix) -> Matrix:
+        """Forward and back substitution on whole rows of b at once"""
+
+        n, lu, m = self._n, self._lu, b.cols()
+        storage = b._components
+        rows = [storage[p * m:(p + 1) * m] for p in self._permutation]
+
+        for i in range(n):
+            row = rows[i]
+            for k, factor in enumerate(lu[i][:i]):
+                if factor:
+                    row = array("d", map(sub, row, map(mul, rows[k], repeat(factor))))
+            rows[i] = row
+        for i in range(n - 1, -1, -1):
+            row = rows[i]
+            for k in range(i + 1, n):
+                factor = lu[i][k]
+                if factor:
+                    row = array("d", map(sub, row, map(mul, rows[k], repeat(factor))))
+            pivot = lu[i][i]
+            rows[i] = array("d", map(mul, row, repeat(1.0 / pivot)))
+
+        result = array("d")
+        for row in rows:
+            result.extend(row)
+        return Matrix._from_buffer((n, m), result)
+
+
+class IncrementalInverse(object):
+    """A 'Matrix' and its inverse kept in sync under low-rank updates
+
+    update(U, V) applies A += U @ V.T and rewrites the inverse with the
+    Sherman-Morrison-Woodbury identity in O(n^2 k) instead of inverting
+    again in O(n^3); rank_one_update(u, v) is the k = 1 case.
+
+    Every check_interval updates the drift, |A @ (A^-1 @ x) - x| / |x| for
+    a fixed probe x, is measured in O(n^2). Once it exceeds
+    drift_tolerance the inverse is recomputed from A with a fresh LU
+    factorization.
+    """
+
+    def __init__(self, matrix: Matrix, drift_tolerance: float = 1e-9, check_interval: int = 16):
+        """
+        Args:
+            matrix (Matrix): Square, invertible starting 'Matrix', copied
+            drift_tolerance (float): Largest relative residual kept before refactorizing
+            check_interval (int): Updates between drift checks, 0 to never check
+
+        Raises:
+            MatrixSquareError: If matrix is not square
+            MatrixSingularError: If matrix has no inverse
+        """
+
+        if matrix.rows() != matrix.cols():
+            raise Matrix.Exceptions.MatrixSquareError(matrix)
+
+        self._matrix = Matrix._from_buffer(matrix.size(), _float_copy(matrix._components))
+        self.drift_tolerance = drift_tolerance
+        self.check_interval = check_interval
+        self._probe = Matrix._from_buffer((matrix.rows(), 1), array(
+            "d", (1.0 + (i % 7) / 7.0 for i in range(matrix.rows()))))
+        self._updates = 0
+        self._refactorizations = 0
+        self._inverse = LUFactorization(self._matrix).inverse()
+
+    @property
+    def matrix(self) -> Matrix:
+        """The current A, do not modify it in place"""
+        return self._matrix
+
+    @property
+    def inverse(self) -> Matrix:
+        """The current A^-1, do not modify it in place"""
+        return self._inverse
+
+    @property
+    def updates(self) -> int:
+        """Updates applied since the last full refactorization"""
+        return self._updates
+
+    @property
+    def refactorizations(self) -> int:
+        """Full refactorizations triggered by the drift check or refactorize()"""
+        return self._refactorizations
+
+    def rank_one_update(self, u: Union[Vector, Sequence[float]], v: Union[Vector, Sequence[float]]) -> None:
+        """Apply A += u @ v.T (Sherman-Morrison)
+
+        Raises:
+            MatrixSingularError: If the update makes A singular, nothing is changed
+        """
+
+        self.update(self.__column(u), self.__column(v))
+
+    def update(self, u: Matrix, v: Matrix) -> None:
+        """Apply A += U @ V.T for n x k matrices U and V (Woodbury)
+
+        A^-1 -= (A^-1 U) (I + V.T A^-1 U)^-1 (V.T A^-1)
+
+        Raises:
+            MatrixSizeError: If U and V are not both n x k
+            MatrixSingularError: If the update makes A singular, nothing is changed
+        """
+
+        n = self._matrix.rows()
+        if u.rows() != n or u.size() != v.size():
+            raise Matrix.Exceptions.MatrixSizeError(u, v)
+
+        inverse_u = self._inverse @ u  # n x k
+        v_inverse = v.T @ self._inverse  # k x n
+        capacitance = v.T @ inverse_u + Matrix.identity(u.cols())  # k x k
+        correction = inverse_u @ (capacitance.inverse() @ v_inverse)
+
+        self._matrix += u @ v.T
+        self._inverse -= correction
+        self._updates += 1
+
+        if self.check_interval and self._updates % self.check_interval == 0 and \
+                self.drift() > self.drift_tolerance:
+            self.refactorize()
+
+    def drift(self) -> float:
+        """Relative residual |A @ (A^-1 @ x) - x| / |x| for the probe x, O(n^2)"""
+
+        probe = self._probe
+        residual = self._matrix @ (self._inverse @ probe) - probe
+        return residual.mag() / probe.mag()
+
+    def refactorize(self) -> None:
+        """Recompute the inverse from the current A with a fresh LU factorization"""
+
+        self._inverse = LUFactorization(self._matrix).inverse()
+        self._updates = 0
+        self._refactorizations += 1
+
+    def solve(self, b: Union[Matrix, Vector, Sequence[float]]) -> Union[Matrix, Vector]:
+        """Solve A @ x = b with the kept inverse in O(n^2) per right hand side"""
+
+        if isinstance(b, Matrix):
+            return self._inverse @ b
+        return Vector(*(self._inverse @ self.__column(b))._components)
+
+    def __column(self, values: Union[Vector, Sequence[float]]) -> Matrix:
+        n = self._matrix.rows()
+        column = array("d", values)
+        if len(column) != n:
+            raise ValueError(f"Vector should have {n} elements. Found {len(column)} instead.")
+        return Matrix._from_buffer((n, 1), column)
@@ -0,0 +1,239 @@
+"""Matrix multiplication engines for 'Matrix'
+
+Every engine multiplies flat row-major array('d') buffers:
+a is rows x inner, b is inner x cols and the result is rows x cols.
+
+    naive       Reference i-j-k triple loop
+    blocked     Transposes b once and computes each output element as a
+                C level dot product of a row of a and a column of b,
+                one tile of columns at a time
+    strassen    Strassen recursion down to settings.strassen_leaf, then
+                the blocked kernel
+    numpy       NumPy's BLAS backed matmul, only if numpy is installed
+    parallel    Row blocks of the blocked kernel on a process pool, see
+                'PyMath.parallel'
+
+multiply() picks an engine by size unless settings.engine or the
+engine argument names one. Auto only picks 'parallel' once
+parallel.settings.enabled is set, and 'strassen' once
+settings.strassen_threshold is set: in pure Python it is no faster
+than 'blocked' at the sizes the benchmark suite covers, and it loses
+some precision.
+"""
+
+from __future__ import annotations
+
+from array import array
+from operator import add, sub, mul
+from typing import List, Optional
+
+from PyMath import parallel
+from PyMath.vector import _float_copy
+
+try:
+    import numpy
+except ImportError:  # numpy is optional
+    numpy = None
+
+try:
+    from math import sumprod as _dot  # Python 3.12+
+except ImportError:
+    def _dot(p, q):
+        return sum(map(mul, p, q))
+
+ENGINES = ("auto", "naive", "blocked", "strassen", "numpy", "parallel")
+
+
+class MatmulSettings(object):
+    """Tunable engine selection for multiply()
+
+    Attributes:
+        engine (str): 'auto' to dispatch by size, or a fixed engine name
+        numpy_threshold (int): auto uses numpy once rows * inner * cols
+            reaches numpy_threshold ** 3
+        strassen_threshold (int): auto uses strassen when every
+            dimension is at least this large and the shapes are close
+            to square, None (the default) to never pick it
+        strassen_leaf (int): Size below which strassen stops recursing
+        block_size (int): Columns of b handled per tile by blocked
+    """
+
+    def __init__(self):
+        self.engine = "auto"
+        self.numpy_threshold = 16
+        self.strassen_threshold = None
+        self.strassen_leaf = 128
+        self.block_size = 64
+
+
+settings = MatmulSettings()
+
+
+def has_numpy() -> bool:
+    return numpy is not None
+
+
+def select_engine(rows: int, inner: int, cols: int) -> str:
+    """Return the engine auto dispatch uses for a rows x inner @ inner x cols product"""
+
+    if settings.engine != "auto":
+        return settings.engine
+    if numpy is not None and rows * inner * cols >= settings.numpy_threshold ** 3:
+        return "numpy"
+    if parallel.use_for_matmul(rows, inner, cols):
+        return "parallel"
+    smallest, largest = min(rows, inner, cols), max(rows, inner, cols)
+    threshold = settings.strassen_threshold
+    if threshold is not None and smallest >= threshold and largest <= 2 * smallest:
+        return "strassen"
+    return "blocked"
+
+
+def multiply(a: array, b: array, rows: int, inner: int, cols: int, engine: Optional[str] = None) -> array:
+    """Multiply two flat row-major buffers and return a new array('d')
+
+    Args:
+        a (array): rows x inner elements
+        b (array): inner x cols elements
+        rows (int): Rows of a
+        inner (int): Columns of a and rows of b
+        cols (int): Columns of b
+        engine (str): Engine name, None to use settings / auto dispatch
+
+    Raises:
+        ValueError: If engine is unknown, or is 'numpy' without numpy installed
+
+    Returns:
+        array: rows x cols elements
+    """
+
+    a = _float_copy(a) if isinstance(a, memoryview) else a  # Memory-mapped operands are read into memory once
+    b = _float_copy(b) if isinstance(b, memoryview) else b
+
+    engine = engine or select_engine(rows, inner, cols)
+    if engine == "auto":
+        engine = select_engine(rows, inner, cols)
+
+    if engine == "naive":
+        return naive(a, b, rows, inner, cols)
+    elif engine == "blocked":
+        return blocked(a, b, rows, inner, cols)
+    elif engine == "strassen":
+        return strassen(a, b, rows, inner, cols)
+    elif engine == "numpy":
+        if numpy is None:
+            raise ValueError("The 'numpy' engine needs numpy to be installed")
+        return _numpy(a, b, rows, inner, cols)
+    elif engine == "parallel":
+        return parallel.matmul(a, b, rows, inner, cols)
+    raise ValueError(f"engine should be one of {ENGINES}. Found '{engine}' instead.")
+
+
+def naive(a: array, b: array, rows: int, inner: int, cols: int) -> array:
+    """Reference i-j-k triple loop"""
+
+    result = array("d", bytes(8 * rows * cols))
+    for i in range(rows):
+        ir = i * inner
+        for j in range(cols):
+            result[i * cols + j] = sum(a[ir + k] * b[k * cols + j] for k in range(inner))
+    return result
+
+
+def blocked(a: array, b: array, rows: int, inner: int, cols: int) -> array:
+    """Transposed-b kernel
+
+    b is split into column arrays once, so every output element is a
+    single C level dot product of two contiguous arrays. Columns are
+    handled settings.block_size at a time so only one tile of the
+    transpose is alive at once.
+    """
+
+    result = array("d", bytes(8 * rows * cols))
+    a_rows = [a[i * inner:(i + 1) * inner] for i in range(rows)]
+    block = max(1, settings.block_size)
+
+    for j0 in range(0, cols, block):
+        j1 = min(j0 + block, cols)
+        b_cols = [b[j::cols] for j in range(j0, j1)]
+        for i, a_row in enumerate(a_rows):
+            result[i * cols + j0:i * cols + j1] = array("d", [_dot(a_row, b_col) for b_col in b_cols])
+    return result
+
+
+def strassen(a: array, b: array, rows: int, inner: int, cols: int) -> array:
+    """Strassen multiplication
+
+    Operands are zero padded to a common even size at every level of
+    the recursion, which stops at settings.strassen_leaf.
+    """
+
+    size = max(rows, inner, cols)
+    a_rows = _padded_rows(a, rows, inner, size)
+    b_rows = _padded_rows(b, inner, cols, size)
+    product = _strassen(a_rows, b_rows, size)
+
+    result = array("d")
+    for row in product[:rows]:
+        result.extend(row[:cols])
+    return result
+
+
+def _padded_rows(buffer: array, rows: int, cols: int, size: int) -> List[array]:
+    padding = array("d", bytes(8 * (size - cols)))
+    padded = [buffer[i * cols:(i + 1) * cols] + padding for i in range(rows)]
+    padded.extend(array("d", bytes(8 * size)) for _ in range(size - rows))
+    return padded
+
+
+def _strassen(a: List[array], b: List[array], size: int) -> List[array]:
+    if size <= max(settings.strassen_leaf, 1):
+        flat_a, flat_b = array("d"), array("d")
+        for row in a:
+            flat_a.extend(row)
+        for row in b:
+            flat_b.extend(row)
+        flat = blocked(flat_a, flat_b, size, size, size)
+        return [flat[i * size:(i + 1) * size] for i in range(size)]
+
+    if size % 2:
+        zero = array("d", [0.0])
+        a = [row + zero for row in a] + [array("d", bytes(8 * (size + 1)))]
+        b = [row + zero for row in b] + [array("d", bytes(8 * (size + 1)))]
+        return [row[:size] for row in _strassen(a, b, size + 1)[:size]]
+
+    h = size // 2
+    a11, a12 = [row[:h] for row in a[:h]], [row[h:] for row in a[:h]]
+    a21, a22 = [row[:h] for row in a[h:]], [row[h:] for row in a[h:]]
+    b11, b12 = [row[:h] for row in b[:h]], [row[h:] for row in b[:h]]
+    b21, b22 = [row[:h] for row in b[h:]], [row[h:] for row in b[h:]]
+
+    m1 = _strassen(_add(a11, a22), _add(b11, b22), h)
+    m2 = _strassen(_add(a21, a22), b11, h)
+    m3 = _strassen(a11, _sub(b12, b22), h)
+    m4 = _strassen(a22, _sub(b21, b11), h)
+    m5 = _strassen(_add(a11, a12), b22, h)
+    m6 = _strassen(_sub(a21, a11), _add(b11, b12), h)
+    m7 = _strassen(_sub(a12, a22), _add(b21, b22), h)
+
+    c11 = _add(_sub(_add(m1, m4), m5), m7)
+    c12 = _add(m3, m5)
+    c21 = _add(m2, m4)
+    c22 = _add(_add(_sub(m1, m2), m3), m6)
+    return [l + r for l, r in zip(c11, c12)] + [l + r for l, r in zip(c21, c22)]
+
+
+def _add(p: List[array], q: List[array]) -> List[array]:
+    return [array("d", map(add, x, y)) for x, y in zip(p, q)]
+
+
+def _sub(p: List[array], q: List[array]) -> List[array]:
+    return [array("d", map(sub, x, y)) for x, y in zip(p, q)]
+
+
+def _numpy(a: array, b: array, rows: int, inner: int, cols: int) -> array:
+    product = numpy.frombuffer(a, dtype=numpy.float64).reshape(rows, inner) @ \
+        numpy.frombuffer(b, dtype=numpy.float64).reshape(inner, cols)
+    result = array("d")
+    result.frombytes(numpy.ascontiguousarray(product, dtype=numpy.float64).tobytes())
+    return result
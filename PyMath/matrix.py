@@ -1,9 +1,124 @@
 from __future__ import annotations
 
+from array import array
+from operator import add, sub, mul, truediv, neg
 from random import randint
-from typing import Union, Tuple, List
+from typing import Union, Tuple, List, Iterable, TYPE_CHECKING
 
-from PyMath.vector import Vector
+from PyMath import matmul, parallel
+from PyMath.vector import BaseVector, Vector, _float_array, _float_copy
+
+if TYPE_CHECKING:
+    from PyMath.linalg import LUFactorization
+    from PyMath.lazy import LazyMatrix
+    from PyMath.sparse import CSRMatrix
+
+
+def _defers(other: any) -> bool:
+    """True for Matrix-like operands ('CSRMatrix', 'LazyMatrix') that implement the reflected operators"""
+
+    return not isinstance(other, (Matrix, BaseVector, int, float)) and hasattr(type(other), "__rmatmul__")
+
+
+class MatrixVector(Vector):
+    """'MatrixVector', subclass of 'Type[Vector]':
+
+    Row or column of a 'Matrix' that reads and writes the Matrix's
+    flat storage directly instead of holding its own copy. Arithmetic
+    returns plain 'Vector' objects; item assignment and in-place
+    operators write through to the Matrix.
+    """
+
+    __slots__ = ("_offset", "_stride", "_length")
+
+    def __init__(self, storage: array, offset: int, stride: int, length: int):
+        self._components = storage
+        self._offset = offset
+        self._stride = stride
+        self._length = length
+
+    @property
+    def components(self) -> List[float]:
+        return list(self)
+
+    def copy(self) -> Vector:
+        """Return a new 'Vector' holding a copy of the elements"""
+        return Vector(*self)
+
+    def mag_sq(self) -> float:
+        return sum(i * i for i in self)
+
+    def normalized(self, out: Vector = None) -> Vector:
+        return self.copy().normalized(out)
+
+    def __index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("MatrixVector index out of range")
+        return self._offset + index * self._stride
+
+    def __getitem__(self, index) -> Union[float, List[float]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        return self._components[self.__index(index)]
+
+    def __setitem__(self, key, value) -> None:
+        if isinstance(key, slice):
+            positions = range(*key.indices(self._length))
+            value = list(value)
+            if len(value) != len(positions):
+                raise ValueError(f"Expected {len(positions)} values for the slice. Found {len(value)} instead.")
+            for i, v in zip(positions, value):
+                self[i] = v
+        else:
+            self._components[self.__index(key)] = value
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        end = self._offset + self._stride * self._length
+        return iter(self._components[self._offset:end:self._stride])
+
+    def __str__(self) -> str:
+        return str(self.components)
+
+    def __repr__(self) -> str:
+        return repr(self.components)
+
+    def __neg__(self) -> Vector:
+        return -self.copy()
+
+    def __add__(self, other: Union[Vector, int, float]) -> Vector:
+        return self.copy() + other
+
+    def __sub__(self, other: Union[Vector, int, float]) -> Vector:
+        return self.copy() - other
+
+    def __mul__(self, scalar: Union[Vector, int, float]) -> Vector:
+        return self.copy() * scalar
+
+    def __truediv__(self, scalar: Union[Vector, int, float]) -> Vector:
+        return self.copy() / scalar
+
+    def __write(self, result: Vector) -> MatrixVector:
+        if result is None or result is NotImplemented:
+            return NotImplemented
+        self[:] = result
+        return self
+
+    def __iadd__(self, other: Union[Vector, int, float]) -> MatrixVector:
+        return self.__write(self + other)
+
+    def __isub__(self, other: Union[Vector, int, float]) -> MatrixVector:
+        return self.__write(self - other)
+
+    def __imul__(self, scalar: Union[Vector, int, float]) -> MatrixVector:
+        return self.__write(self * scalar)
+
+    def __itruediv__(self, scalar: Union[Vector, int, float]) -> MatrixVector:
+        return self.__write(self / scalar)
 
 
 class Matrix(Vector):
@@ -11,14 +126,41 @@ class Matrix(Vector):
 
     Class used to perform matrix mathematics, translations, rotations
     transposes and matrix chains.
+
+    Elements are stored in one flat row-major array('d'), element (i, j)
+    lives at i * cols + j. m[i, j] reads a single element, m[i] or
+    m.row(i) returns a 'MatrixVector' view of a row and m.col(j) a view
+    of a column, so m[i][j] = value keeps working. m.T and blocks such
+    as m[r0:r1, c0:c1] are 'MatrixView' objects sharing m's storage.
     """
 
+    __slots__ = ("__size", "__rows", "__columns")
+
     def __init__(self, dimensions=(3, 3), fill=1.0):
 
-        self.__size = self.__rows, self.__columns = dimensions
-        super(Matrix, self).__init__(*(Vector(*list(float(fill)
-                                                    for _ in range(self.__columns)))
-                                       for _ in range(self.__rows)))
+        self.__size = self.__rows, self.__columns = tuple(dimensions)
+        self._components = array("d", [float(fill)]) * (self.__rows * self.__columns)
+
+    @classmethod
+    def _from_buffer(cls, dimensions: Tuple[int, int], buffer: array) -> Matrix:
+        """Wrap an existing row-major array('d') without copying it"""
+
+        new_matrix = cls.__new__(cls)
+        new_matrix.__size = new_matrix.__rows, new_matrix.__columns = dimensions
+        new_matrix._components = buffer
+        return new_matrix
+
+    def _layout(self) -> Tuple[array, int, int, int]:
+        """(storage, offset, row_stride, col_stride): element (i, j) is storage[offset + i * row_stride + j * col_stride]"""
+
+        return self._components, 0, self.__columns, 1
+
+    def _assign(self, values: array) -> None:
+        """Overwrite every element with a row-major array of the same size"""
+
+        if len(values) != len(self):
+            raise ValueError(f"Expected {len(self)} values. Found {len(values)} instead.")
+        self._components[:] = values
 
     def rows(self):
         """Getter for rows"""
@@ -32,139 +174,363 @@ class Matrix(Vector):
         """Getter for size"""
         return self.__size
 
+    def row(self, index: int) -> MatrixVector:
+        """Return a 'MatrixVector' view of row index"""
+
+        if index < 0:
+            index += self.__rows
+        if not 0 <= index < self.__rows:
+            raise IndexError("Matrix row index out of range")
+        storage, offset, row_stride, col_stride = self._layout()
+        return MatrixVector(storage, offset + index * row_stride, col_stride, self.__columns)
+
+    def col(self, index: int) -> MatrixVector:
+        """Return a 'MatrixVector' view of column index"""
+
+        if index < 0:
+            index += self.__columns
+        if not 0 <= index < self.__columns:
+            raise IndexError("Matrix column index out of range")
+        storage, offset, row_stride, col_stride = self._layout()
+        return MatrixVector(storage, offset + index * col_stride, row_stride, self.__rows)
+
+    @property
+    def T(self) -> MatrixView:
+        """Transpose as a 'MatrixView' sharing this Matrix's storage"""
+
+        storage, offset, row_stride, col_stride = self._layout()
+        return MatrixView(storage, offset, col_stride, row_stride, self.__columns, self.__rows)
+
+    def transposed(self) -> Matrix:
+        """Return the transpose as a new contiguous 'Matrix'"""
+
+        return self.T.copy()
+
+    def block(self, rows: slice, cols: slice) -> MatrixView:
+        """Return the rows x cols sub-block as a 'MatrixView', same as m[rows, cols]"""
+
+        r0, r1, r_step = rows.indices(self.__rows)
+        c0, c1, c_step = cols.indices(self.__columns)
+        storage, offset, row_stride, col_stride = self._layout()
+        return MatrixView(storage, offset + r0 * row_stride + c0 * col_stride,
+                          row_stride * r_step, col_stride * c_step,
+                          len(range(r0, r1, r_step)), len(range(c0, c1, c_step)))
+
+    def tolist(self) -> List[List[float]]:
+        """Return the elements as a list of row lists"""
+
+        c, storage = self.__columns, self._components
+        return [storage[i * c:(i + 1) * c].tolist() for i in range(self.__rows)]
+
+    def mag_sq(self) -> float:
+        """Squared Frobenius norm of the 'Matrix'"""
+        return sum(map(mul, self._components, self._components))
+
+    def dot(self, other: Matrix) -> float:
+        """Frobenius inner product between 2 Matrices of the same size"""
+
+        self.__check_size(other)
+        return sum(map(mul, self._components, other._components))
+
+    def distance(self, other: Matrix) -> float:
+        """Frobenius distance between 2 Matrices of the same size"""
+
+        return (self - other).mag()
+
+    def normalized(self, out: Matrix = None) -> Matrix:
+        """Return a new 'Matrix' divided by its Frobenius norm"""
+
+        mag = self.mag()
+        result = self / mag if mag else Matrix(self.size(), 0)
+        if out is None:
+            return result
+        out._assign(result._components)
+        return out
+
     def __len__(self):
         """Total position size of 'Matrix'"""
         return self.__rows * self.__columns
 
-    def __str__(self):
-        res = ""
-        for i in self:
-            if i == self[-1]:
-                res += str(i)
-            else:
-                res += str(i) + "\n"
-        return res
+    def as_buffer(self, typecode: str = "d") -> memoryview:
+        """Return the elements packed into a contiguous row-major memoryview
 
-    def __repr__(self):
-        return repr(self._components)
+        float64 views share memory with a contiguous 'Matrix'; float32 views
+        and views of a 'MatrixView' are copies.
 
-    def __iter__(self):
-        self.__pos = 0
-        return self
+        Args:
+            typecode (str): 'd' for float64 or 'f' for float32
 
-    def __next__(self):
-        if self.__pos < len(self._components):
-            self.__pos += 1
-            return self._components[self.__pos - 1]
-        raise StopIteration
+        Raises:
+            ValueError: If typecode is not 'd' or 'f'
 
-    def __add__(self, other: Union[Matrix, int, float]) -> Matrix:
-        """Overload + operator to perform element-wise addition between 2 matrices or matrix and scalar"""
+        Returns:
+            memoryview: View with shape (rows, cols), flat when the 'Matrix' is empty
+        """
 
-        new_matrix = Matrix(self.size())
-        if isinstance(other, Matrix):
-            if self.size() is other.size():
-                for i in range(self.__rows):
-                    for j in range(self.__columns):
-                        new_matrix[i][j] = self[i][j] + other[i][j]
-            else:
-                raise Matrix.Exceptions.MatrixSizeError(self, other)
+        packed = self._components if typecode == "d" else _float_array(typecode, self._components)
+        if not len(self):
+            return memoryview(packed)  # memoryview can't cast to a shape with a 0 dimension
+        return memoryview(packed).cast("B").cast(typecode, [self.__rows, self.__columns])
 
-        elif isinstance(other, (float, int)):
-            for i in range(self.__rows):
-                for j in range(self.__columns):
-                    new_matrix[i][j] = self[i][j] + other
-        else:
-            raise Matrix.Exceptions.MatrixMathError(other)
-        return new_matrix
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.as_buffer()
 
-    def __sub__(self, other: Union[Matrix, int, float]) -> Matrix:
-        """Overload - operator to perform element-wise subtraction between 2 matrices or matrix and scalar"""
+    def __str__(self):
+        return "\n".join(str(row) for row in self.tolist())
 
-        new_matrix = Matrix(self.size())
-        if isinstance(other, Matrix):
-            if self.size() is other.size():
-                for i in range(self.__rows):
-                    for j in range(self.__columns):
-                        new_matrix[i][j] = self[i][j] - other[i][j]
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def __iter__(self):
+        """Iterate over the rows as 'MatrixVector' views"""
+
+        for i in range(self.__rows):
+            yield self.row(i)
+
+    def __getitem__(self, index):
+        """Get an element with m[i, j], a block view with m[r0:r1, c0:c1],
+        a row view with m[i] or a list of row views with m[a:b]"""
+
+        if isinstance(index, tuple):
+            i, j = index
+            if isinstance(i, slice) or isinstance(j, slice):
+                return self.block(*(k if isinstance(k, slice) else slice(k, k + 1 or None) for k in index))
+            return self._layout()[0][self.__element(i, j)]
+        elif isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self.__rows))]
+        return self.row(index)
+
+    def __setitem__(self, index, value) -> None:
+        """Set an element with m[i, j] = value, a block with m[r0:r1, c0:c1] = Matrix,
+        nested lists or a scalar, or a whole row with m[i] = values"""
+
+        if isinstance(index, tuple):
+            target = self[index]
+            if not isinstance(target, Matrix):
+                self._layout()[0][self.__element(*index)] = value
+            elif isinstance(value, Matrix):
+                target.__check_size(value)
+                target._assign(value._components)
+            elif isinstance(value, (int, float)):
+                target._assign(array("d", [value]) * len(target))
             else:
-                raise Matrix.Exceptions.MatrixSizeError(self, other)
+                value = Matrix.matrix_from_list(value)
+                target.__check_size(value)
+                target._assign(value._components)
+        else:
+            values = array("d", value)
+            if len(values) != self.__columns:
+                raise Matrix.Exceptions.MatrixSizeError(self[index:index + 1 or None, :],
+                                                        Matrix._from_buffer((1, len(values)), values))
+            self.row(index)[:] = values
+
+    def __element(self, i: int, j: int) -> int:
+        """Flat storage position of element (i, j)"""
+
+        if i < 0:
+            i += self.__rows
+        if j < 0:
+            j += self.__columns
+        if not (0 <= i < self.__rows and 0 <= j < self.__columns):
+            raise IndexError("Matrix index out of range")
+        _, offset, row_stride, col_stride = self._layout()
+        return offset + i * row_stride + j * col_stride
+
+    def __check_size(self, other: Matrix) -> None:
+        if self.size() != other.size():
+            raise Matrix.Exceptions.MatrixSizeError(self, other)
+
+    def __elementwise(self, other: Union[Matrix, int, float], op, out: Matrix = None) -> Matrix:
+        """Apply op between every element of self and other in a single pass, on the process pool if large"""
 
+        if isinstance(other, Matrix):
+            self.__check_size(other)
+            operand = other._components
         elif isinstance(other, (float, int)):
-            for i in range(self.__rows):
-                for j in range(self.__columns):
-                    new_matrix[i][j] = self[i][j] - other
+            operand = other
+        elif _defers(other):
+            return NotImplemented
         else:
             raise Matrix.Exceptions.MatrixMathError(other)
-        return new_matrix
 
-    def __mul__(self, other: Union[Matrix, int, float]) -> Matrix:
-        """Overload * operator to perform element-wise multiplication between 2 matrices or matrix and scalar"""
+        components = self._components  # Gathered once, a view builds it on every read
+        if parallel.use_for_elementwise(len(self)):
+            result = parallel.elementwise(components, operand, op)
+        elif operand is other:
+            result = array("d", map(op, components, [other] * len(self)))
+        else:
+            result = array("d", map(op, components, operand))
+
+        if out is None:
+            return type(self)._from_buffer(self.size(), result)
+        out._assign(result)
+        return out
 
-        new_matrix = Matrix(self.size())
+    def __eq__(self, other: Union[Matrix, int, float]) -> bool:
         if isinstance(other, Matrix):
-            if self.size() is other.size():
-                for i in range(self.__rows):
-                    for j in range(self.__columns):
-                        new_matrix[i][j] = self[i][j] * other[i][j]
-            else:
-                raise Matrix.Exceptions.MatrixSizeError(self, other)
+            return self.size() == other.size() and self._components == other._components
+        return super(Matrix, self).__eq__(other)
 
-        elif isinstance(other, (float, int)):
-            for i in range(self.__rows):
-                for j in range(self.__columns):
-                    new_matrix[i][j] = self[i][j] * other
-        else:
-            raise Matrix.Exceptions.MatrixMathError(other)
-        return new_matrix
+    def __neg__(self) -> Matrix:
+        return type(self)._from_buffer(self.size(), array("d", map(neg, self._components)))
+
+    def __add__(self, other: Union[Matrix, int, float]) -> Matrix:
+        """Overload + operator to perform element-wise addition between 2 matrices or matrix and scalar"""
+        return self.__elementwise(other, add)
+
+    def __sub__(self, other: Union[Matrix, int, float]) -> Matrix:
+        """Overload - operator to perform element-wise subtraction between 2 matrices or matrix and scalar"""
+        return self.__elementwise(other, sub)
+
+    def __mul__(self, other: Union[Matrix, int, float]) -> Matrix:
+        """Overload * operator to perform element-wise multiplication between 2 matrices or matrix and scalar"""
+        return self.__elementwise(other, mul)
 
     def __truediv__(self, other: Union[Matrix, int, float]) -> Matrix:
         """Overload / operator to perform element-wise division between 2 matrices or matrix and scalar"""
+        return self.__elementwise(other, truediv)
 
-        new_matrix = Matrix(self.size())
-        if isinstance(other, Matrix):
-            if self.size() is other.size():
-                for i in range(self.__rows):
-                    for j in range(self.__columns):
-                        new_matrix[i][j] = self[i][j] / other[i][j]
-            else:
-                raise Matrix.Exceptions.MatrixSizeError(self, other)
+    def __iadd__(self, other: Union[Matrix, int, float]) -> Matrix:
+        return self.__elementwise(other, add, out=self)
 
-        elif isinstance(other, (float, int)):
-            for i in range(self.__rows):
-                for j in range(self.__columns):
-                    new_matrix[i][j] = self[i][j] / other
-        else:
-            raise Matrix.Exceptions.MatrixMathError(other)
-        return new_matrix
+    def __isub__(self, other: Union[Matrix, int, float]) -> Matrix:
+        return self.__elementwise(other, sub, out=self)
+
+    def __imul__(self, other: Union[Matrix, int, float]) -> Matrix:
+        return self.__elementwise(other, mul, out=self)
+
+    def __itruediv__(self, other: Union[Matrix, int, float]) -> Matrix:
+        return self.__elementwise(other, truediv, out=self)
 
     def __matmul__(self, other: Matrix) -> Matrix:
-        """Overload @ operator to perform point-wise multiplication between 2 Matrices"""
+        """Overload @ operator to perform point-wise multiplication between 2 Matrices
+
+        The multiplication engine is picked by size, see 'PyMath.matmul'.
+        Sparse and lazy operands handle the product themselves.
+        """
 
+        if _defers(other):
+            return NotImplemented
+        return self.__matrix_multiply(other)
+
+    def __matrix_multiply(self, other: Matrix, engine: str = None) -> Matrix:
         if isinstance(other, Matrix):
             if self.__columns == other.__rows:
-                new_matrix = Matrix((self.__rows, other.__columns), 0)
-                for i in range(self.__rows):
-                    for j in range(other.__columns):
-                        for k in range(other.__rows):
-                            new_matrix[i][j] += self[i][k] * other[k][j]
-                return new_matrix
+                result = matmul.multiply(self._components, other._components,
+                                         self.__rows, self.__columns, other.__columns, engine)
+                return Matrix._from_buffer((self.__rows, other.__columns), result)
             else:
                 raise Matrix.Exceptions.MatrixSizeError(self, other)
         else:
             raise Matrix.Exceptions.MatrixMultiplicationError(other)
 
-    def inverse(self):
-        matrix_copy = Matrix.copy(self)
-        for fd in range(len(self)):
-            fd_scalar = 1.0 / self[fd][fd]
-            for i in range(len(self)):
-                matrix_copy[fd][i] *= fd_scalar
-            for x in self[0:fd] + self[fd + 1:]:
-                cr_scalar = self[x][fd]
-                for j in range(len(self)):
-                    matrix_copy[x][j] -= (matrix_copy[fd][j] * cr_scalar)
-        return matrix_copy
+    def lu(self) -> LUFactorization:
+        """Return the LU factorization of a square 'Matrix'
+
+        Keep the result around to solve against many right hand sides
+        without factoring again.
+
+        Raises:
+            MatrixSquareError: If the 'Matrix' is not square
+
+        Returns:
+            LUFactorization: P @ self = L @ U with partial pivoting
+        """
+
+        from PyMath.linalg import LUFactorization
+
+        return LUFactorization(self)
+
+    def lazy(self) -> LazyMatrix:
+        """Return a 'LazyMatrix' leaf so following operators record an expression instead of computing it"""
+
+        from PyMath.lazy import LazyMatrix
+
+        return LazyMatrix.leaf(self)
+
+    def save(self, path: str) -> None:
+        """Write the elements to a float64 .npy file, see 'PyMath.npy'"""
+
+        from PyMath import npy
+
+        npy.save(path, self)
+
+    @staticmethod
+    def load(path: str, mmap_mode: str = "r") -> Matrix:
+        """Open a .npy file as a 'Matrix', memory-mapped unless mmap_mode is None, see 'PyMath.npy'"""
+
+        from PyMath import npy
+
+        matrix = npy.load(path, mmap_mode)
+        if not isinstance(matrix, Matrix):
+            raise ValueError(f"Expected a 2 dimensional array in '{path}'")
+        return matrix
+
+    def tosparse(self, tolerance: float = 0.0) -> CSRMatrix:
+        """Return the elements whose magnitude is above tolerance as a 'CSRMatrix'"""
+
+        from PyMath.sparse import CSRMatrix
+
+        return CSRMatrix.from_dense(self, tolerance)
+
+    def inverse(self) -> Matrix:
+        """Return the inverse of a square 'Matrix' through its LU factorization
+
+        Raises:
+            MatrixSquareError: If the 'Matrix' is not square
+            MatrixSingularError: If the 'Matrix' has no inverse
+        """
+
+        return self.lu().inverse()
+
+    def determinant(self) -> float:
+        """Return the determinant of a square 'Matrix' through its LU factorization"""
+
+        return self.lu().determinant()
+
+    def solve(self, b: Union[Matrix, Vector, List[float]]) -> Union[Matrix, Vector]:
+        """Solve self @ x = b, see 'LUFactorization.solve'"""
+
+        return self.lu().solve(b)
+
+    @staticmethod
+    def from_rows(rows: Iterable[Iterable[float]], cols: int = None) -> Matrix:
+        """Return a new Matrix built one row at a time from any iterable of rows
+
+        Rows are appended straight into the flat storage, so a generator
+        of rows is never held in memory twice.
+
+        Args:
+            rows (iterable): Rows of floats
+            cols (int): Row length, taken from the first row when omitted
+
+        Raises:
+            ValueError: If a row has a different length
+        """
+
+        storage = array("d")
+        count = 0
+        for row in rows:
+            storage.extend(row)
+            if cols is None:
+                cols = len(storage)
+            if len(storage) != (count + 1) * cols:
+                raise ValueError(f"Row {count} should have {cols} elements. "
+                                 f"Found {len(storage) - count * cols} instead.")
+            count += 1
+        return Matrix._from_buffer((count, cols or 0), storage)
+
+    @staticmethod
+    def from_file(path: str, delimiter: str = None) -> Matrix:
+        """Return a new Matrix read line by line from a text file
+
+        Every non blank line that does not start with '#' is one row of
+        numbers separated by delimiter (any whitespace when omitted).
+        """
+
+        with open(path) as f:
+            return Matrix.from_rows(map(float, line.split(delimiter)) for line in f
+                                    if line.strip() and not line.lstrip().startswith("#"))
 
     @staticmethod
     def matrix_from_list(matrix_list: Union[Tuple, List]) -> Matrix:
@@ -173,17 +539,12 @@ class Matrix(Vector):
         assert all(len(matrix_list[i]) == len(matrix_list[0]) for i in range(len(matrix_list)))
         r = len(matrix_list)
         c = len(matrix_list[0])
-        new_matrix = Matrix((r, c))
-        for i in range(r):
-            for j in range(c):
-                new_matrix[i][j] = matrix_list[i][j]
-        return new_matrix
+        return Matrix._from_buffer((r, c), array("d", (value for row in matrix_list for value in row)))
 
-    @staticmethod
-    def copy(matrix):
-        """Return a new 'Matrix' from 'Matrix'"""
+    def copy(self) -> Matrix:
+        """Return a new contiguous 'Matrix' with copied elements, also callable as Matrix.copy(m)"""
 
-        return Matrix(matrix.size()) * matrix
+        return type(self)._from_buffer(self.size(), _float_copy(self._components))
 
     @staticmethod
     def identity(size: Union[int, float, Tuple[int, float], List[int, float]]) -> Matrix:
@@ -210,10 +571,9 @@ class Matrix(Vector):
         """
 
         if isinstance(size, (int, float)):
+            size = int(size)
             new_matrix = Matrix((size, size), fill=0)
-            for i in range(new_matrix.__rows):
-                for x in range(new_matrix.__columns):
-                    new_matrix[i][i] = 1
+            new_matrix._components[::size + 1] = array("d", [1.0]) * size
             return new_matrix
         else:
             raise Matrix.Exceptions.MatrixIdentityError(size)
@@ -235,14 +595,12 @@ class Matrix(Vector):
             Matrix: New Random Matrix with dimensions=(size, size) and fill randint(minimum, maximum)
         """
 
-        if isinstance(size, (int, tuple)):
+        if isinstance(size, (list, tuple)):
             size = max(size)  # Grab largest value from size
+        size = int(size)
 
-        new_matrix = Matrix((size, size))
-        [[new_matrix[i].__setitem__(x, randint(minimum, maximum))
-          for x in range(new_matrix.cols())] for i in range(new_matrix.rows())]
-
-        return new_matrix
+        return Matrix._from_buffer((size, size), array("d", (randint(minimum, maximum)
+                                                             for _ in range(size * size))))
 
     @staticmethod
     def add(m1: Matrix, m2: Matrix) -> Matrix:
@@ -336,7 +694,7 @@ class Matrix(Vector):
         return m1 / m2
 
     @staticmethod
-    def matrix_multiply(m1: Matrix, m2: Matrix) -> Matrix:
+    def matrix_multiply(m1: Matrix, m2: Matrix, engine: str = None) -> Matrix:
         """Perform Matrix Multiplication on 2 Matrices
 
         Create a new Matrix from a and b using Matrix Multiplication.
@@ -345,6 +703,8 @@ class Matrix(Vector):
         Args:
             m1 (Matrix): Matrix 1
             m2 (Matrix): Matrix 2
+            engine (str): 'naive', 'blocked', 'strassen' or 'numpy' to force
+                an engine, None to pick one by size like @ does
 
         Raises:
             MatrixSizeError: If other is Matrix and a.rows != other.cols
@@ -354,7 +714,7 @@ class Matrix(Vector):
             Matrix: A new Matrix of A @ B
         """
 
-        return m1 @ m2
+        return m1.__matrix_multiply(m2, engine)
 
     class Exceptions:
         """Matrix Exception Struct to house relevant exceptions"""
@@ -381,3 +741,81 @@ class Matrix(Vector):
             def __init__(self, size: any):
                 msg = f"Size should be int or float. Found {type(size).__name__} instead."
                 super().__init__(msg)
+
+        class MatrixSquareError(Exception):
+            def __init__(self, matrix: Matrix):
+                msg = f"Matrix should be square. Found '{matrix.cols()}x{matrix.rows()}' instead."
+                super().__init__(msg)
+
+        class MatrixSingularError(Exception):
+            def __init__(self):
+                super().__init__("Matrix is singular and has no inverse.")
+
+
+class MatrixView(Matrix):
+    """'MatrixView', subclass of 'Type[Matrix]':
+
+    Strided window onto another Matrix's storage, returned by m.T and
+    block indexing like m[r0:r1, c0:c1]. Element access, row / column
+    views, item assignment and in-place operators read and write the
+    parent directly. Operations that produce a new Matrix read the
+    window into a fresh contiguous 'Matrix', and copy() does so
+    explicitly to detach from the parent.
+    """
+
+    __slots__ = ("_storage", "_offset", "_row_stride", "_col_stride")
+
+    def __init__(self, storage: array, offset: int, row_stride: int, col_stride: int, rows: int, cols: int):
+        self._Matrix__size = self._Matrix__rows, self._Matrix__columns = (rows, cols)
+        self._storage = storage
+        self._offset = offset
+        self._row_stride = row_stride
+        self._col_stride = col_stride
+
+    @classmethod
+    def _from_buffer(cls, dimensions: Tuple[int, int], buffer: array) -> Matrix:
+        """Results computed from a view are plain contiguous matrices"""
+
+        return Matrix._from_buffer(dimensions, buffer)
+
+    def _layout(self) -> Tuple[array, int, int, int]:
+        return self._storage, self._offset, self._row_stride, self._col_stride
+
+    def _row_slices(self):
+        """Yield one slice of storage per row of the view"""
+
+        rows, cols = self.size()
+        step = self._col_stride
+        span = (cols - 1) * step + (1 if step > 0 else -1) if cols else 0
+        for i in range(rows):
+            start = self._offset + i * self._row_stride
+            stop = start + span
+            yield slice(start, stop if stop >= 0 else None, step)
+
+    @property
+    def _components(self) -> array:
+        """The elements gathered into a new row-major array('d')"""
+
+        rows, cols = self.size()
+        storage = self._storage
+        if self._col_stride == 1 and (self._row_stride == cols or rows <= 1):
+            return _float_copy(storage[self._offset:self._offset + rows * cols])
+
+        gathered = array("d")
+        for row in self._row_slices():
+            gathered.extend(_float_copy(storage[row]))
+        return gathered
+
+    def _assign(self, values: array) -> None:
+        """Scatter row-major values back into the parent's storage"""
+
+        if len(values) != len(self):
+            raise ValueError(f"Expected {len(self)} values. Found {len(values)} instead.")
+        cols = self.cols()
+        for i, row in enumerate(self._row_slices()):
+            self._storage[row] = array("d", values[i * cols:(i + 1) * cols])
+
+    def copy(self) -> Matrix:
+        """Return a new contiguous 'Matrix' detached from the parent"""
+
+        return Matrix._from_buffer(self.size(), self._components)
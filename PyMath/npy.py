@@ -0,0 +1,203 @@
+"""Binary .npy storage for 'Matrix', 'Vector' and vector batches
+
+Files follow the NumPy .npy format (version 1.0 headers, little endian
+float64 data), so numpy.load / numpy.save read and write them too.
+
+load() memory-maps the file by default: the returned 'Matrix' wraps a
+float64 memoryview over the mapping, so opening is O(1) whatever the
+size and pages are read from disk only when touched.
+
+    mmap_mode   None    Read the whole file into memory
+                'r'     Read-only mapping, item assignment raises TypeError
+                'r+'    Writable mapping, assignments go straight to the file
+                'c'     Copy-on-write mapping, assignments stay in memory
+
+save_rows() streams rows to disk one at a time, so a 'Matrix' built
+from a generator never has to exist in memory at all.
+"""
+
+from __future__ import annotations
+
+import mmap
+import sys
+from array import array
+from ast import literal_eval
+from typing import BinaryIO, Iterable, Optional, Tuple, Type, Union
+
+from PyMath.matrix import Matrix, MatrixView
+from PyMath.vector import BaseVector, Vector, _float_copy
+from PyMath.vector_array import VectorArray, Vector2Array, Vector3Array
+
+MAGIC = b"\x93NUMPY"
+MMAP_MODES = (None, "r", "r+", "c")
+
+_ACCESS = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+_ALIGNMENT = 64
+_SHAPE_FIELD = 21  # Digits reserved per dimension by save_rows so the final shape fits in place
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+
+def save(path: str, obj: Union[Matrix, Vector, VectorArray]) -> None:
+    """Write obj as a float64 .npy file
+
+    A 'Matrix' is stored with shape (rows, cols), a 'Vector' with
+    shape (len,) and a vector batch with shape (len, dimensions).
+    """
+
+    if isinstance(obj, Matrix):
+        shape, data = obj.size(), obj._components
+    elif isinstance(obj, VectorArray):
+        shape, data = (len(obj), obj._dimensions), obj.as_buffer()
+    elif isinstance(obj, BaseVector):
+        shape, data = (len(obj),), obj.as_buffer()
+    else:
+        raise TypeError(f"Expected a Matrix, Vector or VectorArray. Found '{type(obj).__name__}' instead.")
+
+    with open(path, "wb") as f:
+        f.write(_header(shape))
+        _write_floats(f, data)
+
+
+def save_rows(path: str, rows: Iterable[Iterable[float]], cols: Optional[int] = None) -> Tuple[int, int]:
+    """Stream rows into a (len(rows), cols) float64 .npy file without holding them in memory
+
+    The header is written with room for any shape and rewritten in
+    place once the row count is known.
+
+    Args:
+        path (str): File to write
+        rows (iterable): Rows of floats, i.e. a generator
+        cols (int): Row length, taken from the first row when omitted
+
+    Raises:
+        ValueError: If a row has a different length
+
+    Returns:
+        tuple: The (rows, cols) shape written
+    """
+
+    count = 0
+    with open(path, "wb") as f:
+        f.write(_header((0, 0), reserve=True))
+        for row in rows:
+            values = array("d", row)
+            if cols is None:
+                cols = len(values)
+            if len(values) != cols:
+                raise ValueError(f"Row {count} should have {cols} elements. Found {len(values)} instead.")
+            _write_floats(f, values)
+            count += 1
+
+        shape = (count, cols or 0)
+        f.seek(0)
+        f.write(_header(shape, reserve=True))
+    return shape
+
+
+def load(path: str, mmap_mode: Optional[str] = "r") -> Union[Matrix, Vector]:
+    """Open a .npy file as a 'Matrix' (2-D) or 'Vector' (1-D)
+
+    2-D files are memory-mapped according to mmap_mode, Fortran ordered
+    files come back as a transposed 'MatrixView'. 1-D files, float32 files
+    and files in the other byte order are always read into memory.
+
+    Raises:
+        ValueError: If the file is not a float .npy file of 1 or 2 dimensions
+    """
+
+    if mmap_mode not in MMAP_MODES:
+        raise ValueError(f"mmap_mode should be one of {MMAP_MODES}. Found '{mmap_mode}' instead.")
+
+    with open(path, "r+b" if mmap_mode == "r+" else "rb") as f:
+        typecode, swap, fortran_order, shape, offset = read_header(f)
+        if len(shape) not in (1, 2):
+            raise ValueError(f"Expected a 1 or 2 dimensional array. Found shape {shape} instead.")
+
+        count = 1
+        for dimension in shape:
+            count *= dimension
+
+        if mmap_mode is None or len(shape) == 1 or typecode != "d" or swap:
+            data = array(typecode)
+            data.frombytes(f.read(count * data.itemsize))
+            if swap:
+                data.byteswap()
+            data = data if typecode == "d" else array("d", data)
+        else:
+            mapping = mmap.mmap(f.fileno(), 0, access=_ACCESS[mmap_mode])
+            data = memoryview(mapping)[offset:offset + 8 * count].cast("d")
+
+    if len(shape) == 1:
+        return Vector(*data)
+    rows, cols = shape
+    if fortran_order:
+        return MatrixView(data, 0, 1, rows, rows, cols)
+    return Matrix._from_buffer((rows, cols), data)
+
+
+def load_vectors(path: str, cls: Optional[Type[VectorArray]] = None) -> VectorArray:
+    """Read a (len, dimensions) .npy file into a vector batch
+
+    The planes of a batch are growable array('d'), so the file is
+    mapped and de-interleaved into memory one plane at a time.
+
+    Args:
+        path (str): File to read
+        cls (type): Batch class, Vector2Array or Vector3Array picked from
+            the file's shape when omitted
+    """
+
+    matrix = load(path, mmap_mode="r")
+    if not isinstance(matrix, Matrix):
+        raise ValueError("Expected a 2 dimensional array of vectors")
+
+    count, dimensions = matrix.size()
+    if cls is None:
+        cls = {2: Vector2Array, 3: Vector3Array}.get(dimensions)
+        if cls is None:
+            raise ValueError(f"No vector batch type with {dimensions} dimensions")
+    data = matrix._components
+    return cls.from_components(*(_float_copy(data[j::dimensions]) for j in range(dimensions)))
+
+
+def read_header(f: BinaryIO) -> Tuple[str, bool, bool, Tuple[int, ...], int]:
+    """Parse a .npy header, leaving f positioned at the data
+
+    Returns:
+        tuple: (typecode 'd' or 'f', byte swap needed, fortran order, shape, data offset)
+    """
+
+    if f.read(6) != MAGIC:
+        raise ValueError("Not a .npy file")
+    major = f.read(2)[0]
+    size_bytes = 2 if major == 1 else 4
+    header_size = int.from_bytes(f.read(size_bytes), "little")
+    header = literal_eval(f.read(header_size).decode("latin1" if major < 3 else "utf8"))
+
+    descr = header["descr"]
+    if descr[1:] not in ("f8", "f4") or descr[0] not in "<>=|":
+        raise ValueError(f"Expected float64 or float32 data. Found '{descr}' instead.")
+    little = descr[0] == "<" or (descr[0] in "=|" and _NATIVE_LITTLE)
+    typecode = "d" if descr[1:] == "f8" else "f"
+    return typecode, little != _NATIVE_LITTLE, header["fortran_order"], tuple(header["shape"]), f.tell()
+
+
+def _header(shape: Tuple[int, ...], reserve: bool = False) -> bytes:
+    """Version 1.0 header padded so the data starts on a 64 byte boundary"""
+
+    shape_text = "(" + ", ".join(map(str, shape)) + ("," if len(shape) == 1 else "") + ")"
+    if reserve:
+        shape_text = shape_text.ljust(len(shape) * (_SHAPE_FIELD + 2) + 2)
+    text = f"{{'descr': '<f8', 'fortran_order': False, 'shape': {shape_text}, }}"
+    padding = -(len(MAGIC) + 4 + len(text) + 1) % _ALIGNMENT
+    text = text + " " * padding + "\n"
+    return MAGIC + bytes((1, 0)) + len(text).to_bytes(2, "little") + text.encode("latin1")
+
+
+def _write_floats(f: BinaryIO, data: Union[array, memoryview]) -> None:
+    if _NATIVE_LITTLE:
+        f.write(memoryview(data).cast("B"))
+    else:
+        swapped = _float_copy(data)
+        swapped.byteswap()
+        f.write(swapped.tobytes())
@@ -0,0 +1,225 @@
+"""Multi-core 'Matrix' products and elementwise operations
+
+Large operations are split into row blocks (products) or contiguous
+element ranges (elementwise) and run on a concurrent.futures process
+pool. Operands and results travel through multiprocessing.shared_memory
+blocks, so only block names and bounds are pickled, never the data.
+
+Parallel mode is opt-in because it starts worker processes:
+
+    from PyMath import parallel
+
+    parallel.settings.enabled = True
+    parallel.settings.workers = 32
+
+Once enabled, Matrix @ and the elementwise operators switch to the pool
+by themselves when an operation is at least as large as the thresholds.
+Scripts that enable it on platforms that spawn workers (Windows, macOS)
+need the usual if __name__ == "__main__" guard.
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, List, Optional, Tuple, Union
+
+
+class ParallelSettings(object):
+    """Tunable parallel execution
+
+    Attributes:
+        enabled (bool): Use the process pool for large operations
+        workers (int): Worker processes, None for os.cpu_count()
+        matmul_threshold (int): Products go parallel once
+            rows * inner * cols reaches matmul_threshold ** 3
+        elementwise_threshold (int): Elementwise operations go parallel
+            from this many elements
+        blocks_per_worker (int): Blocks each worker gets on average,
+            more than 1 evens out uneven block times
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.workers = None
+        self.matmul_threshold = 192
+        self.elementwise_threshold = 1 << 20
+        self.blocks_per_worker = 2
+
+
+settings = ParallelSettings()
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+
+
+def worker_count() -> int:
+    return max(1, settings.workers or os.cpu_count() or 1)
+
+
+def use_for_matmul(rows: int, inner: int, cols: int) -> bool:
+    """True when settings route a rows x inner @ inner x cols product to the pool"""
+
+    return settings.enabled and rows > 1 and rows * inner * cols >= settings.matmul_threshold ** 3
+
+
+def use_for_elementwise(count: int) -> bool:
+    """True when settings route an elementwise operation over count elements to the pool"""
+
+    return settings.enabled and count >= settings.elementwise_threshold
+
+
+def shutdown() -> None:
+    """Stop the worker processes; the next parallel operation starts a new pool"""
+
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def matmul(a: array, b: array, rows: int, inner: int, cols: int) -> array:
+    """Multiply two flat row-major buffers on the pool, one block of rows per task
+
+    Every task multiplies its rows of a with all of b using the
+    single process 'blocked' kernel and writes straight into the
+    shared result block.
+
+    Returns:
+        array: rows x cols elements
+    """
+
+    with ExitStack() as stack:
+        shared_a = stack.enter_context(_SharedArray.copy_of(a))
+        shared_b = stack.enter_context(_SharedArray.copy_of(b))
+        shared_out = stack.enter_context(_SharedArray.empty(rows * cols))
+
+        tasks = [(shared_a.name, shared_b.name, shared_out.name, inner, cols, start, end)
+                 for start, end in _blocks(rows)]
+        for _ in _executor().map(_matmul_block, *zip(*tasks)):
+            pass
+        return shared_out.toarray()
+
+
+def elementwise(a: Union[array, memoryview], b: Union[array, memoryview, int, float],
+                op: Callable[[float, float], float]) -> array:
+    """Apply op between a and b (a buffer of the same length or a scalar) on the pool
+
+    Buffers can be array('d') or float64 memoryviews, i.e. memory-mapped
+    'Matrix' storage.
+
+    op has to be picklable, i.e. a function from the operator module.
+    """
+
+    with ExitStack() as stack:
+        shared_a = stack.enter_context(_SharedArray.copy_of(a))
+        shared_b = stack.enter_context(_SharedArray.copy_of(b)) if isinstance(b, (array, memoryview)) else None
+        shared_out = stack.enter_context(_SharedArray.empty(len(a)))
+
+        b_name, scalar = (shared_b.name, 0.0) if shared_b is not None else (None, b)
+        tasks = [(shared_a.name, b_name, scalar, shared_out.name, op, start, end)
+                 for start, end in _blocks(len(a))]
+        for _ in _executor().map(_elementwise_block, *zip(*tasks)):
+            pass
+        return shared_out.toarray()
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    workers = worker_count()
+    if _pool is None or _pool_workers != workers:
+        shutdown()
+        _pool, _pool_workers = ProcessPoolExecutor(max_workers=workers), workers
+    return _pool
+
+
+def _blocks(count: int) -> List[Tuple[int, int]]:
+    """Split range(count) into about workers * blocks_per_worker contiguous (start, end) blocks"""
+
+    parts = max(1, min(count, worker_count() * max(1, settings.blocks_per_worker)))
+    step, extra = divmod(count, parts)
+    bounds, start = [], 0
+    for part in range(parts):
+        end = start + step + (part < extra)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+class _SharedArray(object):
+    """Float64 shared memory block, owned (and unlinked) by the process that created it
+
+    Workers only attach to blocks by name. They share the parent's
+    resource tracker, which ignores their duplicate registrations.
+    """
+
+    def __init__(self, count: int):
+        self.count = count
+        self.memory = SharedMemory(create=True, size=max(8, 8 * count))
+        self.name = self.memory.name
+
+    @classmethod
+    def empty(cls, count: int) -> _SharedArray:
+        return cls(count)
+
+    @classmethod
+    def copy_of(cls, values: Union[array, memoryview]) -> _SharedArray:
+        shared = cls(len(values))
+        shared.memory.buf[:8 * len(values)] = memoryview(values).cast("B")
+        return shared
+
+    def toarray(self) -> array:
+        result = array("d")
+        result.frombytes(self.memory.buf[:8 * self.count])
+        return result
+
+    def __enter__(self) -> _SharedArray:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _matmul_block(a_name: str, b_name: str, out_name: str, inner: int, cols: int, start: int, end: int) -> None:
+    from PyMath.matmul import blocked
+
+    memories = [SharedMemory(name=name) for name in (a_name, b_name, out_name)]
+    try:
+        views = []
+        try:
+            views.extend(memory.buf.cast("d") for memory in memories)
+            a_view, b_view, out_view = views
+            a = array("d", a_view[start * inner:end * inner])
+            b = array("d", b_view[:inner * cols])
+            out_view[start * cols:end * cols] = memoryview(blocked(a, b, end - start, inner, cols))
+        finally:
+            # close() raises BufferError while a view is alive, hiding the real error
+            for view in views:
+                view.release()
+    finally:
+        for memory in memories:
+            memory.close()
+
+
+def _elementwise_block(a_name: str, b_name: Optional[str], scalar: float, out_name: str,
+                       op: Callable[[float, float], float], start: int, end: int) -> None:
+    memories = [SharedMemory(name=name) for name in (a_name, out_name, b_name) if name is not None]
+    try:
+        views, b_values = [], None
+        try:
+            views.extend(memory.buf.cast("d") for memory in memories)
+            a_view, out_view = views[0], views[1]
+            b_values = views[2][start:end] if b_name is not None else repeat(scalar)
+            out_view[start:end] = memoryview(array("d", map(op, a_view[start:end], b_values)))
+        finally:
+            del b_values  # A slice of a view has to go before the view is released
+            for view in views:
+                view.release()
+    finally:
+        for memory in memories:
+            memory.close()
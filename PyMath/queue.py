@@ -1,11 +1,27 @@
 from __future__ import annotations
-from typing import Optional, TypeVar, Iterable
+from typing import Any, Callable, Hashable, List, Optional, TypeVar, Iterable
+from collections import deque
+from concurrent.futures import Future
+from itertools import count
+import copy
+from threading import Condition, Lock
+import asyncio
+import heapq
 import time
-from threading import Thread
 
 
 T = TypeVar("T")
 
+ON_DUPLICATE = ("ignore", "update")
+
+
+class QueueTimeoutError(RuntimeError):
+    """Raised when a blocking pull times out before an item is pushed"""
+
+
+class QueueClosedError(RuntimeError):
+    """Raised when pushing to a closed AsyncQueue or pulling from a closed and empty one"""
+
 
 class Queue:
     """My own implementation of a Queue
@@ -14,74 +30,226 @@ class Queue:
      Each item is added to the end of the Queue and items are
      retrieved in reverse order. Meaning that the first item
      added will be get before the second item.
- 
+
+     Items live in a deque guarded by a Condition, so push and pull
+     are O(1) and a blocking pull wakes up as soon as an item is pushed.
+     Subclasses change the ordering by overriding _init, _qsize, _put,
+     _get, _keys and _swap, which are always called with the lock held,
+     and when items can be queued but not due yet, _ready and _wait.
+
+     push_many, pull_many and drain move a whole batch per lock round trip.
+
+     A unique Queue never holds two items with the same key. The deque
+     then holds the keys and a dict maps each key to its item, so the
+     duplicate check stays O(1) at any depth. key makes unhashable items
+     usable, i.e. Queue(unique=True, key=lambda job: job["id"]). Pushing a
+     duplicate is ignored, or with on_duplicate="update" replaces the
+     queued item while it keeps its place.
+
      """
 
-    def __init__(self, default: Optional[Iterable] = None, unique: Optional[bool] = False):
-        self.__unique = unique
-        self._collection: list = list(default) if default else list()
+    def __init__(self, default: Optional[Iterable] = None, unique: Optional[bool] = False,
+                 key: Optional[Callable[[T], Hashable]] = None, on_duplicate: Optional[str] = "ignore"):
+        if on_duplicate not in ON_DUPLICATE:
+            raise ValueError(f"on_duplicate should be one of {ON_DUPLICATE}. Found '{on_duplicate}' instead.")
+        self.__unique = unique or key is not None
+        self.__key = key
+        self.__update = on_duplicate == "update"
+        self._index: dict = {}
+        self._mutex = Lock()
+        self._not_empty = Condition(self._mutex)
+        self._init()
+        if default:
+            self.push_many(default)
 
     def push(self, item: T) -> None:
         """Put an item at the end of the Queue"""
 
-        if isinstance(item, (list, set, tuple)):
-            if not self.__unique:
-                self._collection.extend(item)
-            else:
-                [self._collection.append(item) for i in set(item) if i not in self._collection]
-        else:
-            if not self.__unique:
-                self._collection.append(item)
-            else:
-                if item not in self._collection:
-                    self._collection.append(item)
+        items = item if isinstance(item, (list, set, tuple)) else (item,)
+        with self._not_empty:
+            self._push(items)
 
-    def pull(self, blocking: Optional[bool] = False, timeout: Optional[int] = 0,
+    def push_many(self, items: Iterable[T]) -> None:
+        """Put every item at the end of the Queue, waking the waiting pulls once"""
+
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        with self._not_empty:
+            self._push(items)
+
+    def pull(self, blocking: Optional[bool] = False, timeout: Optional[float] = None,
              if_timeout_reached: Optional[type] = None, *args, **kwargs) -> T:
-        """Get the first item in the Queue if any"""
-        result = [None]  # Set local result for modification inside inner and return later
-
-        def b():
-            s = time.time()
-            while not self:
-                if timeout and time.time() - s > timeout:
-                    if if_timeout_reached:
-                        if_timeout_reached(args, kwargs)
-                    raise RuntimeError("Timeout Reached: ")
-                else:
-                    time.sleep(0.1)
-            result[0] = self._collection.pop(0)
+        """Get the first item in the Queue if any
+
+        A non blocking pull returns None when the Queue is empty. A blocking
+        pull waits for an item, at most timeout seconds, forever when timeout
+        is None and not at all when it is 0, like pull_many. On timeout if_timeout_reached(args, kwargs) is called and
+        QueueTimeoutError is raised.
+        """
+
+        with self._not_empty:
+            if self._ready():
+                return self.__take()
+            if blocking and timeout != 0 and self._wait(timeout):
+                return self.__take()
+
+        if blocking:
+            if if_timeout_reached:
+                if_timeout_reached(args, kwargs)
+            raise QueueTimeoutError(f"Timeout Reached: no item within {timeout} seconds")
+        return None
+
+    def pull_many(self, max_items: int, timeout: Optional[float] = None) -> list:
+        """Get up to max_items items at once
+
+        Only the first item is waited for, at most timeout seconds, forever
+        when timeout is None and not at all when it is 0. The rest are the
+        items that can be pulled right away.
+
+        Returns:
+            list: The items in pull order, empty if none came in time
+        """
 
-        t = Thread(target=b)
-        t.start()
-        if not blocking:
-            t.join()
-        return result[0] if result else None
+        items = []
+        with self._not_empty:
+            if max_items > 0 and (self._ready() or (timeout != 0 and self._wait(timeout))):
+                while len(items) < max_items and self._ready():
+                    items.append(self.__take())
+        return items
+
+    def drain(self) -> list:
+        """Remove and return every item in pull order
+
+        The storage is swapped for an empty one while the lock is held,
+        so pushes and pulls on other threads never wait on the copy.
+        """
+
+        with self._mutex:
+            keys = self._swap()
+            index = self._index
+            if self.__unique:
+                self._index = {}
+        return [index[k] for k in keys] if self.__unique else list(keys)
 
     def flush(self) -> Queue:
-        """Clear the Queue and return a new Queue of it's items"""
+        """Clear the Queue and return a new Queue of it's items
+
+        The new Queue has the same type and options and takes over the
+        storage as is, without copying or re-pushing any item.
+        """
+
+        with self._mutex:
+            flushed = copy.copy(self)
+            self._index = {}
+            self._init()
+        flushed._mutex = Lock()
+        flushed._not_empty = Condition(flushed._mutex)
+        return flushed
+
+    def _push(self, items: Iterable[T], *args) -> list:
+        """Queue items, passing args on to _put, the lock has to be held
+
+        Returns:
+            list: What _put returned for each item, None for duplicates
+        """
+
+        results = []
+        size = self._qsize()
+        if not self.__unique:
+            for i in items:
+                results.append(self._put(i, *args))
+        else:
+            index, key = self._index, self.__key
+            for i in items:
+                k = key(i) if key else i
+                if k not in index:
+                    index[k] = i
+                    results.append(self._put(k, *args))
+                else:
+                    if self.__update:
+                        index[k] = i
+                    results.append(None)
+        if self._qsize() > size:
+            self._not_empty.notify(self._qsize() - size)
+        return results
+
+    def __take(self) -> T:
+        """Remove and return the next item, the lock has to be held"""
+
+        if self.__unique:
+            return self._index.pop(self._get())
+        return self._get()
+
+    def _item(self, key: Hashable) -> T:
+        """Item queued under key, subclasses get keys in _put in unique mode"""
+
+        return self._index[key] if self.__unique else key
+
+    def _discard(self, key: Hashable) -> None:
+        """Forget key in unique mode once a subclass removed it by itself"""
+
+        if self.__unique:
+            del self._index[key]
+
+    def _init(self) -> None:
+        self._collection: deque = deque()
+
+    def _qsize(self) -> int:
+        return len(self._collection)
+
+    def _put(self, item: T) -> None:
+        self._collection.append(item)
+
+    def _get(self) -> T:
+        return self._collection.popleft()
+
+    def _keys(self) -> Iterable:
+        return self._collection
+
+    def _swap(self) -> Iterable:
+        """Replace the storage with an empty one, returning the old keys in pull order"""
 
-        return Queue([_ for _ in self])
+        keys = self._collection
+        self._init()
+        return keys
+
+    def _ready(self) -> bool:
+        return self._qsize() > 0
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        return self._not_empty.wait_for(self._ready, timeout)
 
     def __bool__(self):
-        return len(self._collection) > 0
+        return self._qsize() > 0
+
+    def __contains__(self, item: T) -> bool:
+        """True when item is queued, or in unique mode an item with the same key"""
+
+        with self._mutex:
+            if self.__unique:
+                return (self.__key(item) if self.__key else item) in self._index
+            return item in self._keys()
 
     def __str__(self):
-        return str("< {} >".format(" | ".join([str(x) for x in self._collection]) if len(self) else "Empty Q"))
-    
+        items = self._snapshot()
+        return str("< {} >".format(" | ".join([str(x) for x in items]) if items else "Empty Q"))
+
     def __repr__(self):
-        return repr(self._collection)
+        return repr(self._snapshot())
+
+    def _snapshot(self) -> list:
+        with self._mutex:
+            return [self._item(k) for k in self._keys()]
 
     def __len__(self):
-        return len(self._collection)
+        return self._qsize()
 
     def __iter__(self):
-        self.__pos = 0
         return self
 
     def __next__(self):
-        if self.__pos < len(self._collection):
-            return self.pull()
+        with self._not_empty:
+            if self._ready():
+                return self.__take()
         raise StopIteration
 
     def __getitem__(self, item: T):
@@ -89,3 +257,389 @@ class Queue:
 
     def __setitem__(self, key: str, value: T) -> None:
         raise NotImplementedError
+
+
+class QueueHandle:
+    """Handle to an item queued in a PriorityQueue or DelayQueue"""
+
+    __slots__ = ("_queue", "_heap", "_entry")
+
+    def __init__(self, queue: PriorityQueue, entry: list):
+        self._queue = queue
+        self._heap = queue._collection  # drain() and flush() hand the heap over, which ends the handle
+        self._entry = entry  # [priority, sequence, key, queued]
+
+    @property
+    def priority(self) -> Any:
+        """Current priority, the monotonic deadline for a DelayQueue"""
+        return self._entry[0]
+
+    def queued(self) -> bool:
+        """True until the item is pulled, cancelled, drained or flushed"""
+        return self._entry[3] and self._heap is self._queue._collection
+
+    def cancel(self) -> bool:
+        """Remove the item from its Queue, False if it was no longer queued"""
+
+        return self._queue._cancel(self)
+
+    def update(self, priority: Any) -> bool:
+        """Move the item to a new priority (or delay for a DelayQueue), i.e. decrease-key
+
+        Among equal priorities the item now counts as pushed last.
+
+        Returns:
+            bool: False if the item was no longer queued
+        """
+
+        return self._queue._reprioritize(self, priority)
+
+    def __repr__(self):
+        return f"QueueHandle(priority={self._entry[0]!r}, queued={self.queued()})"
+
+
+class PriorityQueue(Queue):
+    """Queue that pulls the item with the lowest priority first
+
+     Entries live in a binary heap, so push and pull are O(log n).
+     Items of equal priority come out in the order they were pushed.
+     The priority of an item is the priority passed to push, or else
+     priority(item), the item itself by default.
+
+         queue = PriorityQueue(priority=lambda event: event.time)
+         handle = queue.push(event)
+         handle.update(0)    # Decrease-key, O(log n)
+         handle.cancel()     # O(1)
+
+     Cancelled and re-prioritized entries are dropped lazily when they
+     reach the top of the heap, and the heap is rebuilt once they make
+     up more than half of it.
+
+     """
+
+    def __init__(self, default: Optional[Iterable] = None, unique: Optional[bool] = False,
+                 key: Optional[Callable[[T], Hashable]] = None, on_duplicate: Optional[str] = "ignore",
+                 priority: Optional[Callable[[T], Any]] = None):
+        self.__priority = priority
+        super().__init__(default, unique, key, on_duplicate)
+
+    def push(self, item: T, priority: Optional[Any] = None) -> Optional[QueueHandle]:
+        """Put a single item in the Queue
+
+        Unlike Queue.push, a list, set or tuple is one item, so tuple
+        records work with priority and key. Batches go through push_many.
+
+        Returns:
+            QueueHandle: The item's handle, None for an ignored duplicate
+        """
+
+        with self._not_empty:
+            return self._push((item,), priority)[0]
+
+    def push_many(self, items: Iterable[T], priority: Optional[Any] = None) -> List[Optional[QueueHandle]]:
+        """Put every item in the Queue, waking the waiting pulls once
+
+        Returns:
+            list: The handles, None for ignored duplicates
+        """
+
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        with self._not_empty:
+            return self._push(items, priority)
+
+    def _priority(self, item: T, priority: Optional[Any]) -> Any:
+        """Heap priority of item pushed with priority"""
+
+        if priority is not None:
+            return priority
+        return self.__priority(item) if self.__priority else item
+
+    def _init(self) -> None:
+        self._collection: list = []
+        self._sequence = count()
+        self._live = 0
+
+    def _qsize(self) -> int:
+        return self._live
+
+    def _put(self, item: Hashable, priority: Optional[Any] = None) -> QueueHandle:
+        entry = [self._priority(self._item(item), priority), next(self._sequence), item, True]
+        heapq.heappush(self._collection, entry)
+        self._live += 1
+        return QueueHandle(self, entry)
+
+    def _get(self) -> Hashable:
+        entry = self._head()
+        heapq.heappop(self._collection)
+        entry[3] = False
+        self._live -= 1
+        return entry[2]
+
+    def _keys(self) -> Iterable:
+        return [entry[2] for entry in sorted(entry for entry in self._collection if entry[3])]
+
+    def _swap(self) -> Iterable:
+        heap = self._collection
+        self._init()
+        # Sorted once the lock is released, the old entries are out of reach of their handles
+        return (entry[2] for entry in sorted(entry for entry in heap if entry[3]))
+
+    def _head(self) -> Optional[list]:
+        """Top live heap entry, dropping the stale ones above it"""
+
+        heap = self._collection
+        while heap and not heap[0][3]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _cancel(self, handle: QueueHandle) -> bool:
+        with self._mutex:
+            entry = handle._entry
+            if not entry[3] or handle._heap is not self._collection:
+                return False
+            entry[3] = False
+            self._live -= 1
+            self._discard(entry[2])
+            self.__compact()
+            return True
+
+    def _reprioritize(self, handle: QueueHandle, priority: Any) -> bool:
+        with self._not_empty:
+            entry = handle._entry
+            if not entry[3] or handle._heap is not self._collection:
+                return False
+            entry[3] = False
+            handle._entry = [self._priority(self._item(entry[2]), priority), next(self._sequence), entry[2], True]
+            heapq.heappush(self._collection, handle._entry)
+            self.__compact()
+            self._not_empty.notify()  # A DelayQueue waiter may have to wake up sooner
+            return True
+
+    def __compact(self) -> None:
+        if len(self._collection) > 2 * self._live + 64:
+            self._collection[:] = [entry for entry in self._collection if entry[3]]
+            heapq.heapify(self._collection)
+
+
+class DelayQueue(PriorityQueue):
+    """Queue whose items can only be pulled once their delay has passed
+
+     push(item, delay) makes item due delay seconds from now. Due items are
+     pulled earliest deadline first, and in push order for equal deadlines.
+     A blocking pull sleeps exactly until the next deadline, or until a push
+     brings one forward. len() counts every queued item, due or not, and a
+     non blocking pull returns None while nothing is due.
+
+     Deadlines use time.monotonic, handle.update(delay) sets a new delay
+     counted from now.
+
+     """
+
+    def __init__(self, default: Optional[Iterable] = None, unique: Optional[bool] = False,
+                 key: Optional[Callable[[T], Hashable]] = None, on_duplicate: Optional[str] = "ignore"):
+        super().__init__(default, unique, key, on_duplicate)
+
+    def push(self, item: T, delay: Optional[float] = 0.0) -> Optional[QueueHandle]:
+        """Put a single item in the Queue, due in delay seconds, see PriorityQueue.push"""
+
+        return super().push(item, delay)
+
+    def push_many(self, items: Iterable[T], delay: Optional[float] = 0.0) -> List[Optional[QueueHandle]]:
+        """Put every item in the Queue, due in delay seconds, waking the waiting pulls once"""
+
+        return super().push_many(items, delay)
+
+    def drain(self) -> list:
+        """Remove and return every item that is due, earliest deadline first"""
+
+        items = []
+        with self._mutex:
+            while self._ready():
+                key = self._get()
+                items.append(self._item(key))
+                self._discard(key)
+        return items
+
+    def _priority(self, item: T, priority: Optional[float]) -> float:
+        return time.monotonic() + (priority or 0.0)
+
+    def _ready(self) -> bool:
+        head = self._head()
+        return head is not None and head[0] <= time.monotonic()
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        end = None if timeout is None else time.monotonic() + timeout
+        while not self._ready():
+            now = time.monotonic()
+            head = self._head()
+            wait = None if head is None else head[0] - now
+            if end is not None:
+                if end <= now:
+                    return False
+                wait = end - now if wait is None else min(wait, end - now)
+            self._not_empty.wait(wait)
+        return True
+
+
+class AsyncQueue:
+    """Queue for asyncio tasks
+
+     Same ordering and unique semantics as Queue, but waiting is done by
+     awaiting, so thousands of coroutines can share one queue without a
+     thread each.
+
+         queue = AsyncQueue(maxsize=1000)
+         await queue.push(job)              # Waits while the queue is full
+         job = await queue.pull(timeout=5)  # Waits for an item
+         async for job in queue: ...        # Ends once close() was called and the queue is empty
+
+     push_threadsafe feeds the queue from other threads. The queue is bound
+     to loop, else the event loop it was created in, or else the first one
+     that awaits it. A queue created outside of a running loop needs loop=
+     for producer threads that may start before any coroutine awaits it.
+
+     """
+
+    def __init__(self, default: Optional[Iterable] = None, unique: Optional[bool] = False,
+                 key: Optional[Callable[[T], Hashable]] = None, on_duplicate: Optional[str] = "ignore",
+                 maxsize: Optional[int] = 0, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._queue = Queue(default, unique, key, on_duplicate)
+        self._unique = unique or key is not None
+        self.maxsize = maxsize
+        self._getters: deque = deque()
+        self._putters: deque = deque()
+        self._closed = False
+        self._loop = loop
+        if loop is None:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+
+    async def push(self, item: T) -> None:
+        """Put an item at the end of the Queue, waiting while it is full
+
+        Raises:
+            QueueClosedError: If the Queue is closed
+        """
+
+        items = item if isinstance(item, (list, set, tuple)) else (item,)
+        for i in items:
+            # A unique duplicate doesn't take up room, `in` is a key lookup then
+            while not self._closed and self.full() and not (self._unique and i in self._queue):
+                await self.__wait(self._putters, None)
+            if self._closed:
+                raise QueueClosedError("Can't push to a closed Queue")
+            self._queue.push((i,))
+            self.__wake(self._getters)
+
+    async def pull(self, timeout: Optional[float] = None) -> T:
+        """Get the first item in the Queue, waiting for one if it is empty
+
+        Raises:
+            QueueTimeoutError: If no item was pushed within timeout seconds
+            QueueClosedError: If the Queue is closed and empty
+        """
+
+        deadline = None if timeout is None else self.__bind().time() + timeout
+        while not self._queue:
+            if self._closed:
+                raise QueueClosedError("Queue is closed and empty")
+            await self.__wait(self._getters, deadline, timeout)
+        return self.pull_nowait()
+
+    def pull_nowait(self) -> Optional[T]:
+        """Get the first item in the Queue if any, None when it is empty"""
+
+        item = self._queue.pull()
+        self.__wake(self._putters)
+        return item
+
+    def push_threadsafe(self, item: T) -> Future:
+        """Push from any thread
+
+        Returns:
+            Future: concurrent.futures.Future done once the item is queued,
+                result() blocks the calling thread while the Queue is full
+
+        Raises:
+            RuntimeError: If the Queue has no event loop yet, pass loop= when
+                it is created outside of one
+        """
+
+        if self._loop is None:
+            raise RuntimeError("AsyncQueue is not bound to an event loop yet, create it with loop=")
+        return asyncio.run_coroutine_threadsafe(self.push(item), self._loop)
+
+    def close(self) -> None:
+        """Stop accepting items, pulls still get the queued ones"""
+
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                self.__wake(waiters)
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._queue)
+
+    def __bind(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    async def __wait(self, waiters: deque, deadline: Optional[float], timeout: Optional[float] = None) -> None:
+        """Wait for __wake on waiters, or until the loop time deadline"""
+
+        loop = self.__bind()
+        waiter = loop.create_future()
+        waiters.append(waiter)
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            await asyncio.wait_for(waiter, remaining)
+        except BaseException as error:
+            # A wake-up this waiter can't use anymore goes to the next one
+            if waiter.done() and not waiter.cancelled():
+                self.__wake(waiters)
+            if isinstance(error, asyncio.TimeoutError):
+                raise QueueTimeoutError(f"Timeout Reached: no item within {timeout} seconds") from None
+            raise
+        finally:
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    @staticmethod
+    def __wake(waiters: deque) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> T:
+        try:
+            return await self.pull()
+        except QueueClosedError:
+            raise StopAsyncIteration from None
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._queue
+
+    def __bool__(self):
+        return bool(self._queue)
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __str__(self):
+        return str(self._queue)
+
+    def __repr__(self):
+        return repr(self._queue)
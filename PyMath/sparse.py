@@ -0,0 +1,429 @@
+"""Sparse matrices that interoperate with 'Matrix'
+
+COOMatrix collects (row, col, value) triples in any order and is meant
+for building. CSRMatrix (compressed sparse rows) is the compute format:
+row i's non-zeros are data[indptr[i]:indptr[i + 1]] at columns
+indices[indptr[i]:indptr[i + 1]], sorted by column. Every product and
+elementwise operation runs in time proportional to the non-zeros it
+touches, never to rows * cols.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import add, sub, mul, truediv, neg
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from PyMath.matrix import Matrix
+from PyMath.vector import BaseVector, Vector
+
+
+class COOMatrix(object):
+    """Coordinate format builder
+
+    Triples may be appended in any order and the same (row, col) may
+    appear more than once; duplicates are summed by tocsr().
+    """
+
+    def __init__(self, shape: Tuple[int, int], rows: Iterable[int] = (), cols: Iterable[int] = (),
+                 values: Iterable[float] = ()):
+        self._shape = tuple(shape)
+        self._rows = array("q", rows)
+        self._cols = array("q", cols)
+        self._values = array("d", values)
+        if not len(self._rows) == len(self._cols) == len(self._values):
+            raise ValueError("rows, cols and values should have the same length")
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored triples, duplicates included"""
+        return len(self._values)
+
+    def append(self, row: int, col: int, value: float) -> None:
+        """Store value at (row, col), adding to any value already stored there"""
+
+        if not (0 <= row < self._shape[0] and 0 <= col < self._shape[1]):
+            raise IndexError("COOMatrix index out of range")
+        self._rows.append(row)
+        self._cols.append(col)
+        self._values.append(value)
+
+    def extend(self, triples: Iterable[Tuple[int, int, float]]) -> None:
+        """Append every (row, col, value) triple"""
+
+        for row, col, value in triples:
+            self.append(row, col, value)
+
+    def tocsr(self) -> CSRMatrix:
+        """Return the triples compressed into a CSRMatrix, summing duplicates and dropping zeros"""
+
+        n_rows, n_cols = self._shape
+        rows, cols, values = self._rows, self._cols, self._values
+        order = sorted(range(len(values)), key=lambda k: rows[k] * n_cols + cols[k])
+
+        row_of, indices, data = [], [], []
+        last = -1
+        for k in order:
+            position = rows[k] * n_cols + cols[k]
+            if position == last:
+                data[-1] += values[k]
+                continue
+            row_of.append(rows[k])
+            indices.append(cols[k])
+            data.append(values[k])
+            last = position
+
+        kept = [n for n, value in enumerate(data) if value]
+        indptr = array("q", bytes(8 * (n_rows + 1)))
+        for n in kept:
+            indptr[row_of[n] + 1] += 1
+        for i in range(n_rows):
+            indptr[i + 1] += indptr[i]
+        return CSRMatrix(self._shape, indptr, (indices[n] for n in kept), (data[n] for n in kept))
+
+    def todense(self) -> Matrix:
+        return self.tocsr().todense()
+
+    def __repr__(self):
+        return f"COOMatrix(shape={self._shape}, nnz={self.nnz})"
+
+
+class CSRMatrix(object):
+    """Compressed sparse row matrix
+
+    Supports sparse @ sparse, sparse @ 'Matrix', 'Matrix' @ sparse and
+    sparse @ 'Vector', transposed(), elementwise + - * / and conversion
+    to and from 'Matrix' with todense() / from_dense().
+
+    Elementwise results stay sparse whenever they can: sparse +- sparse,
+    sparse * anything and sparse / scalar. Adding a scalar or a 'Matrix'
+    fills every element, so those return a dense 'Matrix'.
+    """
+
+    def __init__(self, shape: Tuple[int, int], indptr: Iterable[int], indices: Iterable[int],
+                 data: Iterable[float]):
+        self._shape = tuple(shape)
+        self._indptr = array("q", indptr)
+        self._indices = array("q", indices)
+        self._data = array("d", data)
+        if len(self._indptr) != self._shape[0] + 1 or len(self._indices) != len(self._data):
+            raise ValueError("indptr should have rows + 1 entries and indices one entry per value")
+
+    @classmethod
+    def _from_rows(cls, shape: Tuple[int, int], rows: Iterable[Tuple[Sequence[int], Sequence[float]]]) -> CSRMatrix:
+        """Build from one (sorted columns, values) pair per row without copying through COO"""
+
+        new_matrix = cls.__new__(cls)
+        new_matrix._shape = shape
+        indptr, indices, data = array("q", [0]), array("q"), array("d")
+        for cols, values in rows:
+            indices.extend(cols)
+            data.extend(values)
+            indptr.append(len(data))
+        new_matrix._indptr, new_matrix._indices, new_matrix._data = indptr, indices, data
+        return new_matrix
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix, tolerance: float = 0.0) -> CSRMatrix:
+        """Return the elements of matrix whose magnitude is above tolerance as a CSRMatrix"""
+
+        n_rows, n_cols = matrix.size()
+        storage = matrix._components
+
+        def rows():
+            for i in range(0, n_rows * n_cols, n_cols):
+                row = storage[i:i + n_cols]
+                cols = [j for j, value in enumerate(row) if abs(value) > tolerance]
+                yield cols, [row[j] for j in cols]
+        return cls._from_rows((n_rows, n_cols), rows())
+
+    @classmethod
+    def identity(cls, size: int) -> CSRMatrix:
+        return cls((size, size), range(size + 1), range(size), repeat(1.0, size))
+
+    def rows(self) -> int:
+        """Getter for rows"""
+        return self._shape[0]
+
+    def cols(self) -> int:
+        """Getter for cols"""
+        return self._shape[1]
+
+    def size(self) -> Tuple[int, int]:
+        """Getter for size"""
+        return self._shape
+
+    shape = property(size)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored non-zero elements"""
+        return len(self._data)
+
+    @property
+    def density(self) -> float:
+        """Fraction of elements that are stored"""
+        return self.nnz / (self._shape[0] * self._shape[1]) if self._shape[0] and self._shape[1] else 0.0
+
+    def row_items(self, index: int) -> List[Tuple[int, float]]:
+        """Return the (col, value) pairs stored in row index"""
+
+        start, end = self.__row_range(index)
+        return list(zip(self._indices[start:end], self._data[start:end]))
+
+    def tocoo(self) -> COOMatrix:
+        rows = array("q")
+        for i in range(self._shape[0]):
+            rows.extend(repeat(i, self._indptr[i + 1] - self._indptr[i]))
+        return COOMatrix(self._shape, rows, self._indices, self._data)
+
+    def todense(self) -> Matrix:
+        """Return a new dense 'Matrix' holding the same elements"""
+
+        n_rows, n_cols = self._shape
+        storage = array("d", bytes(8 * n_rows * n_cols))
+        indptr, indices, data = self._indptr, self._indices, self._data
+        for i in range(n_rows):
+            offset = i * n_cols
+            for k in range(indptr[i], indptr[i + 1]):
+                storage[offset + indices[k]] = data[k]
+        return Matrix._from_buffer((n_rows, n_cols), storage)
+
+    def copy(self) -> CSRMatrix:
+        return CSRMatrix(self._shape, self._indptr, self._indices, self._data)
+
+    def transposed(self) -> CSRMatrix:
+        """Return the transpose with a counting sort over the non-zeros, O(nnz + cols)"""
+
+        n_rows, n_cols = self._shape
+        indptr, indices, data = self._indptr, self._indices, self._data
+
+        counts = array("q", bytes(8 * (n_cols + 1)))
+        for j in indices:
+            counts[j + 1] += 1
+        for j in range(n_cols):
+            counts[j + 1] += counts[j]
+
+        new_indptr = array("q", counts)
+        new_indices = array("q", bytes(8 * len(data)))
+        new_data = array("d", bytes(8 * len(data)))
+        for i in range(n_rows):
+            for k in range(indptr[i], indptr[i + 1]):
+                position = counts[indices[k]]
+                new_indices[position] = i
+                new_data[position] = data[k]
+                counts[indices[k]] = position + 1
+        return CSRMatrix((n_cols, n_rows), new_indptr, new_indices, new_data)
+
+    def __row_range(self, index: int) -> Tuple[int, int]:
+        if index < 0:
+            index += self._shape[0]
+        if not 0 <= index < self._shape[0]:
+            raise IndexError("CSRMatrix row index out of range")
+        return self._indptr[index], self._indptr[index + 1]
+
+    def __getitem__(self, index: Union[Tuple[int, int], int]) -> Union[float, Vector]:
+        """Get an element with m[i, j] or a dense copy of a row with m[i]"""
+
+        if isinstance(index, tuple):
+            i, j = index
+            if j < 0:
+                j += self._shape[1]
+            if not 0 <= j < self._shape[1]:
+                raise IndexError("CSRMatrix column index out of range")
+            start, end = self.__row_range(i)
+            k = bisect_left(self._indices, j, start, end)
+            return self._data[k] if k < end and self._indices[k] == j else 0.0
+
+        row = [0.0] * self._shape[1]
+        for j, value in self.row_items(index):
+            row[j] = value
+        return Vector(*row)
+
+    def __eq__(self, other: CSRMatrix) -> bool:
+        if isinstance(other, CSRMatrix):
+            return (self._shape == other._shape and self._indptr == other._indptr
+                    and self._indices == other._indices and self._data == other._data)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self._shape}, nnz={self.nnz})"
+
+    def __str__(self):
+        return str(self.todense())
+
+    def __check_size(self, other: Union[CSRMatrix, Matrix]) -> None:
+        if self._shape != tuple(other.size()):
+            raise Matrix.Exceptions.MatrixSizeError(self, other)
+
+    def __merge(self, other: CSRMatrix, op, intersect: bool = False) -> CSRMatrix:
+        """op(a, b) over the union (or intersection) of both sparsity patterns, missing elements read as 0"""
+
+        self.__check_size(other)
+
+        def rows():
+            for i in range(self._shape[0]):
+                start, end = self._indptr[i], self._indptr[i + 1]
+                mine = dict(zip(self._indices[start:end], self._data[start:end]))
+                start, end = other._indptr[i], other._indptr[i + 1]
+                theirs = dict(zip(other._indices[start:end], other._data[start:end]))
+
+                keys = mine.keys() & theirs.keys() if intersect else mine.keys() | theirs.keys()
+                values = [(j, op(mine.get(j, 0.0), theirs.get(j, 0.0))) for j in sorted(keys)]
+                kept = [(j, value) for j, value in values if value]
+                yield [j for j, _ in kept], [value for _, value in kept]
+        return CSRMatrix._from_rows(self._shape, rows())
+
+    def __scaled(self, values: Iterable[float]) -> CSRMatrix:
+        """Same sparsity pattern with new values, explicit zeros dropped"""
+
+        data = array("d", values)
+        if all(data):
+            return CSRMatrix(self._shape, self._indptr, self._indices, data)
+
+        def rows():
+            for i in range(self._shape[0]):
+                start, end = self._indptr[i], self._indptr[i + 1]
+                kept = [k for k in range(start, end) if data[k]]
+                yield [self._indices[k] for k in kept], [data[k] for k in kept]
+        return CSRMatrix._from_rows(self._shape, rows())
+
+    def __dense_values(self, matrix: Matrix) -> List[float]:
+        """matrix's elements at every stored position, in storage order"""
+
+        storage, n_cols = matrix._components, self._shape[1]
+        return [storage[i * n_cols + self._indices[k]]
+                for i in range(self._shape[0]) for k in range(self._indptr[i], self._indptr[i + 1])]
+
+    def __neg__(self) -> CSRMatrix:
+        return CSRMatrix(self._shape, self._indptr, self._indices, map(neg, self._data))
+
+    def __add__(self, other: Union[CSRMatrix, Matrix, int, float]) -> Union[CSRMatrix, Matrix]:
+        """Sparse + sparse stays sparse, + Matrix or + scalar returns a dense 'Matrix'"""
+
+        if isinstance(other, CSRMatrix):
+            return self.__merge(other, add)
+        elif isinstance(other, (Matrix, int, float)):
+            return self.todense() + other
+        raise Matrix.Exceptions.MatrixMathError(other)
+
+    def __sub__(self, other: Union[CSRMatrix, Matrix, int, float]) -> Union[CSRMatrix, Matrix]:
+        """Sparse - sparse stays sparse, - Matrix or - scalar returns a dense 'Matrix'"""
+
+        if isinstance(other, CSRMatrix):
+            return self.__merge(other, sub)
+        elif isinstance(other, (Matrix, int, float)):
+            return self.todense() - other
+        raise Matrix.Exceptions.MatrixMathError(other)
+
+    def __mul__(self, other: Union[CSRMatrix, Matrix, int, float]) -> CSRMatrix:
+        """Element-wise multiplication, always sparse"""
+
+        if isinstance(other, CSRMatrix):
+            return self.__merge(other, mul, intersect=True)
+        elif isinstance(other, Matrix):
+            self.__check_size(other)
+            return self.__scaled(map(mul, self._data, self.__dense_values(other)))
+        elif isinstance(other, (int, float)):
+            return self.__scaled(map(mul, self._data, repeat(other)))
+        raise Matrix.Exceptions.MatrixMathError(other)
+
+    def __truediv__(self, other: Union[int, float]) -> CSRMatrix:
+        """Element-wise division by a scalar"""
+
+        if isinstance(other, (int, float)):
+            return self.__scaled(map(truediv, self._data, repeat(other)))
+        raise Matrix.Exceptions.MatrixMathError(other)
+
+    def __radd__(self, other: Union[Matrix, int, float]) -> Matrix:
+        return self + other
+
+    def __rsub__(self, other: Union[Matrix, int, float]) -> Matrix:
+        return -self + other
+
+    def __rmul__(self, other: Union[Matrix, int, float]) -> CSRMatrix:
+        return self * other
+
+    def __matmul__(self, other: Union[CSRMatrix, Matrix, Vector, Sequence[float]]) -> Union[CSRMatrix, Matrix, Vector]:
+        """Sparse @ sparse returns a CSRMatrix, sparse @ Matrix a 'Matrix' and sparse @ Vector a 'Vector'"""
+
+        if isinstance(other, CSRMatrix):
+            return self.__sparse_product(other)
+        elif isinstance(other, Matrix):
+            return self.__dense_product(other)
+        elif isinstance(other, (BaseVector, list, tuple, array)):
+            return Vector(*self.__vector_product(other))
+        raise Matrix.Exceptions.MatrixMultiplicationError(other)
+
+    def __rmatmul__(self, other: Matrix) -> Matrix:
+        """Matrix @ sparse, scattering every non-zero of the dense rows into the result"""
+
+        if not isinstance(other, Matrix):
+            raise Matrix.Exceptions.MatrixMultiplicationError(other)
+        if other.cols() != self._shape[0]:
+            raise Matrix.Exceptions.MatrixSizeError(other, self)
+
+        n_rows, inner, n_cols = other.rows(), self._shape[0], self._shape[1]
+        storage, indptr, indices, data = other._components, self._indptr, self._indices, self._data
+        result = array("d", bytes(8 * n_rows * n_cols))
+        for i in range(n_rows):
+            row = [0.0] * n_cols
+            for k, scale in enumerate(storage[i * inner:(i + 1) * inner]):
+                if scale:
+                    for position in range(indptr[k], indptr[k + 1]):
+                        row[indices[position]] += scale * data[position]
+            result[i * n_cols:(i + 1) * n_cols] = array("d", row)
+        return Matrix._from_buffer((n_rows, n_cols), result)
+
+    def __vector_product(self, vector: Sequence[float]) -> List[float]:
+        if len(vector) != self._shape[1]:
+            raise ValueError(f"Vector should have {self._shape[1]} elements. Found {len(vector)} instead.")
+
+        values = list(vector)
+        indptr, indices, data = self._indptr, self._indices, self._data
+        return [sum(map(mul, data[indptr[i]:indptr[i + 1]], map(values.__getitem__, indices[indptr[i]:indptr[i + 1]])))
+                for i in range(self._shape[0])]
+
+    def __dense_product(self, other: Matrix) -> Matrix:
+        if self._shape[1] != other.rows():
+            raise Matrix.Exceptions.MatrixSizeError(self, other)
+
+        n_rows, n_cols = self._shape[0], other.cols()
+        storage, indptr, indices, data = other._components, self._indptr, self._indices, self._data
+        result = array("d", bytes(8 * n_rows * n_cols))
+        for i in range(n_rows):
+            row = None
+            for k in range(indptr[i], indptr[i + 1]):
+                offset = indices[k] * n_cols
+                scaled = map(mul, storage[offset:offset + n_cols], repeat(data[k]))
+                row = array("d", scaled if row is None else map(add, row, scaled))
+            if row is not None:
+                result[i * n_cols:(i + 1) * n_cols] = row
+        return Matrix._from_buffer((n_rows, n_cols), result)
+
+    def __sparse_product(self, other: CSRMatrix) -> CSRMatrix:
+        """Gustavson's row-by-row product with a dict accumulator per row"""
+
+        if self._shape[1] != other._shape[0]:
+            raise Matrix.Exceptions.MatrixSizeError(self, other)
+
+        a_indptr, a_indices, a_data = self._indptr, self._indices, self._data
+        b_indptr, b_indices, b_data = other._indptr, other._indices, other._data
+
+        def rows():
+            for i in range(self._shape[0]):
+                accumulator = {}
+                get = accumulator.get
+                for k in range(a_indptr[i], a_indptr[i + 1]):
+                    scale, start, end = a_data[k], b_indptr[a_indices[k]], b_indptr[a_indices[k] + 1]
+                    for j, value in zip(b_indices[start:end], b_data[start:end]):
+                        accumulator[j] = get(j, 0.0) + scale * value
+                cols = sorted(j for j, value in accumulator.items() if value)
+                yield cols, [accumulator[j] for j in cols]
+        return CSRMatrix._from_rows((self._shape[0], other._shape[1]), rows())
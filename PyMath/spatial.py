@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+from heapq import heappush, heappushpop, nsmallest
+from itertools import count, product
+from math import floor
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from PyMath.vector import Vector
+
+Point = Union[Vector, Tuple[float, ...]]
+
+
+def _distance_sq(a: Tuple[float, ...], b: Tuple[float, ...]) -> float:
+    return sum((i - j) * (i - j) for i, j in zip(a, b))
+
+
+class HashGrid(object):
+    """
+    Uniform spatial hash grid for dynamic scenes.
+
+    Every entry is bucketed by the grid cell its position falls in,
+    so insert, move and remove are O(1) and neighbor queries only
+    look at the cells overlapping the query area. cell_size should
+    be close to the typical query radius.
+    """
+
+    def __init__(self, cell_size: float, positions: Optional[Iterable[Point]] = None) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than 0")
+
+        self._inverse = 1.0 / cell_size
+        self._cell_size = cell_size
+        self._cells: Dict[tuple, set] = {}
+        self._entries: Dict[Hashable, tuple] = {}  # key -> (point, coords, cell)
+        self._keys = count()
+
+        if positions is not None:
+            self.build(positions)
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def build(self, positions: Iterable[Point]) -> None:
+        """
+        Replace the grid contents with positions, keyed by their index
+        """
+
+        self.clear()
+        for position in positions:
+            self.insert(position)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._entries.clear()
+        self._keys = count()
+
+    def insert(self, position: Point, key: Optional[Hashable] = None) -> Hashable:
+        """
+        Add position to the grid and return its key. When key is omitted
+        the next free integer index is used.
+        """
+
+        if key is None:
+            key = next(self._keys)
+            while key in self._entries:
+                key = next(self._keys)
+        elif key in self._entries:
+            raise KeyError(f"Key {key!r} is already in the grid")
+
+        coords = tuple(position)
+        cell = self._cell(coords)
+        self._entries[key] = (position, coords, cell)
+        self._cells.setdefault(cell, set()).add(key)
+        return key
+
+    def move(self, key: Hashable, position: Point) -> None:
+        """
+        Update the position stored under key
+        """
+
+        _, _, old_cell = self._entries[key]
+        coords = tuple(position)
+        cell = self._cell(coords)
+        self._entries[key] = (position, coords, cell)
+
+        if cell != old_cell:
+            self._discard(old_cell, key)
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove the position stored under key
+        """
+
+        _, _, cell = self._entries.pop(key)
+        self._discard(cell, key)
+
+    def position(self, key: Hashable) -> Point:
+        return self._entries[key][0]
+
+    def query_radius(self, center: Point, radius: float,
+                     return_indices: bool = False) -> List[Union[Point, Hashable]]:
+        """
+        Return every position within radius of center
+        """
+
+        center = tuple(center)
+        radius_sq = radius * radius
+        low = self._cell(tuple(c - radius for c in center))
+        high = self._cell(tuple(c + radius for c in center))
+
+        result = []
+        for cell in product(*(range(lo, hi + 1) for lo, hi in zip(low, high))):
+            for key in self._cells.get(cell, ()):
+                position, coords, _ = self._entries[key]
+                if _distance_sq(coords, center) <= radius_sq:
+                    result.append(key if return_indices else position)
+        return result
+
+    def k_nearest(self, center: Point, k: int,
+                  return_indices: bool = False) -> List[Union[Point, Hashable]]:
+        """
+        Return the k positions closest to center, nearest first.
+
+        Rings of cells are searched outwards from the center cell until
+        the k-th candidate is closer than any unsearched cell can be.
+        """
+
+        if k <= 0:
+            return []
+
+        center = tuple(center)
+        origin = self._cell(center)
+        candidates = []  # (distance_sq, key)
+        seen = 0
+        ring = 0
+
+        while seen < len(self._entries):
+            if (2 * ring + 1) ** len(origin) > len(self._cells):
+                # The ring has outgrown the occupied cells; scanning every entry is cheaper
+                candidates = [(_distance_sq(coords, center), key)
+                              for key, (_, coords, _) in self._entries.items()]
+                break
+
+            for cell in self._ring(origin, ring):
+                for key in self._cells.get(cell, ()):
+                    candidates.append((_distance_sq(self._entries[key][1], center), key))
+                    seen += 1
+
+            covered = ring * self._cell_size
+            if len(candidates) >= k and nsmallest(k, candidates)[-1][0] <= covered * covered:
+                break
+            ring += 1
+
+        return [key if return_indices else self._entries[key][0] for _, key in nsmallest(k, candidates)]
+
+    def _cell(self, coords: Tuple[float, ...]) -> tuple:
+        inverse = self._inverse
+        return tuple(floor(c * inverse) for c in coords)
+
+    def _discard(self, cell: tuple, key: Hashable) -> None:
+        bucket = self._cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[cell]
+
+    @staticmethod
+    def _ring(origin: tuple, ring: int):
+        """
+        Yield the cells whose Chebyshev distance to origin is exactly ring
+        """
+
+        if not ring:
+            yield origin
+            return
+
+        for offset in product(range(-ring, ring + 1), repeat=len(origin)):
+            if max(abs(o) for o in offset) == ring:
+                yield tuple(o + c for o, c in zip(offset, origin))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+class KDTree(object):
+    """
+    k-d tree for mostly static scenes.
+
+    The tree is bulk built with median splits. Inserts attach new
+    leaves and removals leave tombstones; the tree rebuilds itself
+    once those changes outnumber the size of the last build or an
+    insert lands too deep. A node is live only while the entry of its
+    key still points at that very node, so a key moved back to an
+    earlier position never matches its old tombstone.
+    """
+
+    def __init__(self, positions: Optional[Iterable[Point]] = None) -> None:
+        self._entries: Dict[Hashable, tuple] = {}  # key -> (point, coords, node)
+        self._root = None
+        self._dimensions = 0
+        self._keys = count()
+        self._stale = 0  # inserts and removals since the last build
+        self._built_size = 0
+
+        if positions is not None:
+            self.build(positions)
+
+    def build(self, positions: Iterable[Point]) -> None:
+        """
+        Replace the tree contents with positions, keyed by their index
+        """
+
+        self._entries = {}
+        self._keys = count()
+        for position in positions:
+            self._entries[next(self._keys)] = (position, tuple(position), None)
+        self._rebuild()
+
+    def insert(self, position: Point, key: Optional[Hashable] = None) -> Hashable:
+        """
+        Add position to the tree and return its key. When key is omitted
+        the next free integer index is used.
+        """
+
+        if key is None:
+            key = next(self._keys)
+            while key in self._entries:
+                key = next(self._keys)
+        elif key in self._entries:
+            raise KeyError(f"Key {key!r} is already in the tree")
+
+        coords = tuple(position)
+        self._entries[key] = (position, coords, None)
+        self._stale += 1
+
+        if self._root is None or self._stale > self._built_size:
+            self._rebuild()
+            return key
+
+        node = self._root
+        max_depth = 2 * self._built_size.bit_length() + 8
+        for _ in range(max_depth):
+            axis = node[2]
+            side = 3 if coords[axis] < node[1][axis] else 4
+            if node[side] is None:
+                node[side] = [key, coords, (axis + 1) % self._dimensions, None, None]
+                self._entries[key] = (position, coords, node[side])
+                return key
+            node = node[side]
+
+        self._rebuild()  # Inserts have unbalanced the tree
+        return key
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove the position stored under key
+        """
+
+        del self._entries[key]
+        self._stale += 1
+        if self._stale > self._built_size:
+            self._rebuild()
+
+    def move(self, key: Hashable, position: Point) -> None:
+        """
+        Update the position stored under key
+        """
+
+        self.remove(key)
+        self.insert(position, key)
+
+    def position(self, key: Hashable) -> Point:
+        return self._entries[key][0]
+
+    def query_radius(self, center: Point, radius: float,
+                     return_indices: bool = False) -> List[Union[Point, Hashable]]:
+        """
+        Return every position within radius of center
+        """
+
+        center = tuple(center)
+        radius_sq = radius * radius
+        entries = self._entries
+        result = []
+        stack = [self._root] if self._root is not None else []
+
+        while stack:
+            node = stack.pop()
+            key, coords, axis, left, right = node
+            entry = entries.get(key)
+            if entry is not None and entry[2] is node and _distance_sq(coords, center) <= radius_sq:
+                result.append(key if return_indices else entry[0])
+
+            delta = center[axis] - coords[axis]
+            if left is not None and delta - radius <= 0:
+                stack.append(left)
+            if right is not None and delta + radius >= 0:
+                stack.append(right)
+        return result
+
+    def k_nearest(self, center: Point, k: int,
+                  return_indices: bool = False) -> List[Union[Point, Hashable]]:
+        """
+        Return the k positions closest to center, nearest first
+        """
+
+        center = tuple(center)
+        entries = self._entries
+        best = []  # max-heap of (-distance_sq, tiebreak, key)
+        tiebreak = count()
+
+        def search(node):
+            key, coords, axis, left, right = node
+            entry = entries.get(key)
+            if entry is not None and entry[2] is node:
+                item = (-_distance_sq(coords, center), next(tiebreak), key)
+                if len(best) < k:
+                    heappush(best, item)
+                elif item > best[0]:
+                    heappushpop(best, item)
+
+            delta = center[axis] - coords[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            if near is not None:
+                search(near)
+            if far is not None and (len(best) < k or delta * delta <= -best[0][0]):
+                search(far)
+
+        if self._root is not None and k > 0:
+            search(self._root)
+
+        return [key if return_indices else entries[key][0] for _, _, key in sorted(best, reverse=True)]
+
+    def _rebuild(self) -> None:
+        items = [(key, coords) for key, (_, coords, _) in self._entries.items()]
+        self._dimensions = len(items[0][1]) if items else 0
+        self._root = self._build(items, 0) if items else None
+        self._built_size = len(items)
+        self._stale = 0
+
+    def _build(self, items: list, depth: int) -> Optional[list]:
+        if not items:
+            return None
+
+        axis = depth % self._dimensions
+        items.sort(key=lambda item: item[1][axis])
+        median = len(items) // 2
+        key, coords = items[median]
+        node = [key, coords, axis, self._build(items[:median], depth + 1), self._build(items[median + 1:], depth + 1)]
+        self._entries[key] = (self._entries[key][0], coords, node)
+        return node
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Union
+
+from PyMath.fixed_matrix import Matrix4
+from PyMath.vector import Vector3
+from PyMath.vector_array import Vector3Array
+
+
+class Transform(object):
+    """
+    Scene-graph node holding a position, rotation and scale.
+
+    rotation is a Vector3 of euler angles in radians applied
+    x first, then y, then z. The local and world 4x4 matrices are
+    built lazily and cached. Changing a node only marks that node's
+    subtree dirty, and the next world_matrix read rebuilds just the
+    dirty nodes. Assign new Vector3's to position, rotation and scale
+    instead of mutating them in place so the caches notice.
+    """
+
+    def __init__(self, position: Optional[Vector3] = None, rotation: Optional[Vector3] = None,
+                 scale: Optional[Vector3] = None, parent: Optional[Transform] = None) -> None:
+        self._position = Vector3(position) if position is not None else Vector3.zero()
+        self._rotation = Vector3(rotation) if rotation is not None else Vector3.zero()
+        self._scale = Vector3(scale) if scale is not None else Vector3.one()
+
+        self._parent = None
+        self._children: List[Transform] = []
+        self._local = None  # Cached local Matrix4, None when dirty
+        self._world = None  # Cached world Matrix4, None when dirty
+
+        if parent is not None:
+            self.parent = parent
+
+    @property
+    def position(self) -> Vector3:
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector3) -> None:
+        self._position = Vector3(value)
+        self._invalidate_local()
+
+    @property
+    def rotation(self) -> Vector3:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: Vector3) -> None:
+        self._rotation = Vector3(value)
+        self._invalidate_local()
+
+    @property
+    def scale(self) -> Vector3:
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: Vector3) -> None:
+        self._scale = Vector3(value)
+        self._invalidate_local()
+
+    @property
+    def parent(self) -> Optional[Transform]:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional[Transform]) -> None:
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+        self._invalidate_world()
+
+    @property
+    def children(self) -> List[Transform]:
+        return list(self._children)
+
+    def add_child(self, child: Transform) -> Transform:
+        child.parent = self
+        return child
+
+    def remove_child(self, child: Transform) -> None:
+        if child._parent is self:
+            child.parent = None
+
+    @property
+    def local_matrix(self) -> Matrix4:
+        """Get the cached local translation @ rotation @ scale Matrix4"""
+
+        if self._local is None:
+            self._local = Matrix4.trs(self._position, self._rotation, self._scale)
+        return self._local
+
+    @property
+    def world_matrix(self) -> Matrix4:
+        """Get the cached parent.world_matrix @ local_matrix Matrix4"""
+
+        if self._world is None:
+            if self._parent is None:
+                self._world = self.local_matrix
+            else:
+                self._world = self._parent.world_matrix @ self.local_matrix
+        return self._world
+
+    def transform_point(self, point: Vector3) -> Vector3:
+        """Return point moved from local space into world space"""
+
+        return self.world_matrix.transform_point(point)
+
+    def transform_points(self, points: Union[Iterable[Vector3], Vector3Array]) -> Union[List[Vector3], Vector3Array]:
+        """Return every point moved from local space into world space
+
+        The world matrix is read once for the whole batch. A Vector3Array
+        is transformed plane by plane and returned as a new Vector3Array,
+        any other iterable of Vector3's is returned as a list.
+        """
+
+        return self.world_matrix.transform_points(points)
+
+    def _invalidate_local(self) -> None:
+        self._local = None
+        self._invalidate_world()
+
+    def _invalidate_world(self) -> None:
+        """Mark this subtree's world matrices dirty
+
+        A dirty node's descendants are always dirty too, so the walk
+        stops at the first node that is already dirty.
+        """
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._world is None and node is not self:
+                continue
+            node._world = None
+            stack.extend(node._children)
@@ -1,20 +1,147 @@
 from __future__ import annotations
 
-from math import sin, cos, sqrt, pi, atan2
-from typing import Union, TypeVar
+from array import array
+from contextlib import contextmanager
+from math import sin, cos, sqrt, pi, atan2, copysign
+from typing import Iterable, Tuple, Union, TypeVar
 
 T = TypeVar("T")
 
+BUFFER_TYPECODES = ("d", "f")  # float64, float32
 
-class Vector(object):
 
-    def __init__(self, *args: T):
-        self._components = []
+def _float_array(typecode: str, values: Iterable[float]) -> array:
+    """
+    Pack values into a contiguous array of float64 ('d') or float32 ('f')
+    """
+
+    if typecode not in BUFFER_TYPECODES:
+        raise ValueError(f"typecode should be one of {BUFFER_TYPECODES}. Found '{typecode}' instead.")
+    return array(typecode, values)
+
+
+def _float_copy(values: Union[array, memoryview]) -> array:
+    """
+    Copy float64 storage, which may be a memoryview over a mapped file,
+    into a new array('d')
+    """
+
+    if isinstance(values, memoryview):
+        copied = array("d")
+        copied.frombytes(values.cast("B") if values.c_contiguous else values.tobytes())
+        return copied
+    return array("d", values)
+
+
+class BaseVector(object):
+    """
+    Behaviour shared by every Vector type. It holds no storage, so
+    Vector2 and Vector3 only carry their own x, y[, z] slots while the
+    generic Vector keeps its components in a list.
+    """
+
+    __slots__ = ()
+
+    def as_buffer(self, typecode: str = "d") -> memoryview:
+        """
+        Return the components packed into one contiguous float64 ('d')
+        or float32 ('f') memoryview, ready for struct/array consumers
+        """
+
+        return memoryview(_float_array(typecode, self))
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.as_buffer()
+
+    def mag(self) -> float:
+        return sqrt(self.mag_sq())
+
+    @classmethod
+    def acquire(cls, *components: T) -> Vector:
+        """
+        Get a recycled Vector from the class' default VectorPool
+        """
+
+        return VectorPool.default(cls).acquire(*components)
+
+    @classmethod
+    def release(cls, vector: Vector) -> None:
+        """
+        Give a Vector back to the class' default VectorPool
+        """
+
+        VectorPool.default(cls).release(vector)
+
+    @classmethod
+    def pool(cls) -> VectorPool:
+        """
+        Get the class' default VectorPool i.e. `with Vector3.pool().frame():`
+        """
+
+        return VectorPool.default(cls)
+
+    def __or__(self, other: Vector) -> Vector:
+        return self if self > other else other
+
+    def __eq__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload == to determine if 2 Vector3's are the same
+        """
+        if isinstance(other, BaseVector):
+            return self.components == other.components
+        elif isinstance(other, (int, float)):
+            return self.mag() == other
+
+    def __lt__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload < operator to determine if a vector3's
+        length is smaller than another
+        """
+        if isinstance(other, BaseVector):
+            return self.mag_sq() < other.mag_sq()
+        elif isinstance(other, (int, float)):
+            return self.mag_sq() < copysign(other * other, other)
+
+    def __gt__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload > operator to determine if a vector3's
+        length is greater than another
+        """
+
+        if isinstance(other, BaseVector):
+            return self.mag_sq() > other.mag_sq()
+        elif isinstance(other, (float, int)):
+            return self.mag_sq() > copysign(other * other, other)
+
+    def __le__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload <= operator to determine if a vector3's
+        length is less than or equal to another
+        """
 
-        for i in args:
-            self._components.append(i)
+        if isinstance(other, BaseVector):
+            return self.mag_sq() <= other.mag_sq()
+        elif isinstance(other, (int, float)):
+            return self.mag_sq() <= copysign(other * other, other)
+
+    def __ge__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload >= operator to determine if a vector3's
+        length is greater than or equal to another
+        """
+
+        if isinstance(other, BaseVector):
+            return self.mag_sq() >= other.mag_sq()
+        elif isinstance(other, (int, float)):
+            return self.mag_sq() >= copysign(other * other, other)
 
-        self.__type = f"Vector{len(self)}"
+
+class Vector(BaseVector):
+    __slots__ = ("_components", "_names", "_mag_sq")
+
+    def __init__(self, *args: T):
+        self._components = list(args)
+        self._mag_sq = None
 
     def name(self, name: str, index: int) -> None:
         """
@@ -22,29 +149,69 @@ class Vector(object):
         more suitable referencing i.e. Vector.x
         """
 
-        setattr(self, name, self._components[index])
+        try:
+            self._names[name] = index
+        except AttributeError:
+            self._names = {name: index}
+
+    def __getattr__(self, name: str) -> any:
+        """
+        Resolve component names registered with Vector.name
+        """
+
+        if not name.startswith("_"):
+            try:
+                return self[self._names[name]]
+            except (AttributeError, KeyError):
+                pass
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     @property
     def components(self) -> [any]:
+        """
+        Get the live component list. Assign through Vector[index]
+        rather than this list so the cached magnitude stays valid.
+        """
+
         return self._components
 
-    def mag(self) -> float:
-        return sqrt(sum(i ** 2 for i in self.components))
+    def mag_sq(self) -> float:
+        """
+        Return the squared length of the Vector. The value is cached
+        until a component changes through item assignment or an
+        in-place operator.
+        """
 
-    def normalized(self) -> Vector:
+        if self._mag_sq is None:
+            self._mag_sq = sum(i * i for i in self._components)
+        return self._mag_sq
+
+    def normalized(self, out: Vector = None) -> Vector:
         """
-        Return a new Vector normalized between 0 and 1
+        Return a new Vector normalized between 0 and 1,
+        or write the result into out and return out
         """
 
-        return self.__class__(*(i / self.mag() if i != 0 else 0 for i in self))
+        mag = self.mag()
+        if out is None:
+            return self.__class__(*(i / mag if i != 0 else 0 for i in self))
+
+        if type(out) is Vector:
+            # Scaled straight into the component list, no temporary Vector
+            components = out._components
+            out._mag_sq = None
+        else:
+            components = out
+        for i, value in enumerate(self._components):
+            components[i] = value / mag if value != 0 else 0
+        return out
 
     def normalize(self) -> Vector:
         """
         Normalize a Vector between 0 and 1 in place
         """
 
-        self.__class__.__init__(*self.normalized())
-        return self
+        return self.normalized(self)
 
     def dot(self, other: Vector) -> float:
         """
@@ -58,7 +225,7 @@ class Vector(object):
         Return the distance between two Vectors of the same length
         """
 
-        return sqrt(sum(self[i - 1] - other[i - 1] for i in range(len(self))) ** 2)
+        return sqrt(sum((self[i] - other[i]) ** 2 for i in range(len(self))))
 
     @staticmethod
     def one(size: int) -> Vector:
@@ -66,17 +233,70 @@ class Vector(object):
 
     @staticmethod
     def zero(size: int) -> Vector:
-        return Vector(*(1 for _ in range(size)))
+        return Vector(*(0 for _ in range(size)))
 
     def __neg__(self) -> Vector:
         res = self.__class__(*(-i for i in self))
         return res
 
+    def __iadd__(self, other: Union[Vector, int, float]) -> Vector:
+        components = self._components
+        self._mag_sq = None
+        if isinstance(other, BaseVector):
+            for ind in range(len(components)):
+                components[ind] += other[ind]
+        elif isinstance(other, (int, float)):
+            for ind in range(len(components)):
+                components[ind] += other
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other: Union[Vector, int, float]) -> Vector:
+        components = self._components
+        self._mag_sq = None
+        if isinstance(other, BaseVector):
+            for ind in range(len(components)):
+                components[ind] -= other[ind]
+        elif isinstance(other, (int, float)):
+            for ind in range(len(components)):
+                components[ind] -= other
+        else:
+            return NotImplemented
+        return self
+
+    def __imul__(self, scalar: Union[Vector, int, float]) -> Vector:
+        components = self._components
+        self._mag_sq = None
+        if isinstance(scalar, BaseVector):
+            for ind in range(len(components)):
+                components[ind] *= scalar[ind]
+        elif isinstance(scalar, (int, float)):
+            for ind in range(len(components)):
+                components[ind] *= scalar
+        else:
+            return NotImplemented
+        return self
+
+    def __itruediv__(self, scalar: Union[Vector, int, float]) -> Vector:
+        components = self._components
+        self._mag_sq = None
+        if isinstance(scalar, BaseVector):
+            for ind in range(len(components)):
+                components[ind] /= scalar[ind]
+        elif isinstance(scalar, (int, float)):
+            for ind in range(len(components)):
+                components[ind] /= scalar
+        else:
+            return NotImplemented
+        return self
+
     def __getitem__(self, index) -> any:
         return self._components[index]
 
     def __setitem__(self, key, value) -> None:
         self._components[key] = value
+        self._mag_sq = None
 
     def __str__(self) -> str:
         return str(self._components)
@@ -94,9 +314,6 @@ class Vector(object):
 
         return len(self._components)
 
-    def __or__(self, other: Vector) -> Vector:
-        return self if self > other else other
-
     def __add__(self, other: Union[Vector, int, float]) -> Vector:
         if isinstance(other, self.__class__):
             return self.__class__(*(self[ind] + other[ind] for ind in range(len(self))))
@@ -122,161 +339,300 @@ class Vector(object):
         elif isinstance(scalar, (int, float)):
             return self.__class__(*(self[ind] / scalar for ind in range(len(self))))
 
-    def __eq__(self, other: Union[Vector, Union[int, float]]) -> bool:
+    def __iter__(self):
         """
-        Overload == to determine if 2 Vector3's are the same
+        Overload iter to all iteration of a Vector's components
         """
-        if isinstance(other, Vector):
-            return self.components == other.components
-        elif isinstance(other, (int, float)):
-            return self.mag() == other
 
-    def __lt__(self, other: Union[Vector, Union[int, float]]) -> bool:
-        """
-        Overload < operator to determine if a vector3's
-        length is smaller than another
-        """
-        if isinstance(other, Vector):
-            return self.mag() < other.mag()
-        elif isinstance(other, (int, float)):
-            return self.mag() < other
+        return iter(self._components)
 
-    def __gt__(self, other: Union[Vector, Union[int, float]]) -> bool:
+
+class Vector3(BaseVector):
+    """
+    Vector 3 object to hold 3 number values that can be
+    indexed by int position or .x, .y, .z
+    and contains methods and overloads to simulate all base
+    vector mathematics.
+
+    Components live only in the x, y, z slots so a Vector3
+    carries no backing list and no instance __dict__.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    # Immutable shared constants, set up below the class definitions
+    ZERO = None
+    ONE = None
+    UP = None
+    DOWN = None
+    LEFT = None
+    RIGHT = None
+    FORWARD = None
+    BACK = None
+
+    def __init__(self, *args: [any]) -> None:
         """
-        Overload > operator to determine if a vector3's
-        length is greater than another
+        Create a new instance of Vector3 where args
+        is either a Vector3 object to be copied or
+        args is a (x, y, z) component or args is a
+        tuple, set, list of ((x,y,z)).
         """
 
-        if isinstance(other, self.__class__):
-            return self.mag() > other.mag()
-        elif isinstance(other, (float, int)):
-            return self.mag() > other
+        if len(args) == 3:
+            self.x, self.y, self.z = args
+        elif len(args) == 1:
+            if isinstance(args[0], Vector3):
+                self.x, self.y, self.z = args[0].x, args[0].y, args[0].z
+            elif isinstance(args[0], (tuple, set, list)) and len(args[0]) == 3:
+                self.x, self.y, self.z = args[0]
+            else:
+                raise Exception("VectorCreationError: Expected ((0,0,0)) or (0,0,0) or Vector3")
+        else:
+            raise Exception("VectorCreationError: Expected ((0,0,0)) or (0,0,0) or Vector3")
 
-    def __le__(self, other: Union[Vector, Union[int, float]]) -> bool:
+    @classmethod
+    def _new(cls, x: float, y: float, z: float) -> Vector3:
         """
-        Overload <= operator to determine if a vector3's
-        length is less than or equal to another
+        Fast path constructor used by the arithmetic overloads
         """
 
-        if isinstance(other, Vector):
-            return self.mag() <= other.mag()
-        elif isinstance(other, (int, float)):
-            return self.mag() <= other
+        vector = object.__new__(cls)
+        vector.x = x
+        vector.y = y
+        vector.z = z
+        return vector
 
-    def __ge__(self, other: Union[Vector, Union[int, float]]) -> bool:
+    @property
+    def components(self) -> [any]:
+        return [self.x, self.y, self.z]
+
+    def mag_sq(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def mag(self) -> float:
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def normalized(self, out: Vector3 = None) -> Vector3:
         """
-        Overload >= operator to determine if a vector3's
-        length is greater than or equal to another
+        Return a new Vector3 normalized between 0 and 1,
+        or write the result into out and return out
         """
 
-        if isinstance(other, Vector):
-            return self.mag() >= other.mag()
-        elif isinstance(other, (int, float)):
-            return self.mag() >= other
+        mag = self.mag()
+        x, y, z = (self.x / mag, self.y / mag, self.z / mag) if mag else (0, 0, 0)
+        if out is None:
+            return self._new(x, y, z)
+        out.x, out.y, out.z = x, y, z
+        return out
 
-    def __iter__(self) -> Vector:
+    def normalize(self) -> Vector3:
         """
-        Overload iter to all iteration of a Vector3's components
+        Normalize a Vector3 between 0 and 1 in place
         """
 
-        self.__pos = 0
+        mag = self.mag()
+        if mag:
+            self.x, self.y, self.z = self.x / mag, self.y / mag, self.z / mag
         return self
 
-    def __next__(self) -> any:
+    def dot(self, other: Vector3) -> float:
         """
-        Overload next to get next item in an iterator
-        Should not be called outside of iter
+        Return the dot product between two Vector3's
         """
 
-        if self.__pos < len(self):
-            self.__pos += 1
-            return self._components[self.__pos-1]
-        raise StopIteration
-
+        return self.x * other.x + self.y * other.y + self.z * other.z
 
-class Vector3(Vector):
-    """
-    Vector 3 object to hold 3 number values that can be
-    indexed by int position or .x, .y, .z
-    and contains methods and overloads to simulate all base
-    vector mathematics.
-    """
-
-    def __init__(self, *args: [any]) -> None:
+    def distance(self, other: Vector3) -> float:
         """
-        Create a new instance of Vector3 where args
-        is either a Vector3 object to be copied or
-        args is a (x, y, z) component or args is a
-        tuple, set, list of ((x,y,z)).
+        Return the distance between two Vector3's
         """
 
-        if len(args) == 1:
-            if isinstance(args[0], (tuple, set, list)) and len(args[0]) == 3:
-                self.x, self.y, self.z = args[0][0], args[0][1], args[0][3]
-            elif isinstance(args[0], Vector3):
-                self.x, self.y, self.z = args[0].x, args[1].y, args[3].z
-            else:
-                raise Exception("VectorCreationError: Expected ((0,0,0)) or (0,0,0) or Vector3")
-        elif len(args) == 3:
-            self.x, self.y, self.z = args[0], args[1], args[3]
-        else:
-            raise Exception("VectorCreationError: Expected ((0,0,0)) or (0,0,0) or Vector3")
+        dx, dy, dz = self.x - other.x, self.y - other.y, self.z - other.z
+        return sqrt(dx * dx + dy * dy + dz * dz)
 
-        super(Vector3, self).__init__(self.x, self.y, self.z)
-
-    def cross(self, other: Vector3) -> Vector3:
+    def cross(self, other: Vector3, out: Vector3 = None) -> Vector3:
         """
-        Return a new Vector3 that is perpendicular to both vectors
+        Return a new Vector3 that is perpendicular to both vectors,
+        or write the result into out and return out
         """
 
         x = self.y * other.z - self.z * other.y
-        y = self.x * other.z - self.z * other.x
+        y = self.z * other.x - self.x * other.z
         z = self.x * other.y - self.y * other.x
 
-        return Vector3(x, y, z)
+        if out is None:
+            return self._new(x, y, z)
+        out.x, out.y, out.z = x, y, z
+        return out
 
-    def lerp(self, other: Vector3, percent: float) -> Vector3:
+    def lerp(self, other: Vector3, percent: float, out: Vector3 = None) -> Vector3:
         """
         Return a new Vector3 linearly interpolated between start and end at percent
-        where 0 is 0% and 1 is 100%
+        where 0 is 0% and 1 is 100%, or write the result into out and return out
         """
         percent = max(min(percent, 1), 0)  # used to clamp percent between 0 and 1
-        return self + (other - self) * percent
+        x = self.x + (other.x - self.x) * percent
+        y = self.y + (other.y - self.y) * percent
+        z = self.z + (other.z - self.z) * percent
+
+        if out is None:
+            return self._new(x, y, z)
+        out.x, out.y, out.z = x, y, z
+        return out
+
+    def __neg__(self) -> Vector3:
+        return self._new(-self.x, -self.y, -self.z)
+
+    def __add__(self, other: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(other, Vector3):
+            return self._new(self.x + other.x, self.y + other.y, self.z + other.z)
+        elif isinstance(other, (int, float)):
+            return self._new(self.x + other, self.y + other, self.z + other)
+        return NotImplemented
+
+    def __sub__(self, other: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(other, Vector3):
+            return self._new(self.x - other.x, self.y - other.y, self.z - other.z)
+        elif isinstance(other, (int, float)):
+            return self._new(self.x - other, self.y - other, self.z - other)
+        return NotImplemented
+
+    def __mul__(self, scalar: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(scalar, Vector3):
+            return self._new(self.x * scalar.x, self.y * scalar.y, self.z * scalar.z)
+        elif isinstance(scalar, (int, float)):
+            return self._new(self.x * scalar, self.y * scalar, self.z * scalar)
+        return NotImplemented
+
+    def __truediv__(self, scalar: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(scalar, Vector3):
+            return self._new(self.x / scalar.x, self.y / scalar.y, self.z / scalar.z)
+        elif isinstance(scalar, (int, float)):
+            return self._new(self.x / scalar, self.y / scalar, self.z / scalar)
+        return NotImplemented
+
+    def __iadd__(self, other: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(other, Vector3):
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+        elif isinstance(other, (int, float)):
+            self.x += other
+            self.y += other
+            self.z += other
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(other, Vector3):
+            self.x -= other.x
+            self.y -= other.y
+            self.z -= other.z
+        elif isinstance(other, (int, float)):
+            self.x -= other
+            self.y -= other
+            self.z -= other
+        else:
+            return NotImplemented
+        return self
+
+    def __imul__(self, scalar: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(scalar, Vector3):
+            self.x *= scalar.x
+            self.y *= scalar.y
+            self.z *= scalar.z
+        elif isinstance(scalar, (int, float)):
+            self.x *= scalar
+            self.y *= scalar
+            self.z *= scalar
+        else:
+            return NotImplemented
+        return self
+
+    def __itruediv__(self, scalar: Union[Vector3, int, float]) -> Vector3:
+        if isinstance(scalar, Vector3):
+            self.x /= scalar.x
+            self.y /= scalar.y
+            self.z /= scalar.z
+        elif isinstance(scalar, (int, float)):
+            self.x /= scalar
+            self.y /= scalar
+            self.z /= scalar
+        else:
+            return NotImplemented
+        return self
+
+    def __eq__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload == to determine if 2 Vector3's are the same
+        """
+        if isinstance(other, Vector3):
+            return self.x == other.x and self.y == other.y and self.z == other.z
+        return super(Vector3, self).__eq__(other)
+
+    def __getitem__(self, index) -> any:
+        return [self.x, self.y, self.z][index]
+
+    def __setitem__(self, key, value) -> None:
+        components = [self.x, self.y, self.z]
+        components[key] = value
+        self.x, self.y, self.z = components
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __str__(self) -> str:
+        return str([self.x, self.y, self.z])
+
+    def __repr__(self) -> str:
+        return repr([self.x, self.y, self.z])
 
     @classmethod
     def one(cls) -> Vector3:
-        return cls(1, 1, 1)
+        """
+        Get the shared immutable Vector3(1, 1, 1)
+        """
+
+        return Vector3.ONE
 
     @classmethod
     def zero(cls) -> Vector3:
-        return cls(0, 0, 0)
+        """
+        Get the shared immutable Vector3(0, 0, 0)
+        """
+
+        return Vector3.ZERO
 
     @staticmethod
     def up() -> Vector3:
-        return Vector3(0, 0, -1)
+        return Vector3.UP
 
     @staticmethod
     def down() -> Vector3:
-        return -Vector3.up()
+        return Vector3.DOWN
 
     @staticmethod
     def left() -> Vector3:
-        return Vector3(-1, 0, 0)
+        return Vector3.LEFT
 
     @staticmethod
     def right() -> Vector3:
-        return -Vector3.right()
+        return Vector3.RIGHT
 
     @staticmethod
     def forward() -> Vector3:
-        return Vector3(0, 1, 0)
+        return Vector3.FORWARD
 
     @staticmethod
     def back() -> Vector3:
-        return -Vector3.forward()
+        return Vector3.BACK
 
 
-class Vector2(Vector):
+class Vector2(BaseVector):
     """
     Python representation of a 2d Vector
 
@@ -284,8 +640,21 @@ class Vector2(Vector):
     a 0 or any other stationary value in the zed component. All overloads refer
     to the original Vector3 object but modify it to remove
     the zed from the visible render
+
+    Components live only in the x, y slots so a Vector2
+    carries no backing list and no instance __dict__.
     """
 
+    __slots__ = ("x", "y")
+
+    # Immutable shared constants, set up below the class definitions
+    ZERO = None
+    ONE = None
+    UP = None
+    DOWN = None
+    LEFT = None
+    RIGHT = None
+
     def __init__(self, *args: any) -> None:
         """
         Create a new instance of Vector2 where args
@@ -293,50 +662,390 @@ class Vector2(Vector):
         args is a (x, y)component or args is a
         tuple, set, list of ((x, y), ).
 
-        Passing x, y, z components to create a Vector3 will create the
-        Vector3 and lock the zed component. Type will remain Vector2
-
-        :param args: Args must be length 1 or 2 or 3
+        :param args: Args must be length 1 or 2
         :raises VectorCreationError: Exception
         """
 
-        if len(args) == 1:
+        if len(args) == 2:
+            self.x, self.y = args
+        elif len(args) == 1:
             if isinstance(args[0], Vector2):
                 self.x, self.y = args[0].x, args[0].y
             elif len(args[0]) == 2:
                 self.x, self.y = args[0][0], args[0][1]
             else:
                 raise Exception("VectorCreationError: Expected ((0,0)) or (0,0) or Vector2")
-        elif len(args) == 2:
-            self.x, self.y = args[0], args[1]
-        elif len(args) == 3:
+        else:
             raise Exception("VectorCreationError: Expected ((0,0)) or (0,0) or Vector2")
 
-        super(Vector2, self).__init__(self.x, self.y)
+    @classmethod
+    def _new(cls, x: float, y: float) -> Vector2:
+        """
+        Fast path constructor used by the arithmetic overloads
+        """
+
+        vector = object.__new__(cls)
+        vector.x = x
+        vector.y = y
+        return vector
+
+    @property
+    def components(self) -> [any]:
+        return [self.x, self.y]
+
+    def mag_sq(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    def mag(self) -> float:
+        return sqrt(self.x * self.x + self.y * self.y)
+
+    def normalized(self, out: Vector2 = None) -> Vector2:
+        """
+        Return a new Vector2 normalized between 0 and 1,
+        or write the result into out and return out
+        """
+
+        mag = self.mag()
+        x, y = (self.x / mag, self.y / mag) if mag else (0, 0)
+        if out is None:
+            return self._new(x, y)
+        out.x, out.y = x, y
+        return out
+
+    def normalize(self) -> Vector2:
+        """
+        Normalize a Vector2 between 0 and 1 in place
+        """
+
+        mag = self.mag()
+        if mag:
+            self.x, self.y = self.x / mag, self.y / mag
+        return self
+
+    def dot(self, other: Vector2) -> float:
+        """
+        Return the dot product between two Vector2's
+        """
+
+        return self.x * other.x + self.y * other.y
+
+    def distance(self, other: Vector2) -> float:
+        """
+        Return the distance between two Vector2's
+        """
+
+        dx, dy = self.x - other.x, self.y - other.y
+        return sqrt(dx * dx + dy * dy)
+
+    def lerp(self, other: Vector2, percent: float, out: Vector2 = None) -> Vector2:
+        """
+        Return a new Vector2 linearly interpolated between start and end at percent
+        where 0 is 0% and 1 is 100%, or write the result into out and return out
+        """
+        percent = max(min(percent, 1), 0)  # used to clamp percent between 0 and 1
+        x = self.x + (other.x - self.x) * percent
+        y = self.y + (other.y - self.y) * percent
+
+        if out is None:
+            return self._new(x, y)
+        out.x, out.y = x, y
+        return out
+
+    def __neg__(self) -> Vector2:
+        return self._new(-self.x, -self.y)
+
+    def __add__(self, other: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(other, Vector2):
+            return self._new(self.x + other.x, self.y + other.y)
+        elif isinstance(other, (int, float)):
+            return self._new(self.x + other, self.y + other)
+        return NotImplemented
+
+    def __sub__(self, other: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(other, Vector2):
+            return self._new(self.x - other.x, self.y - other.y)
+        elif isinstance(other, (int, float)):
+            return self._new(self.x - other, self.y - other)
+        return NotImplemented
+
+    def __mul__(self, scalar: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(scalar, Vector2):
+            return self._new(self.x * scalar.x, self.y * scalar.y)
+        elif isinstance(scalar, (int, float)):
+            return self._new(self.x * scalar, self.y * scalar)
+        return NotImplemented
+
+    def __truediv__(self, scalar: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(scalar, Vector2):
+            return self._new(self.x / scalar.x, self.y / scalar.y)
+        elif isinstance(scalar, (int, float)):
+            return self._new(self.x / scalar, self.y / scalar)
+        return NotImplemented
+
+    def __iadd__(self, other: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(other, Vector2):
+            self.x += other.x
+            self.y += other.y
+        elif isinstance(other, (int, float)):
+            self.x += other
+            self.y += other
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(other, Vector2):
+            self.x -= other.x
+            self.y -= other.y
+        elif isinstance(other, (int, float)):
+            self.x -= other
+            self.y -= other
+        else:
+            return NotImplemented
+        return self
+
+    def __imul__(self, scalar: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(scalar, Vector2):
+            self.x *= scalar.x
+            self.y *= scalar.y
+        elif isinstance(scalar, (int, float)):
+            self.x *= scalar
+            self.y *= scalar
+        else:
+            return NotImplemented
+        return self
+
+    def __itruediv__(self, scalar: Union[Vector2, int, float]) -> Vector2:
+        if isinstance(scalar, Vector2):
+            self.x /= scalar.x
+            self.y /= scalar.y
+        elif isinstance(scalar, (int, float)):
+            self.x /= scalar
+            self.y /= scalar
+        else:
+            return NotImplemented
+        return self
+
+    def __eq__(self, other: Union[Vector, Union[int, float]]) -> bool:
+        """
+        Overload == to determine if 2 Vector2's are the same
+        """
+        if isinstance(other, Vector2):
+            return self.x == other.x and self.y == other.y
+        return super(Vector2, self).__eq__(other)
+
+    def __getitem__(self, index) -> any:
+        return [self.x, self.y][index]
+
+    def __setitem__(self, key, value) -> None:
+        components = [self.x, self.y]
+        components[key] = value
+        self.x, self.y = components
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self):
+        return iter((self.x, self.y))
+
+    def __str__(self) -> str:
+        return str([self.x, self.y])
+
+    def __repr__(self) -> str:
+        return repr([self.x, self.y])
 
     @classmethod
     def one(cls) -> Vector2:
-        return cls(1, 1)
+        """
+        Get the shared immutable Vector2(1, 1)
+        """
+
+        return Vector2.ONE
 
     @classmethod
     def zero(cls) -> Vector2:
-        return cls(0, 0)
+        """
+        Get the shared immutable Vector2(0, 0)
+        """
+
+        return Vector2.ZERO
 
     @staticmethod
     def up() -> Vector2:
-        return Vector2(0, -1)
+        return Vector2.UP
 
     @staticmethod
     def down() -> Vector2:
-        return -Vector2.up()
+        return Vector2.DOWN
 
     @staticmethod
     def left() -> Vector2:
-        return Vector2(-1, 0)
+        return Vector2.LEFT
 
     @staticmethod
     def right() -> Vector2:
-        return -Vector2.left()
+        return Vector2.RIGHT
+
+
+class _Frozen(object):
+    """
+    Mixin that makes a Vector2/Vector3 immutable so a single instance
+    can be shared. In-place operators fall back to the regular ones,
+    so `v += other` rebinds v to a new mutable Vector instead of
+    changing the shared constant.
+    """
+
+    __slots__ = ()
+    _mutable = None
+
+    @classmethod
+    def _frozen(cls, *components: float) -> Vector:
+        vector = object.__new__(cls)
+        for name, value in zip(cls._mutable.__slots__, components):
+            object.__setattr__(vector, name, value)
+        return vector
+
+    @classmethod
+    def _new(cls, *components: float) -> Vector:
+        return cls._mutable._new(*components)
+
+    def __setattr__(self, name: str, value: any) -> None:
+        raise AttributeError(f"Shared {self._mutable.__name__} constants are immutable, copy them first")
+
+    def __setitem__(self, key, value) -> None:
+        raise AttributeError(f"Shared {self._mutable.__name__} constants are immutable, copy them first")
+
+    def __iadd__(self, other):
+        return NotImplemented
+
+    __isub__ = __imul__ = __itruediv__ = __iadd__
+
+    def __copy__(self) -> Vector:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Vector:
+        return self
+
+    def __reduce__(self):
+        """
+        Unpickle as the shared class constant, or as a plain mutable Vector
+        """
+
+        for name, value in vars(self._mutable).items():
+            if value is self:
+                return getattr, (self._mutable, name)
+        return self._mutable, tuple(self)
+
+
+class _FrozenVector3(_Frozen, Vector3):
+    __slots__ = ()
+    _mutable = Vector3
+
+
+class _FrozenVector2(_Frozen, Vector2):
+    __slots__ = ()
+    _mutable = Vector2
+
+
+# Setting up constant vectors
+Vector3.ZERO = _FrozenVector3._frozen(0, 0, 0)
+Vector3.ONE = _FrozenVector3._frozen(1, 1, 1)
+Vector3.UP = _FrozenVector3._frozen(0, 0, -1)
+Vector3.DOWN = _FrozenVector3._frozen(0, 0, 1)
+Vector3.LEFT = _FrozenVector3._frozen(-1, 0, 0)
+Vector3.RIGHT = _FrozenVector3._frozen(1, 0, 0)
+Vector3.FORWARD = _FrozenVector3._frozen(0, 1, 0)
+Vector3.BACK = _FrozenVector3._frozen(0, -1, 0)
+
+Vector2.ZERO = _FrozenVector2._frozen(0, 0)
+Vector2.ONE = _FrozenVector2._frozen(1, 1)
+Vector2.UP = _FrozenVector2._frozen(0, -1)
+Vector2.DOWN = _FrozenVector2._frozen(0, 1)
+Vector2.LEFT = _FrozenVector2._frozen(-1, 0)
+Vector2.RIGHT = _FrozenVector2._frozen(1, 0)
+
+
+class VectorPool(object):
+    """
+    Free-list of reusable Vectors for short-lived temporaries.
+
+    acquire() hands out a recycled Vector when one is free and only
+    constructs a new one otherwise. Vectors acquired inside a frame()
+    block are returned to the pool automatically when it exits, so a
+    frame's temporaries are recycled by the next frame. A released
+    Vector must not be used again by its previous owner. Releasing a
+    Vector that is already free does nothing, so one released by hand
+    inside a frame is not handed out twice.
+    """
+
+    _defaults = {}
+
+    def __init__(self, vector_type: type = None, capacity: int = None) -> None:
+        self._type = vector_type if vector_type is not None else Vector3
+        self._free = []
+        self._free_ids = set()
+        self._frames = []
+        self.capacity = capacity  # Largest number of free Vectors kept, None for unbounded
+
+    @classmethod
+    def default(cls, vector_type: type) -> VectorPool:
+        """
+        Get the shared pool used by Vector2.acquire / Vector3.acquire
+        """
+
+        try:
+            return cls._defaults[vector_type]
+        except KeyError:
+            pool = cls._defaults[vector_type] = cls(vector_type)
+            return pool
+
+    def acquire(self, *components: float) -> Vector:
+        """
+        Get a Vector set to components from the pool
+        """
+
+        if self._free:
+            vector = self._free.pop()
+            self._free_ids.discard(id(vector))
+            vector.__init__(*components)
+        else:
+            vector = self._type(*components)
+
+        if self._frames:
+            self._frames[-1].append(vector)
+        return vector
+
+    def release(self, vector: Vector) -> None:
+        """
+        Give a Vector back to the pool for reuse
+        """
+
+        if type(vector) is not self._type or id(vector) in self._free_ids:
+            return
+        if self.capacity is None or len(self._free) < self.capacity:
+            self._free.append(vector)
+            self._free_ids.add(id(vector))
+
+    @contextmanager
+    def frame(self):
+        """
+        Release every Vector acquired inside the with block when it exits,
+        skipping the ones already released
+        """
+
+        self._frames.append([])
+        try:
+            yield self
+        finally:
+            for vector in self._frames.pop():
+                self.release(vector)
+
+    def __len__(self) -> int:
+        """
+        Get the number of free Vectors in the pool
+        """
+
+        return len(self._free)
 
 
 def radians_to_degrees(radians: Union[int, float]) -> float:
@@ -344,18 +1053,90 @@ def radians_to_degrees(radians: Union[int, float]) -> float:
 
 
 def degrees_to_radians(degrees: Union[int, float]) -> float:
-    return (180 * pi) / degrees if degrees else 1
+    return (pi / 180) * degrees
+
+
+class TrigTable(object):
+    """
+    Fixed resolution sin/cos lookup table.
+
+    The full circle is split into resolution steps (360 by default,
+    one per degree). Angles are snapped to the nearest step so repeated
+    rotations by common angles never call sin or cos.
+    """
+
+    def __init__(self, resolution: int = 360) -> None:
+        self.resolution = resolution
+        self._sin = [sin(2 * pi * step / resolution) for step in range(resolution)]
+        self._cos = [cos(2 * pi * step / resolution) for step in range(resolution)]
+
+    def sin_cos(self, angle: float) -> Tuple[float, float]:
+        """
+        Return (sin, cos) of angle in radians, snapped to the nearest step
+        """
+
+        step = round(angle * self.resolution / (2 * pi)) % self.resolution
+        return self._sin[step], self._cos[step]
 
+    def __getitem__(self, step: int) -> Tuple[float, float]:
+        """
+        Return (sin, cos) for an integer step i.e. a whole degree
+        """
+
+        step %= self.resolution
+        return self._sin[step], self._cos[step]
+
+
+DEGREE_TABLE = TrigTable()
+
+
+def _sin_cos(angle: float, table: TrigTable = None) -> Tuple[float, float]:
+    if table is None:
+        return sin(angle), cos(angle)
+    return table.sin_cos(angle)
 
-def rotate(vec1: Vector2, angle: int) -> Vector2:
+
+def rotate(vec1: Vector2, angle: int, out: Vector2 = None, table: TrigTable = None) -> Vector2:
     """
     Create a new Vector2 rotated around the
-    zed component by angle
+    zed component by angle, or write the
+    result into out and return out
     """
 
-    vx = vec1.x * cos(angle) + vec1.y * sin(angle)
-    vy = vec1.x * sin(angle) - vec1.y * cos(angle)
-    return Vector2(vx, vy)
+    s, c = _sin_cos(angle, table)
+    vx = vec1.x * c - vec1.y * s
+    vy = vec1.x * s + vec1.y * c
+
+    if out is None:
+        return Vector2(vx, vy)
+    out.x, out.y = vx, vy
+    return out
+
+
+def rotate_many(vectors: Iterable[Vector2], angle: float, out=None, table: TrigTable = None):
+    """
+    Rotate every Vector2 in vectors around the zed component by angle.
+
+    sin and cos are computed once for the whole batch, or read from
+    table when one is given. vectors may be a sequence of Vector2 or
+    a Vector2Array; the result is the same kind of container, or out
+    when it is given.
+    """
+
+    from PyMath.vector_array import Vector2Array
+
+    if isinstance(vectors, Vector2Array):
+        return vectors.rotate(angle, out=out, table=table)
+
+    s, c = _sin_cos(angle, table)
+    if out is None:
+        new = Vector2._new
+        return [new(v.x * c - v.y * s, v.x * s + v.y * c) for v in vectors]
+
+    for vector, target in zip(vectors, out):
+        x, y = vector.x, vector.y
+        target.x, target.y = x * c - y * s, x * s + y * c
+    return out
 
 
 def look_towards(vec1: Vector2, vec2: Vector2) -> float:
@@ -363,6 +1144,19 @@ def look_towards(vec1: Vector2, vec2: Vector2) -> float:
     Return a new direction vector pointing from vec1 to vec 2
     """
 
-    direction = vec1 - vec2
-    angle = atan2(*direction.components)
-    return angle
+    return atan2(vec1.x - vec2.x, vec1.y - vec2.y)
+
+
+def look_towards_many(vectors: Iterable[Vector2], target: Vector2) -> Union[list, array]:
+    """
+    Return the look_towards heading from every Vector2 in vectors to target
+    without creating a direction Vector per element
+    """
+
+    from PyMath.vector_array import Vector2Array
+
+    if isinstance(vectors, Vector2Array):
+        return vectors.look_towards(target)
+
+    tx, ty = target.x, target.y
+    return [atan2(v.x - tx, v.y - ty) for v in vectors]
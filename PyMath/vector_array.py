@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+from array import array
+from itertools import repeat
+from math import sqrt, sin, cos, atan2
+from operator import add, sub, mul, truediv
+from typing import Iterable, Union
+
+from PyMath.vector import BaseVector, Vector, Vector2, Vector3, TrigTable, _float_array
+
+
+class VectorArray(object):
+    """
+    Structure-of-arrays container holding many fixed size Vectors.
+
+    Every component is stored in its own contiguous array('d') plane
+    so whole-batch math runs as a single pass per plane instead of
+    creating one Python object per Vector.
+    """
+
+    _dimensions = 0
+    _vector = Vector
+
+    def __init__(self, vectors: Iterable = None) -> None:
+        """
+        Create a new batch from an iterable of Vectors or
+        (x, y[, z]) sequences
+        """
+
+        self._planes = tuple(array("d") for _ in range(self._dimensions))
+        if vectors is not None:
+            self.extend(vectors)
+
+    @classmethod
+    def from_components(cls, *components: Iterable[float]) -> VectorArray:
+        """
+        Create a new batch from one iterable per component i.e. (xs, ys, zs)
+        """
+
+        if len(components) != cls._dimensions:
+            raise Exception(f"VectorCreationError: Expected {cls._dimensions} component planes")
+
+        new_array = cls()
+        new_array._planes = tuple(array("d", plane) for plane in components)
+        if any(len(plane) != len(new_array._planes[0]) for plane in new_array._planes):
+            raise Exception("VectorCreationError: Component planes must have the same length")
+        return new_array
+
+    @classmethod
+    def zeros(cls, count: int) -> VectorArray:
+        """
+        Create a new batch of count zero Vectors
+        """
+
+        return cls.from_components(*(array("d", bytes(8 * count)) for _ in range(cls._dimensions)))
+
+    @property
+    def planes(self) -> tuple:
+        """
+        Get the component planes i.e. (xs, ys, zs)
+        """
+
+        return self._planes
+
+    def append(self, vector: Union[Vector, Iterable[float]]) -> None:
+        """
+        Add a Vector to the end of the batch
+        """
+
+        if len(vector) != self._dimensions:
+            raise Exception(f"VectorCreationError: Expected a Vector of length {self._dimensions}")
+
+        for plane, value in zip(self._planes, vector):
+            plane.append(value)
+
+    def extend(self, vectors: Iterable) -> None:
+        """
+        Add every Vector in vectors to the end of the batch
+        """
+
+        for vector in vectors:
+            self.append(vector)
+
+    def copy(self) -> VectorArray:
+        """
+        Return a new batch with copied component planes
+        """
+
+        return self.from_components(*self._planes)
+
+    def tolist(self) -> list:
+        """
+        Return the batch as a list of component tuples
+        """
+
+        return list(zip(*self._planes))
+
+    def as_buffer(self, typecode: str = "d", layout: str = "row") -> memoryview:
+        """
+        Return the batch packed into one contiguous float64 ('d') or
+        float32 ('f') memoryview.
+
+        layout "row" interleaves the components (x0, y0, z0, x1, ...)
+        and the view has shape (len, dimensions). layout "planar" lays
+        the planes out one after another and the view has shape
+        (dimensions, len). Each plane is filled with one slice
+        assignment, so no per-element Python code runs. The planes are
+        array('d') themselves, so memoryview(batch.xs) is a zero-copy
+        alternative.
+        """
+
+        dimensions, count = self._dimensions, len(self)
+        packed = _float_array(typecode, bytes(dimensions * count * array(typecode).itemsize))
+        for index, plane in enumerate(self._planes):
+            if plane.typecode != typecode:
+                plane = array(typecode, plane)
+            if layout == "row":
+                packed[index::dimensions] = plane
+            elif layout == "planar":
+                packed[index * count:(index + 1) * count] = plane
+            else:
+                raise ValueError(f"layout should be 'row' or 'planar'. Found '{layout}' instead.")
+
+        if not count:
+            return memoryview(packed)
+        shape = [count, dimensions] if layout == "row" else [dimensions, count]
+        return memoryview(packed).cast("B").cast(typecode, shape)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.as_buffer()
+
+    def save(self, path: str) -> None:
+        """
+        Write the batch to a (len, dimensions) float64 .npy file, see 'PyMath.npy'
+        """
+
+        from PyMath import npy
+
+        npy.save(path, self)
+
+    @classmethod
+    def load(cls, path: str) -> VectorArray:
+        """
+        Read a batch saved with save() or numpy.save, see 'PyMath.npy'
+        """
+
+        from PyMath import npy
+
+        return npy.load_vectors(path, cls if cls._dimensions else None)
+
+    def dot(self, other: Union[VectorArray, Vector]) -> array:
+        """
+        Return the dot product of every Vector in the batch with other
+        """
+
+        products = None
+        for plane, other_plane in zip(self._planes, self._other_planes(other)):
+            product = map(mul, plane, other_plane)
+            products = product if products is None else map(add, products, product)
+        return array("d", products)
+
+    def mag_sq(self) -> array:
+        """
+        Return the squared length of every Vector in the batch
+        """
+
+        return self.dot(self)
+
+    def mag(self) -> array:
+        """
+        Return the length of every Vector in the batch
+        """
+
+        return array("d", map(sqrt, self.dot(self)))
+
+    def normalized(self) -> VectorArray:
+        """
+        Return a new batch where every Vector is normalized between 0 and 1
+        """
+
+        scale = array("d", (1.0 / m if m else 0.0 for m in self.mag()))
+        return self.from_components(*(map(mul, plane, scale) for plane in self._planes))
+
+    def lerp(self, other: Union[VectorArray, Vector], percent: float) -> VectorArray:
+        """
+        Return a new batch linearly interpolated between self and other at percent
+        where 0 is 0% and 1 is 100%
+        """
+
+        percent = max(min(percent, 1), 0)  # used to clamp percent between 0 and 1
+        return self.from_components(*(map(add, plane, map(mul, map(sub, other_plane, plane), repeat(percent)))
+                                      for plane, other_plane in zip(self._planes, self._other_planes(other))))
+
+    def _other_planes(self, other: Union[VectorArray, Vector, int, float]) -> tuple:
+        """
+        Get one sequence per component for other, broadcasting
+        a single Vector or scalar across the whole batch, broadcast
+        sequences are unbounded so only zip them with a plane
+        """
+
+        if isinstance(other, VectorArray):
+            if other._dimensions != self._dimensions or len(other) != len(self):
+                raise Exception(f"VectorMathError: Expected {type(self).__name__} of length {len(self)}")
+            return other._planes
+        elif isinstance(other, BaseVector):
+            if len(other) != self._dimensions:
+                raise Exception(f"VectorMathError: Expected a Vector of length {self._dimensions}")
+            return tuple(repeat(component) for component in other)
+        elif isinstance(other, (int, float)):
+            return (repeat(other),) * self._dimensions
+        raise Exception(f"VectorMathError: Unsupported operand '{type(other).__name__}'")
+
+    def __elementwise(self, other: Union[VectorArray, Vector, int, float], op, reflected: bool = False) -> VectorArray:
+        if not isinstance(other, (VectorArray, BaseVector, int, float)):
+            return NotImplemented
+        pairs = zip(self._planes, self._other_planes(other))
+        if reflected:
+            return self.from_components(*(map(op, other_plane, plane) for plane, other_plane in pairs))
+        return self.from_components(*(map(op, plane, other_plane) for plane, other_plane in pairs))
+
+    def __add__(self, other: Union[VectorArray, Vector, int, float]) -> VectorArray:
+        return self.__elementwise(other, add)
+
+    def __sub__(self, other: Union[VectorArray, Vector, int, float]) -> VectorArray:
+        return self.__elementwise(other, sub)
+
+    def __mul__(self, other: Union[VectorArray, Vector, int, float]) -> VectorArray:
+        return self.__elementwise(other, mul)
+
+    def __truediv__(self, other: Union[VectorArray, Vector, int, float]) -> VectorArray:
+        return self.__elementwise(other, truediv)
+
+    def __rsub__(self, other: Union[Vector, int, float]) -> VectorArray:
+        return self.__elementwise(other, sub, reflected=True)
+
+    def __rtruediv__(self, other: Union[Vector, int, float]) -> VectorArray:
+        return self.__elementwise(other, truediv, reflected=True)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self) -> VectorArray:
+        return self * -1
+
+    def __len__(self) -> int:
+        return len(self._planes[0])
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vector, VectorArray]:
+        if isinstance(index, slice):
+            return self.from_components(*(plane[index] for plane in self._planes))
+        return self._vector(*(plane[index] for plane in self._planes))
+
+    def __setitem__(self, index: int, vector: Union[Vector, Iterable[float]]) -> None:
+        for plane, value in zip(self._planes, vector):
+            plane[index] = value
+
+    def __iter__(self):
+        return map(self._vector, *self._planes)
+
+    def __str__(self) -> str:
+        return str(self.tolist())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.tolist()!r})"
+
+
+class Vector2Array(VectorArray):
+    """
+    Batch of Vector2 stored as xs, ys component planes
+    """
+
+    _dimensions = 2
+    _vector = Vector2
+
+    @property
+    def xs(self) -> array:
+        return self._planes[0]
+
+    @property
+    def ys(self) -> array:
+        return self._planes[1]
+
+    def cross(self, other: Union[Vector2Array, Vector2]) -> array:
+        """
+        Return the zed component of the cross product of every Vector in the batch with other
+        """
+
+        ox, oy = self._other_planes(other)
+        return array("d", map(sub, map(mul, self.xs, oy), map(mul, self.ys, ox)))
+
+    def rotate(self, angle: float, out: Vector2Array = None, table: TrigTable = None) -> Vector2Array:
+        """
+        Return a new batch rotated around the zed component by angle,
+        or write the result into out and return out
+        """
+
+        s, c = table.sin_cos(angle) if table is not None else (sin(angle), cos(angle))
+        xs, ys = self._planes
+        new_xs = array("d", map(sub, map(mul, xs, repeat(c)), map(mul, ys, repeat(s))))
+        new_ys = array("d", map(add, map(mul, xs, repeat(s)), map(mul, ys, repeat(c))))
+
+        if out is None:
+            return self.from_components(new_xs, new_ys)
+        out.xs[:] = new_xs
+        out.ys[:] = new_ys
+        return out
+
+    def look_towards(self, target: Vector2) -> array:
+        """
+        Return the look_towards heading from every Vector in the batch to target
+        """
+
+        return array("d", map(atan2, map(sub, self.xs, repeat(target.x)), map(sub, self.ys, repeat(target.y))))
+
+
+class Vector3Array(VectorArray):
+    """
+    Batch of Vector3 stored as xs, ys, zs component planes
+    """
+
+    _dimensions = 3
+    _vector = Vector3
+
+    @property
+    def xs(self) -> array:
+        return self._planes[0]
+
+    @property
+    def ys(self) -> array:
+        return self._planes[1]
+
+    @property
+    def zs(self) -> array:
+        return self._planes[2]
+
+    def cross(self, other: Union[Vector3Array, Vector3]) -> Vector3Array:
+        """
+        Return a new batch of Vectors perpendicular to every Vector in the batch and other
+        """
+
+        ox, oy, oz = self._other_planes(other)
+        xs, ys, zs = self._planes
+        return self.from_components(map(sub, map(mul, ys, oz), map(mul, zs, oy)),
+                                    map(sub, map(mul, zs, ox), map(mul, xs, oz)),
+                                    map(sub, map(mul, xs, oy), map(mul, ys, ox)))
@@ -0,0 +1,106 @@
+import math
+import unittest
+
+from PyMath.fixed_matrix import Matrix3, Matrix4
+from PyMath.linalg import LUFactorization
+from PyMath.matrix import Matrix
+from PyMath.vector import Vector2, Vector3
+from PyMath.vector_array import Vector3Array
+
+
+class FixedMatrixTests(object):
+
+    def assertValuesAlmostEqual(self, first, second, places=9):
+        first, second = list(first), list(second)
+        self.assertEqual(len(first), len(second))
+        for x, y in zip(first, second):
+            self.assertAlmostEqual(x, y, places=places)
+
+    def assertMatrixAlmostEqual(self, first, second, places=9):
+        self.assertEqual(first.size(), second.size())
+        self.assertValuesAlmostEqual(first._components, second._components, places)
+
+    def test_construction(self):
+        n = self.size
+        self.assertEqual(self.cls().tolist(), Matrix.identity(n).tolist())
+        values = list(range(n * n))
+        self.assertEqual(self.cls(*values).tolist(), self.cls(values).tolist())
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            self.cls(1, 2, 3)
+
+    def test_unrolled_product_matches_generic(self):
+        a, b = self.transform(), self.other()
+        product = a @ b
+        self.assertIsInstance(product, self.cls)
+        self.assertMatrixAlmostEqual(product, Matrix.matrix_multiply(a, b, "naive"))
+
+    def test_inverse_and_determinant(self):
+        a = self.transform()
+        lu = LUFactorization(a)
+        self.assertAlmostEqual(a.determinant(), lu.determinant())
+        self.assertIsInstance(a.inverse(), self.cls)
+        self.assertMatrixAlmostEqual(a.inverse(), lu.inverse())
+        self.assertMatrixAlmostEqual(a.affine_inverse(), lu.inverse())
+        self.assertMatrixAlmostEqual(a.transposed(), a.T)
+
+
+class Matrix3Test(FixedMatrixTests, unittest.TestCase):
+    cls, size = Matrix3, 3
+
+    def transform(self):
+        return Matrix3.trs(Vector2(3, -1), 0.7, Vector2(2, 0.5))
+
+    def other(self):
+        return Matrix3.rotation(-1.1) @ Matrix3.scale(3, 4)
+
+    def test_trs_is_the_product(self):
+        expected = Matrix3.translation(3, -1) @ Matrix3.rotation(0.7) @ Matrix3.scale(Vector2(2, 0.5))
+        self.assertMatrixAlmostEqual(self.transform(), expected)
+
+    def test_transform_point(self):
+        point = Matrix3.translation(1, 2) @ Matrix3.rotation(math.pi / 2) @ Vector2(1, 0)
+        self.assertValuesAlmostEqual(point, (1, 3))
+        self.assertValuesAlmostEqual(Matrix3(2, 0, 0, 0, 2, 0, 0, 0, 2) @ Vector2(1, 1), (1, 1))
+        self.assertValuesAlmostEqual(Matrix3.scale(2, 3) @ Vector3(1, 1, 1), (2, 3, 1))
+
+
+class Matrix4Test(FixedMatrixTests, unittest.TestCase):
+    cls, size = Matrix4, 4
+
+    def transform(self):
+        return Matrix4.trs(Vector3(1, 2, 3), Vector3(0.3, -0.5, 1.2), Vector3(2, 1, 0.5))
+
+    def other(self):
+        return Matrix4.perspective(1.0, 1.5, 0.1, 100)
+
+    def test_trs_is_the_product(self):
+        expected = Matrix4.translation(1, 2, 3) @ Matrix4.rotation(Vector3(0.3, -0.5, 1.2)) @ Matrix4.scale(2, 1, 0.5)
+        self.assertMatrixAlmostEqual(self.transform(), expected)
+        rotation = Matrix4.rotation_z(1.2) @ Matrix4.rotation_y(-0.5) @ Matrix4.rotation_x(0.3)
+        self.assertMatrixAlmostEqual(Matrix4.rotation(Vector3(0.3, -0.5, 1.2)), rotation)
+
+    def test_transforms(self):
+        m = self.transform()
+        points = [Vector3(1, 0, 0), Vector3(-2, 5, 0.5), Vector3(0, 0, 0)]
+        expected = [m @ point for point in points]
+        for point, value in zip(m.transform_points(points), expected):
+            self.assertValuesAlmostEqual(point, value)
+        batch = m.transform_points(Vector3Array(points))
+        self.assertIsInstance(batch, Vector3Array)
+        for point, value in zip(batch, expected):
+            self.assertValuesAlmostEqual(point, value)
+
+        direction = m.transform_direction(Vector3(1, 2, 3))
+        self.assertValuesAlmostEqual(direction, m @ Vector3(1, 2, 3) - m @ Vector3(0, 0, 0))
+
+    def test_projection_divides_by_w(self):
+        near = Matrix4.perspective(1.0, 1.0, 1.0, 10.0) @ Vector3(0, 0, -1)
+        far = Matrix4.perspective(1.0, 1.0, 1.0, 10.0) @ Vector3(0, 0, -10)
+        self.assertAlmostEqual(near.z, -1.0)
+        self.assertAlmostEqual(far.z, 1.0)
+        ortho = Matrix4.orthographic(-2, 2, -1, 1, 0, 10) @ Vector3(2, -1, -10)
+        self.assertValuesAlmostEqual(ortho, (1, -1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from PyMath.lazy import LazyMatrix, lazy
+from PyMath.matrix import Matrix
+
+
+def grid(rows, cols, offset=0.0):
+    return Matrix.from_rows([[offset + i * cols + j + 1.0 for j in range(cols)] for i in range(rows)])
+
+
+class LazyMatrixTest(unittest.TestCase):
+
+    def assertMatrixAlmostEqual(self, first, second, places=7):
+        self.assertEqual(first.size(), second.size())
+        for x, y in zip(first._components, second._components):
+            self.assertAlmostEqual(x, y, places=places)
+
+    def test_leaf(self):
+        m = grid(2, 3)
+        leaf = m.lazy()
+        self.assertIsInstance(leaf, LazyMatrix)
+        self.assertEqual(leaf.size(), (2, 3))
+        self.assertIs(leaf.evaluate(), m)
+        self.assertIs(lazy(m).evaluate(), m)
+
+    def test_chain_picks_the_cheapest_order(self):
+        a, b, c = grid(10, 100), grid(100, 5), grid(5, 50)
+        expression = a.lazy() @ b @ c
+        self.assertEqual(repr(expression), "(Matrix(10, 100) @ Matrix(100, 5) @ Matrix(5, 50))")
+        self.assertEqual(expression.chain_cost(), 10 * 100 * 5 + 10 * 5 * 50)
+        self.assertMatrixAlmostEqual(expression.evaluate(), (a @ b) @ c)
+        self.assertMatrixAlmostEqual((a @ (b.lazy() @ c)).evaluate("naive"), (a @ b) @ c)
+
+    def test_fused_elementwise(self):
+        a, b = grid(3, 4), grid(3, 4, 0.5)
+        expression = -(a.lazy() * 2 + b) / a - 1 + b * 3 - 6 / a.lazy()
+        expected = (((-(a * 2 + b)) / a - 1) + b * 3) - Matrix.from_rows([[6 / x for x in row] for row in a.tolist()])
+        self.assertMatrixAlmostEqual(expression.evaluate(), expected)
+        self.assertEqual((2 - a.lazy()).evaluate().tolist(), (-a + 2).tolist())
+
+    def test_mixed_tree_with_shared_subtree(self):
+        a, b = grid(4, 3), grid(3, 4)
+        product = a.lazy() @ b
+        expression = product * product + product
+        expected = a @ b
+        self.assertMatrixAlmostEqual(expression.evaluate(), expected * expected + expected)
+
+    def test_large_elementwise_runs_in_chunks(self):
+        a = grid(70, 70)
+        self.assertTrue((a.lazy() * 3 - a - a).evaluate() == a)
+
+    def test_shapes_are_checked_when_built(self):
+        a, b = grid(2, 3), grid(3, 2)
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            a.lazy() + b
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            a.lazy() @ a
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+from PyMath.linalg import IncrementalInverse, LUFactorization
+from PyMath.matrix import Matrix
+from PyMath.vector import Vector
+
+A = [[2.0, 1.0, 1.0], [4.0, -6.0, 0.0], [-2.0, 7.0, 2.0]]
+
+
+class MatrixAssertions(object):
+
+    def assertMatrixAlmostEqual(self, first, second, places=9):
+        self.assertEqual(first.size(), second.size())
+        for x, y in zip(first._components, second._components):
+            self.assertAlmostEqual(x, y, places=places)
+
+
+class LUFactorizationTest(MatrixAssertions, unittest.TestCase):
+
+    def test_factors(self):
+        a = Matrix.from_rows(A)
+        lu = LUFactorization(a)
+        permuted = Matrix.from_rows([A[i] for i in lu.permutation])
+        self.assertMatrixAlmostEqual(lu.lower() @ lu.upper(), permuted)
+        self.assertFalse(lu.singular)
+        self.assertAlmostEqual(lu.determinant(), -16.0)
+
+    def test_solve_and_inverse(self):
+        a = Matrix.from_rows(A)
+        lu = a.lu()
+        x = lu.solve([5.0, -2.0, 9.0])
+        self.assertIsInstance(x, Vector)
+        for value, expected in zip(x, (1.0, 1.0, 2.0)):
+            self.assertAlmostEqual(value, expected)
+        self.assertMatrixAlmostEqual(a @ lu.inverse(), Matrix.identity(3))
+        b = Matrix.from_rows([[5.0, 1.0], [-2.0, 0.0], [9.0, 0.0]])
+        self.assertMatrixAlmostEqual(a @ lu.solve(b), b)
+
+    def test_singular(self):
+        lu = LUFactorization(Matrix.from_rows([[1.0, 2.0], [2.0, 4.0]]))
+        self.assertTrue(lu.singular)
+        self.assertEqual(lu.determinant(), 0.0)
+        with self.assertRaises(Matrix.Exceptions.MatrixSingularError):
+            lu.solve([1.0, 1.0])
+        with self.assertRaises(Matrix.Exceptions.MatrixSingularError):
+            lu.inverse()
+
+    def test_square_only(self):
+        with self.assertRaises(Matrix.Exceptions.MatrixSquareError):
+            LUFactorization(Matrix.from_rows([[1.0, 2.0, 3.0]]))
+
+
+class IncrementalInverseTest(MatrixAssertions, unittest.TestCase):
+
+    def test_updates_track_a_fresh_inverse(self):
+        a = Matrix.from_rows(A)
+        tracked = IncrementalInverse(a, check_interval=0)
+        tracked.rank_one_update([1.0, 0.0, 2.0], [0.5, 1.0, 0.0])
+        tracked.update(Matrix.from_rows([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]),
+                       Matrix.from_rows([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]]))
+        self.assertEqual(tracked.updates, 2)
+        self.assertEqual(a.tolist(), A)
+        self.assertMatrixAlmostEqual(tracked.inverse, LUFactorization(tracked.matrix).inverse())
+        self.assertLess(tracked.drift(), 1e-9)
+
+        x = tracked.solve(Vector(1.0, 2.0, 3.0))
+        self.assertMatrixAlmostEqual(tracked.matrix @ Matrix.from_rows([[value] for value in x]),
+                                     Matrix.from_rows([[1.0], [2.0], [3.0]]))
+
+    def test_drift_check_refactorizes(self):
+        tracked = IncrementalInverse(Matrix.from_rows(A), drift_tolerance=-1, check_interval=2)
+        for _ in range(4):
+            tracked.rank_one_update([0.1, 0.0, 0.0], [0.0, 0.1, 0.0])
+        self.assertEqual(tracked.refactorizations, 2)
+        self.assertEqual(tracked.updates, 0)
+
+    def test_singular_update_changes_nothing(self):
+        tracked = IncrementalInverse(Matrix.identity(2))
+        with self.assertRaises(Matrix.Exceptions.MatrixSingularError):
+            tracked.rank_one_update([-1.0, 0.0], [1.0, 0.0])
+        self.assertEqual(tracked.matrix.tolist(), [[1.0, 0.0], [0.0, 1.0]])
+        self.assertEqual(tracked.updates, 0)
+        with self.assertRaises(ValueError):
+            tracked.rank_one_update([1.0], [1.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import unittest
+from array import array
+
+from PyMath import matmul, parallel
+
+SHAPES = [(1, 1, 1), (1, 5, 1), (3, 1, 4), (2, 3, 4), (5, 7, 3), (7, 7, 7), (9, 4, 11), (16, 16, 16), (13, 17, 6)]
+
+
+def operands(rows, inner, cols, seed=0):
+    rng = random.Random(seed)
+    return (array("d", [rng.uniform(-1, 1) for _ in range(rows * inner)]),
+            array("d", [rng.uniform(-1, 1) for _ in range(inner * cols)]))
+
+
+class EngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = vars(matmul.settings).copy()
+        matmul.settings.strassen_leaf = 2  # Recurse even on small shapes
+        matmul.settings.block_size = 3  # More than one tile of columns
+
+    def tearDown(self):
+        vars(matmul.settings).update(self.saved)
+
+    def check(self, engine):
+        for rows, inner, cols in SHAPES:
+            with self.subTest(engine=engine, shape=(rows, inner, cols)):
+                a, b = operands(rows, inner, cols)
+                expected = matmul.naive(a, b, rows, inner, cols)
+                result = matmul.multiply(a, b, rows, inner, cols, engine)
+                self.assertIsInstance(result, array)
+                self.assertEqual(len(result), rows * cols)
+                for x, y in zip(result, expected):
+                    self.assertAlmostEqual(x, y, places=9)
+
+    def test_naive(self):
+        a, b = array("d", [1, 2, 3, 4, 5, 6]), array("d", [7, 8, 9, 10, 11, 12])
+        self.assertEqual(list(matmul.naive(a, b, 2, 3, 2)), [58.0, 64.0, 139.0, 154.0])
+
+    def test_blocked(self):
+        self.check("blocked")
+
+    def test_strassen(self):
+        self.check("strassen")
+
+    @unittest.skipUnless(matmul.has_numpy(), "numpy is not installed")
+    def test_numpy(self):
+        self.check("numpy")
+
+    def test_parallel(self):
+        try:
+            self.check("parallel")
+        finally:
+            parallel.shutdown()
+
+    def test_unknown_engine(self):
+        a, b = operands(2, 2, 2)
+        with self.assertRaises(ValueError):
+            matmul.multiply(a, b, 2, 2, 2, "fast")
+
+
+class SelectEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = vars(matmul.settings).copy()
+        matmul.settings.numpy_threshold = 1 << 20
+
+    def tearDown(self):
+        vars(matmul.settings).update(self.saved)
+
+    def test_strassen_is_opt_in(self):
+        self.assertEqual(matmul.select_engine(1024, 1024, 1024), "blocked")
+        matmul.settings.strassen_threshold = 512
+        self.assertEqual(matmul.select_engine(1024, 1024, 1024), "strassen")
+        self.assertEqual(matmul.select_engine(1024, 256, 1024), "blocked")
+
+    def test_fixed_engine(self):
+        matmul.settings.engine = "naive"
+        self.assertEqual(matmul.select_engine(4, 4, 4), "naive")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import math
+import os
+import tempfile
+import unittest
+from array import array
+
+from PyMath.matrix import Matrix, MatrixView
+
+
+def grid(rows, cols):
+    return Matrix.from_rows([[float(i * cols + j) for j in range(cols)] for i in range(rows)])
+
+
+class FlatMatrixTest(unittest.TestCase):
+
+    def test_storage_is_flat_row_major(self):
+        m = grid(2, 3)
+        self.assertIsInstance(m._components, array)
+        self.assertEqual(list(m._components), [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(m.size(), (2, 3))
+        self.assertEqual(len(m), 6)
+        self.assertEqual(m[1, 2], 5.0)
+        self.assertEqual(m[-1, -3], 3.0)
+        self.assertEqual([list(row) for row in m], m.tolist())
+        self.assertFalse(hasattr(m, "__dict__"))
+
+    def test_elementwise(self):
+        a, b = grid(2, 3), grid(2, 3) + 1
+        self.assertEqual((a + b).tolist(), [[1.0, 3.0, 5.0], [7.0, 9.0, 11.0]])
+        self.assertEqual((b - a).tolist(), [[1.0] * 3] * 2)
+        self.assertEqual((a * b).tolist(), [[0.0, 2.0, 6.0], [12.0, 20.0, 30.0]])
+        self.assertEqual((a / 2).tolist(), [[0.0, 0.5, 1.0], [1.5, 2.0, 2.5]])
+        self.assertEqual((-a)._components, array("d", [-0.0, -1.0, -2.0, -3.0, -4.0, -5.0]))
+        self.assertEqual(Matrix.add(a, b), a + b)
+        self.assertEqual(Matrix.multiply(a, b), a * b)
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            a + grid(3, 2)
+
+    def test_in_place_keeps_the_buffer(self):
+        m = grid(2, 2)
+        storage = m._components
+        m += 1
+        m *= grid(2, 2)
+        m -= 1
+        m /= 2
+        self.assertIs(m._components, storage)
+        self.assertEqual(m.tolist(), [[-0.5, 0.5], [2.5, 5.5]])
+
+    def test_copy_and_equality(self):
+        m = grid(2, 2)
+        copy = m.copy()
+        self.assertEqual(copy, m)
+        copy[0, 0] = 9.0
+        self.assertNotEqual(copy, m)
+        self.assertNotEqual(grid(1, 4), grid(2, 2))
+
+    def test_constructors(self):
+        self.assertEqual(Matrix.identity(3).tolist(), [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        self.assertEqual(Matrix.matrix_from_list([[1, 2], [3, 4]]).tolist(), [[1.0, 2.0], [3.0, 4.0]])
+        self.assertEqual(Matrix.random(3).size(), (3, 3))
+        self.assertEqual(Matrix.random((2, 4)).size(), (4, 4))
+        with self.assertRaises(ValueError):
+            Matrix.from_rows([[1, 2], [3]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "m.txt")
+            with open(path, "w") as f:
+                f.write("# comment\n1 2 3\n\n4 5 6\n")
+            self.assertEqual(Matrix.from_file(path).tolist(), [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def test_frobenius_helpers(self):
+        a, b = grid(2, 2), Matrix.identity(2)
+        self.assertAlmostEqual(a.mag(), math.sqrt(14))
+        self.assertEqual(a.dot(b), 3.0)
+        self.assertAlmostEqual(a.distance(b), math.sqrt(10))
+        self.assertAlmostEqual(a.normalized().mag(), 1.0)
+
+    def test_products_and_solvers(self):
+        a = Matrix.from_rows([[4.0, 3.0], [6.0, 3.0]])
+        self.assertEqual((a @ Matrix.identity(2)).tolist(), a.tolist())
+        self.assertEqual((grid(2, 3) @ grid(3, 1)).tolist(), [[5.0], [14.0]])
+        self.assertAlmostEqual(a.determinant(), -6.0)
+        self.assertEqual([round(x, 9) for x in a.solve([10.0, 12.0])], [1.0, 2.0])
+        for x, y in zip((a @ a.inverse())._components, Matrix.identity(2)._components):
+            self.assertAlmostEqual(x, y)
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            grid(2, 3) @ grid(2, 3)
+
+
+class MatrixViewTest(unittest.TestCase):
+
+    def test_views_share_storage(self):
+        m = grid(3, 4)
+        view = m[0:2, 1:3]
+        self.assertIsInstance(view, MatrixView)
+        self.assertEqual(view.tolist(), [[1.0, 2.0], [5.0, 6.0]])
+        view[0, 0] = 42.0
+        self.assertEqual(m[0, 1], 42.0)
+        self.assertEqual(m.T.tolist(), [list(column) for column in zip(*m.tolist())])
+        self.assertEqual(m[::-1, ::-2].tolist(), [row[::-2] for row in m.tolist()[::-1]])
+
+    def test_block_assignment(self):
+        m = grid(3, 3)
+        m[0:2, 0:2] = [[-1, -2], [-3, -4]]
+        self.assertEqual(m.tolist(), [[-1.0, -2.0, 2.0], [-3.0, -4.0, 5.0], [6.0, 7.0, 8.0]])
+        m[1:, 1:] = 0
+        self.assertEqual(m.tolist(), [[-1.0, -2.0, 2.0], [-3.0, 0.0, 0.0], [6.0, 0.0, 0.0]])
+        m[:, 0] = grid(3, 1)
+        self.assertEqual([row[0] for row in m.tolist()], [0.0, 1.0, 2.0])
+
+    def test_block_assignment_checks_shape(self):
+        m = grid(3, 3)
+        before = m.tolist()
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            m[0:2, 0:2] = [[1, 2, 3], [4, 5, 6]]
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            m[0:2, 0:2] = [[1, 2]]
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            m[0:2, 0:2] = grid(3, 2)
+        self.assertEqual(len(m._components), 9)
+        self.assertEqual(m.tolist(), before)
+
+    def test_row_assignment_checks_length(self):
+        m = grid(3, 3)
+        m[1] = [7, 8, 9]
+        self.assertEqual(m.tolist()[1], [7.0, 8.0, 9.0])
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            m[1] = [1, 2]
+        with self.assertRaises(ValueError):
+            m.row(2)[:] = [1, 2, 3, 4]
+        self.assertEqual(m.tolist()[2], [6.0, 7.0, 8.0])
+
+
+class MatrixBufferTest(unittest.TestCase):
+
+    def test_as_buffer_shares_storage(self):
+        m = grid(2, 3)
+        view = m.as_buffer()
+        self.assertEqual(view.shape, (2, 3))
+        view[1, 2] = -1.0
+        self.assertEqual(m[1, 2], -1.0)
+        self.assertEqual(m.as_buffer("f").tolist(), [[0.0, 1.0, 2.0], [3.0, 4.0, -1.0]])
+
+    def test_as_buffer_empty(self):
+        for shape in ((0, 3), (3, 0), (0, 0)):
+            m = Matrix._from_buffer(shape, array("d"))
+            self.assertEqual(m.as_buffer().tolist(), [])
+            self.assertEqual(m.as_buffer("f").tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from PyMath import npy
+from PyMath.matrix import Matrix, MatrixView
+from PyMath.vector import Vector, Vector3
+from PyMath.vector_array import Vector2Array, Vector3Array
+
+ROWS = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+
+
+def write_npy(path, descr, fortran_order, shape, payload):
+    text = f"{{'descr': '{descr}', 'fortran_order': {fortran_order}, 'shape': {shape}, }}"
+    text += " " * (-(len(text) + 11) % 64) + "\n"
+    with open(path, "wb") as f:
+        f.write(npy.MAGIC + bytes((1, 0)) + len(text).to_bytes(2, "little") + text.encode("latin1") + payload)
+
+
+class NpyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "m.npy")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_header_is_aligned(self):
+        Matrix.from_rows(ROWS).save(self.path)
+        with open(self.path, "rb") as f:
+            typecode, swap, fortran_order, shape, offset = npy.read_header(f)
+        self.assertEqual((typecode, swap, fortran_order, shape), ("d", False, False, (2, 3)))
+        self.assertEqual(offset % 64, 0)
+        self.assertEqual(os.path.getsize(self.path), offset + 6 * 8)
+
+    def test_round_trip_in_every_mode(self):
+        Matrix.from_rows(ROWS).save(self.path)
+        for mode in npy.MMAP_MODES:
+            with self.subTest(mmap_mode=mode):
+                self.assertEqual(Matrix.load(self.path, mmap_mode=mode).tolist(), ROWS)
+
+    def test_mapped_assignment(self):
+        Matrix.from_rows(ROWS).save(self.path)
+        with self.assertRaises(TypeError):
+            Matrix.load(self.path, "r")[0, 0] = 9.0
+
+        copied = Matrix.load(self.path, "c")
+        copied[0, 0] = 9.0
+        self.assertEqual(copied[0, 0], 9.0)
+        self.assertEqual(Matrix.load(self.path, None)[0, 0], 1.0)
+
+        written = Matrix.load(self.path, "r+")
+        written[1, 2] = -6.0
+        del written
+        self.assertEqual(Matrix.load(self.path, None)[1, 2], -6.0)
+
+    def test_vectors(self):
+        npy.save(self.path, Vector(1.0, 2.0, 3.0, 4.0))
+        vector = npy.load(self.path)
+        self.assertIsInstance(vector, Vector)
+        self.assertEqual(list(vector), [1.0, 2.0, 3.0, 4.0])
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path)
+
+        batch = Vector3Array([Vector3(1, 2, 3), Vector3(4, 5, 6)])
+        npy.save(self.path, batch)
+        self.assertEqual(Matrix.load(self.path).tolist(), ROWS)
+        loaded = npy.load_vectors(self.path)
+        self.assertIsInstance(loaded, Vector3Array)
+        self.assertEqual([list(v) for v in loaded], ROWS)
+
+        Matrix.from_rows([[1.0, 2.0], [3.0, 4.0]]).save(self.path)
+        self.assertIsInstance(npy.load_vectors(self.path), Vector2Array)
+        Matrix.from_rows([[1.0] * 4]).save(self.path)
+        with self.assertRaises(ValueError):
+            npy.load_vectors(self.path)
+
+    def test_save_rows_streams(self):
+        shape = npy.save_rows(self.path, ([float(i), float(i * i)] for i in range(1000)))
+        self.assertEqual(shape, (1000, 2))
+        loaded = Matrix.load(self.path)
+        self.assertEqual(loaded.size(), (1000, 2))
+        self.assertEqual(loaded.tolist()[-1], [999.0, 998001.0])
+        with self.assertRaises(ValueError):
+            npy.save_rows(self.path, [[1.0, 2.0], [3.0]])
+
+    def test_foreign_layouts(self):
+        write_npy(self.path, "<f8", True, (2, 3), struct.pack("<6d", 1, 4, 2, 5, 3, 6))
+        fortran = Matrix.load(self.path)
+        self.assertIsInstance(fortran, MatrixView)
+        self.assertEqual(fortran.tolist(), ROWS)
+
+        write_npy(self.path, ">f8", False, (2, 3), struct.pack(">6d", 1, 2, 3, 4, 5, 6))
+        self.assertEqual(Matrix.load(self.path).tolist(), ROWS)
+        write_npy(self.path, "<f4", False, (2, 3), struct.pack("<6f", 1, 2, 3, 4, 5, 6))
+        self.assertEqual(Matrix.load(self.path).tolist(), ROWS)
+
+        write_npy(self.path, "<i8", False, (2, 3), struct.pack("<6q", 1, 2, 3, 4, 5, 6))
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path)
+        with self.assertRaises(ValueError):
+            Matrix.load(self.path, mmap_mode="w")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import operator
+import unittest
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from PyMath import parallel
+
+
+def shared(values):
+    memory = SharedMemory(create=True, size=max(8, 8 * len(values)))
+    memory.buf[:8 * len(values)] = array("d", values).tobytes()
+    return memory
+
+
+class WorkerTest(unittest.TestCase):
+    """Workers run in process here, an error in a block has to surface as is"""
+
+    def setUp(self):
+        self.memories = []
+
+    def tearDown(self):
+        for memory in self.memories:
+            memory.close()
+            memory.unlink()
+
+    def make(self, values):
+        memory = shared(values)
+        self.memories.append(memory)
+        return memory.name
+
+    def test_matmul_block(self):
+        a, b, out = self.make([1, 2, 3, 4]), self.make([5, 6, 7, 8]), self.make([0] * 4)
+        parallel._matmul_block(a, b, out, 2, 2, 0, 2)
+        self.assertEqual(list(self.memories[2].buf.cast("d")[:4]), [19.0, 22.0, 43.0, 50.0])
+
+    def test_matmul_block_error_is_not_hidden(self):
+        a, b, out = self.make([1, 2, 3, 4]), self.make([5, 6, 7, 8]), self.make([0])
+        with self.assertRaises(ValueError):
+            parallel._matmul_block(a, b, out, 2, 2, 0, 2)
+
+    def test_elementwise_block_error_is_not_hidden(self):
+        a, b, out = self.make([1, 2]), self.make([1, 0]), self.make([0, 0])
+        with self.assertRaises(ZeroDivisionError):
+            parallel._elementwise_block(a, b, 0.0, out, operator.truediv, 0, 2)
+        parallel._elementwise_block(a, None, 2.0, out, operator.mul, 0, 2)
+        self.assertEqual(list(self.memories[2].buf.cast("d")[:2]), [2.0, 4.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
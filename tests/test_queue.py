@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from PyMath.queue import AsyncQueue, DelayQueue, PriorityQueue, Queue, QueueClosedError, QueueTimeoutError
+
+
+class QueueTest(unittest.TestCase):
+
+    def test_push_many_pull_many(self):
+        queue = Queue()
+        queue.push_many(iter(range(5)))
+        self.assertEqual(len(queue), 5)
+        self.assertEqual(queue.pull_many(3), [0, 1, 2])
+        self.assertEqual(queue.pull_many(10), [3, 4])
+        self.assertEqual(queue.pull_many(0), [])
+
+    def test_pull_many_waits_for_the_first_item_only(self):
+        queue = Queue()
+        start = time.monotonic()
+        self.assertEqual(queue.pull_many(2, timeout=0.02), [])
+        self.assertGreaterEqual(time.monotonic() - start, 0.02)
+
+        timer = threading.Timer(0.02, queue.push_many, ([1, 2, 3],))
+        timer.start()
+        self.assertEqual(queue.pull_many(2), [1, 2])
+        timer.join()
+        self.assertEqual(queue.pull_many(2, timeout=0), [3])
+
+    def test_drain(self):
+        queue = Queue([1, 2, 3])
+        self.assertEqual(queue.drain(), [1, 2, 3])
+        self.assertEqual(len(queue), 0)
+        queue.push(4)
+        self.assertEqual(queue.drain(), [4])
+
+    def test_unique_push_many_drain_and_flush(self):
+        queue = Queue(key=lambda job: job["id"], on_duplicate="update")
+        queue.push_many([{"id": 1, "v": 0}, {"id": 2, "v": 0}, {"id": 1, "v": 1}])
+        self.assertEqual(len(queue), 2)
+
+        flushed = queue.flush()
+        self.assertIs(type(flushed), Queue)
+        self.assertEqual(len(queue), 0)
+        self.assertNotIn({"id": 1}, queue)
+        queue.push({"id": 1, "v": 2})
+        self.assertEqual(queue.drain(), [{"id": 1, "v": 2}])
+
+        self.assertIn({"id": 2}, flushed)
+        flushed.push({"id": 2, "v": 5})
+        self.assertEqual(len(flushed), 2)
+        self.assertEqual(flushed.drain(), [{"id": 1, "v": 1}, {"id": 2, "v": 5}])
+
+    def test_pull_timeout_zero_does_not_wait(self):
+        queue = Queue()
+        start = time.monotonic()
+        with self.assertRaises(QueueTimeoutError):
+            queue.pull(blocking=True, timeout=0)
+        self.assertEqual(queue.pull_many(4, timeout=0), [])
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_blocking_pull_waits_by_default(self):
+        queue = Queue()
+        timer = threading.Timer(0.05, queue.push, ("late",))
+        timer.start()
+        self.assertEqual(queue.pull(blocking=True), "late")
+        timer.join()
+        with self.assertRaises(QueueTimeoutError):
+            queue.pull(blocking=True, timeout=0.01)
+
+
+class PriorityQueueTest(unittest.TestCase):
+
+    def test_push_takes_tuple_records_as_single_items(self):
+        queue = PriorityQueue(priority=lambda record: record[1])
+        handle = queue.push(("a", 5))
+        queue.push(("b", 1))
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(handle.priority, 5)
+        self.assertEqual(queue.pull(), ("b", 1))
+        self.assertEqual(queue.pull(), ("a", 5))
+
+    def test_equal_priorities_keep_push_order(self):
+        queue = PriorityQueue(priority=len)
+        queue.push_many(["bb", "a", "c", "dd", "e"])
+        self.assertEqual(queue.pull_many(5), ["a", "c", "e", "bb", "dd"])
+
+    def test_handles(self):
+        queue = PriorityQueue()
+        a, b, c = queue.push_many("abc")
+        self.assertTrue(b.cancel())
+        self.assertFalse(b.cancel())
+        self.assertFalse(b.queued())
+        self.assertTrue(c.update("0"))
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.pull(), "c")
+        self.assertFalse(c.update("z"))
+        self.assertEqual(queue.drain(), ["a"])
+        self.assertFalse(a.queued())
+
+    def test_unique_handles(self):
+        queue = PriorityQueue(unique=True)
+        first, duplicate = queue.push_many([3, 3])
+        self.assertIsNone(duplicate)
+        self.assertTrue(first.cancel())
+        self.assertIsNotNone(queue.push(3, priority=1))
+        self.assertEqual(queue.pull(), 3)
+
+    def test_flush_takes_the_heap(self):
+        queue = PriorityQueue([3, 1, 2])
+        handle = queue.push(0)
+        flushed = queue.flush()
+        self.assertFalse(handle.queued())
+        self.assertFalse(handle.cancel())
+        self.assertEqual(len(queue), 0)
+        self.assertIs(type(flushed), PriorityQueue)
+        self.assertEqual(flushed.drain(), [0, 1, 2, 3])
+
+    def test_default_items_are_pushed_one_by_one(self):
+        queue = PriorityQueue([("a", 2), ("b", 1)], priority=lambda record: record[1])
+        self.assertEqual(queue.drain(), [("b", 1), ("a", 2)])
+        self.assertEqual(len(DelayQueue([1, 2])), 2)
+
+
+class DelayQueueTest(unittest.TestCase):
+
+    def test_items_wait_for_their_delay(self):
+        queue = DelayQueue()
+        queue.push("later", 0.05)
+        queue.push_many(["now", "also now"])
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.drain(), ["now", "also now"])
+        self.assertIsNone(queue.pull())
+        self.assertEqual(queue.pull_many(2, timeout=0), [])
+        with self.assertRaises(QueueTimeoutError):
+            queue.pull(blocking=True, timeout=0.01)
+        self.assertEqual(queue.pull(blocking=True, timeout=1), "later")
+
+    def test_update_brings_a_deadline_forward(self):
+        queue = DelayQueue()
+        handle = queue.push("job", 60)
+        threading.Timer(0.02, handle.update, (0,)).start()
+        start = time.monotonic()
+        self.assertEqual(queue.pull(blocking=True, timeout=5), "job")
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_pull_many_waits_for_the_first_deadline(self):
+        queue = DelayQueue()
+        queue.push_many([1, 2], 0.02)
+        queue.push(3, 60)
+        self.assertEqual(queue.pull_many(5, timeout=1), [1, 2])
+        self.assertEqual(len(queue), 1)
+
+
+class AsyncQueueTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_maxsize_bounds_equal_items(self):
+        queue = AsyncQueue(maxsize=2)
+        await queue.push(1)
+        await queue.push(1)
+        pusher = asyncio.create_task(queue.push(1))
+        await asyncio.sleep(0.01)
+        self.assertFalse(pusher.done())
+        self.assertEqual(len(queue), 2)
+
+        self.assertEqual(await queue.pull(), 1)
+        await asyncio.wait_for(pusher, 1)
+        self.assertEqual(len(queue), 2)
+
+    async def test_unique_duplicate_skips_backpressure(self):
+        queue = AsyncQueue(maxsize=1, key=lambda job: job["id"], on_duplicate="update")
+        await queue.push({"id": 1, "value": 0})
+        await asyncio.wait_for(queue.push({"id": 1, "value": 1}), 1)
+        self.assertEqual(len(queue), 1)
+        self.assertEqual((await queue.pull())["value"], 1)
+
+    async def test_pull_timeout_zero_does_not_wait(self):
+        queue = AsyncQueue()
+        with self.assertRaises(QueueTimeoutError):
+            await asyncio.wait_for(queue.pull(timeout=0), 1)
+        await queue.push(1)
+        self.assertEqual(await queue.pull(timeout=0), 1)
+
+    async def test_push_threadsafe_before_first_await(self):
+        queue = AsyncQueue()
+        producer = threading.Thread(target=lambda: [queue.push_threadsafe(i) for i in range(3)])
+        producer.start()
+        producer.join()
+        self.assertEqual([await queue.pull(timeout=1) for _ in range(3)], [0, 1, 2])
+
+    async def test_close_releases_blocked_pusher(self):
+        queue = AsyncQueue(maxsize=1)
+        await queue.push(1)
+        pusher = asyncio.create_task(queue.push(2))
+        await asyncio.sleep(0.01)
+        queue.close()
+        with self.assertRaises(QueueClosedError):
+            await asyncio.wait_for(pusher, 1)
+        self.assertEqual([item async for item in queue], [1])
+
+    async def test_close_releases_blocked_puller(self):
+        queue = AsyncQueue()
+        puller = asyncio.create_task(queue.pull())
+        await asyncio.sleep(0.01)
+        queue.close()
+        with self.assertRaises(QueueClosedError):
+            await asyncio.wait_for(puller, 1)
+
+
+
+class AsyncQueueLoopTest(unittest.TestCase):
+
+    def test_queue_created_outside_the_loop(self):
+        loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(RuntimeError):
+                AsyncQueue().push_threadsafe(0)
+
+            queue = AsyncQueue(loop=loop)
+            futures = []
+            producer = threading.Thread(target=lambda: futures.extend(queue.push_threadsafe(i) for i in range(3)))
+            producer.start()
+
+            async def consume():
+                return [await queue.pull(timeout=1) for _ in range(3)]
+
+            self.assertEqual(loop.run_until_complete(consume()), [0, 1, 2])
+            producer.join()
+            self.assertTrue(all(future.done() for future in futures))
+        finally:
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
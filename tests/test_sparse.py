@@ -0,0 +1,99 @@
+import unittest
+
+from PyMath.matrix import Matrix
+from PyMath.sparse import COOMatrix, CSRMatrix
+from PyMath.vector import Vector
+
+DENSE = [[1.0, 0.0, 0.0, 2.0],
+         [0.0, 0.0, 0.0, 0.0],
+         [0.0, 3.0, -4.0, 0.0]]
+
+
+def coo():
+    matrix = COOMatrix((3, 4))
+    matrix.extend([(2, 2, -4.0), (0, 3, 1.5), (0, 0, 1.0), (2, 1, 3.0), (0, 3, 0.5), (1, 1, 2.0), (1, 1, -2.0)])
+    return matrix
+
+
+class COOMatrixTest(unittest.TestCase):
+
+    def test_tocsr_sums_duplicates_and_drops_zeros(self):
+        matrix = coo()
+        self.assertEqual(matrix.nnz, 7)
+        csr = matrix.tocsr()
+        self.assertEqual(csr.nnz, 4)
+        self.assertEqual(csr.todense().tolist(), DENSE)
+        self.assertEqual(csr.row_items(0), [(0, 1.0), (3, 2.0)])
+        self.assertEqual(csr.row_items(1), [])
+        self.assertEqual(csr.tocoo().tocsr(), csr)
+
+    def test_bounds(self):
+        with self.assertRaises(IndexError):
+            COOMatrix((2, 2)).append(2, 0, 1.0)
+        with self.assertRaises(ValueError):
+            COOMatrix((2, 2), [0, 1], [0], [1.0, 2.0])
+
+
+class CSRMatrixTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sparse = CSRMatrix.from_dense(Matrix.from_rows(DENSE))
+        self.dense = Matrix.from_rows(DENSE)
+        self.other = Matrix.from_rows([[float(i * 4 + j) for j in range(4)] for i in range(3)])
+
+    def test_from_dense(self):
+        self.assertEqual(self.sparse, coo().tocsr())
+        self.assertEqual(CSRMatrix.from_dense(self.other, tolerance=5.0).nnz, 6)
+        self.assertEqual(CSRMatrix.identity(3).todense().tolist(), Matrix.identity(3).tolist())
+        self.assertAlmostEqual(self.sparse.density, 4 / 12)
+
+    def test_indexing(self):
+        self.assertEqual(self.sparse[2, 2], -4.0)
+        self.assertEqual(self.sparse[1, 3], 0.0)
+        self.assertEqual(self.sparse[-1, -2], -4.0)
+        self.assertEqual(list(self.sparse[0]), DENSE[0])
+        with self.assertRaises(IndexError):
+            self.sparse[3, 0]
+        with self.assertRaises(IndexError):
+            self.sparse[0, 4]
+
+    def test_transposed(self):
+        self.assertEqual(self.sparse.transposed().todense().tolist(), self.dense.T.tolist())
+        self.assertEqual(self.sparse.transposed().transposed(), self.sparse)
+
+    def test_elementwise(self):
+        self.assertIsInstance(self.sparse + self.sparse, CSRMatrix)
+        self.assertEqual((self.sparse + self.sparse).todense().tolist(), (self.dense * 2).tolist())
+        self.assertEqual((self.sparse - self.sparse).nnz, 0)
+        self.assertEqual((self.sparse * self.other).todense().tolist(), (self.dense * self.other).tolist())
+        self.assertEqual((self.sparse / 2).todense().tolist(), (self.dense / 2).tolist())
+        self.assertEqual((-self.sparse).todense().tolist(), (-self.dense).tolist())
+
+        dense_sum = self.sparse + self.other
+        self.assertIsInstance(dense_sum, Matrix)
+        self.assertEqual(dense_sum.tolist(), (self.dense + self.other).tolist())
+        self.assertEqual((1 - self.sparse).tolist(), (-self.dense + 1).tolist())
+
+    def test_products_match_dense(self):
+        square = Matrix.from_rows([[1.0, 2.0, 0.0], [0.0, -1.0, 3.0], [4.0, 0.0, 1.0], [0.0, 5.0, 0.0]])
+        expected = (self.dense @ square).tolist()
+
+        self.assertEqual((self.sparse @ square).tolist(), expected)
+        product = self.sparse @ CSRMatrix.from_dense(square)
+        self.assertIsInstance(product, CSRMatrix)
+        self.assertEqual(product.todense().tolist(), expected)
+        self.assertEqual((square.T @ self.sparse.transposed()).tolist(), (square.T @ self.dense.T).tolist())
+
+        vector = self.sparse @ Vector(1.0, 2.0, 3.0, 4.0)
+        self.assertEqual(list(vector), [9.0, 0.0, -6.0])
+        self.assertEqual(list(self.sparse @ [1.0, 2.0, 3.0, 4.0]), [9.0, 0.0, -6.0])
+
+    def test_size_checks(self):
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            self.sparse @ self.sparse
+        with self.assertRaises(Matrix.Exceptions.MatrixSizeError):
+            self.sparse + self.sparse.transposed()
+
+
+if __name__ == "__main__":
+    unittest.main()
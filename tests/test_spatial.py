@@ -0,0 +1,66 @@
+import unittest
+
+from PyMath.spatial import HashGrid, KDTree
+
+
+class SpatialIndexTests(object):
+    """Shared behaviour of every spatial index, mixed into a TestCase per index type"""
+
+    def make(self, positions=None):
+        raise NotImplementedError
+
+    def test_queries(self):
+        index = self.make([(0.0, 0.0), (1.0, 0.0), (5.0, 5.0), (0.5, 0.5)])
+        self.assertEqual(sorted(index.query_radius((0, 0), 1.0, True)), [0, 1, 3])
+        self.assertEqual(index.k_nearest((0, 0), 2, True), [0, 3])
+        self.assertEqual(index.k_nearest((4.0, 4.0), 1), [(5.0, 5.0)])
+        self.assertEqual(index.k_nearest((0, 0), 0), [])
+
+    def test_move_back_to_earlier_position(self):
+        index = self.make([(float(i), 10.0) for i in range(10)])
+        point = index.position(7)
+        index.move(7, (9.0, -9.0))
+        index.move(7, point)
+        self.assertEqual(index.query_radius(point, 0, True), [7])
+        self.assertEqual(index.k_nearest(point, 1, True), [7])
+
+    def test_remove_then_reinsert(self):
+        index = self.make([(float(i), 0.0) for i in range(10)])
+        point = index.position(4)
+        index.remove(4)
+        self.assertNotIn(4, index)
+        self.assertEqual(index.query_radius(point, 0, True), [])
+
+        index.insert(point, 4)
+        self.assertEqual(index.query_radius(point, 0, True), [4])
+        self.assertEqual(index.k_nearest(point, 1, True), [4])
+        self.assertEqual(len(index), 10)
+
+    def test_many_moves_match_brute_force(self):
+        index = self.make([(float(i % 7), float(i // 7)) for i in range(49)])
+        for step in range(200):
+            key = (step * 11) % 49
+            index.move(key, (float((step * 3) % 13), float((step * 5) % 11)))
+
+        center = (6.0, 5.0)
+        expected = sorted(key for key in range(49)
+                          if sum((a - b) ** 2 for a, b in zip(index.position(key), center)) <= 9.0)
+        self.assertEqual(sorted(index.query_radius(center, 3.0, True)), expected)
+        nearest = index.k_nearest(center, 5, True)
+        self.assertEqual(len(set(nearest)), 5)
+
+
+class HashGridTest(SpatialIndexTests, unittest.TestCase):
+
+    def make(self, positions=None):
+        return HashGrid(1.0, positions)
+
+
+class KDTreeTest(SpatialIndexTests, unittest.TestCase):
+
+    def make(self, positions=None):
+        return KDTree(positions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import copy
+import pickle
+import unittest
+
+from PyMath.vector import Vector2, Vector3, VectorPool
+from PyMath.vector_array import Vector2Array, Vector3Array
+
+
+class VectorPoolTest(unittest.TestCase):
+
+    def test_double_release_is_ignored(self):
+        pool = VectorPool()
+        with pool.frame():
+            vector = pool.acquire(1, 2, 3)
+            pool.release(vector)
+        self.assertEqual(len(pool), 1)
+        self.assertIsNot(pool.acquire(0, 0, 0), pool.acquire(0, 0, 0))
+
+
+class FrozenVectorTest(unittest.TestCase):
+
+    def test_constants_copy_and_pickle_as_themselves(self):
+        for constant in (Vector3.ONE, Vector3.UP, Vector2.ZERO):
+            self.assertIs(copy.copy(constant), constant)
+            self.assertIs(copy.deepcopy(constant), constant)
+            self.assertIs(pickle.loads(pickle.dumps(constant)), constant)
+
+
+
+class VectorArrayTest(unittest.TestCase):
+
+    def test_broadcast_operators(self):
+        batch = Vector2Array([Vector2(1, 2), Vector2(4, -8)])
+        self.assertEqual((batch + 1).tolist(), [(2.0, 3.0), (5.0, -7.0)])
+        self.assertEqual((batch * Vector2(2, 3)).tolist(), [(2.0, 6.0), (8.0, -24.0)])
+        self.assertEqual((Vector2(1, 1) - batch).tolist(), [(0.0, -1.0), (-3.0, 9.0)])
+        self.assertEqual((10 - batch).tolist(), [(9.0, 8.0), (6.0, 18.0)])
+        self.assertEqual((2 / batch).tolist(), [(2.0, 1.0), (0.5, -0.25)])
+        self.assertEqual((Vector2(4, 8) / batch).tolist(), [(4.0, 4.0), (1.0, -1.0)])
+        self.assertEqual((batch - batch).tolist(), [(0.0, 0.0), (0.0, 0.0)])
+        self.assertEqual(list(batch.dot(Vector2(1, 1))), [3.0, -4.0])
+        self.assertEqual(list(batch.cross(Vector2(1, 0))), [-2.0, 8.0])
+
+    def test_broadcast_operators_3d(self):
+        batch = Vector3Array([Vector3(1, 2, 4), Vector3(-1, 0, 2)])
+        self.assertEqual((Vector3(0, 0, 0) - batch).tolist(), (-batch).tolist())
+        self.assertEqual((1 / batch[:1]).tolist(), [(1.0, 0.5, 0.25)])
+        self.assertEqual(batch.cross(Vector3(0, 0, 1)).tolist(), [(2.0, -1.0, 0.0), (0.0, 1.0, 0.0)])
+        self.assertEqual(len(Vector3Array() - 1), 0)
+        with self.assertRaises(TypeError):
+            "a" - batch
+
+
+if __name__ == "__main__":
+    unittest.main()